@@ -102,6 +102,21 @@ class Actions:
 
 @ctx.action_class("user")
 class UserActions:
+    def move_cursor(direction: str, count: int, extend: bool = False):
+        # Word movement takes a prefix argument, so it can jump all at once
+        if not extend and count > 0 and direction == "word_left":
+            actions.user.emacs("backward-word", count)
+        elif not extend and count > 0 and direction == "word_right":
+            actions.user.emacs("forward-word", count)
+        else:
+            actions.next(direction, count, extend)
+
+    def movement_key(direction: str, extend: bool) -> str:
+        # Extending by words presses two keys when meta is esc, which can't be repeated
+        if direction in ("word_left", "word_right"):
+            return ""
+        return actions.next(direction, extend)
+
     def cut_line():
         actions.edit.line_start()
         actions.user.emacs("kill-line", 1)
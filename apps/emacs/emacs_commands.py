@@ -1,9 +1,10 @@
 import csv
-from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple, Optional
 
-from talon import Context, Module, actions, app, resource
+from talon import Context, Module, app, fs
+
+from ...core.create_spoken_forms import IncrementalSpokenForms
 
 mod = Module()
 mod.list("emacs_command", desc="Emacs commands")
@@ -18,25 +19,34 @@ class Command(NamedTuple):
     spoken: Optional[str] = None
 
 
-# Maps command name to Command.
-emacs_commands = {}
+# Maps command name to Command. Shared by the keybinding and short form lookups.
+emacs_commands: dict[str, Command] = {}
+
+# So a reload only needs to generate spoken forms for rows whose command name
+# is new
+spoken_forms = IncrementalSpokenForms(generate_subsequences=False)
+
+EMACS_COMMANDS_FILE = Path(__file__).parents[0] / "emacs_commands.csv"
+
+
+def lookup_command(command_name: str) -> Optional[Command]:
+    return emacs_commands.get(command_name)
 
 
 @mod.action_class
 class Actions:
     def emacs_command_keybinding(command_name: str) -> Optional[str]:
         "Looks up the keybinding for command_name in emacs_commands.csv."
-        return emacs_commands.get(command_name, Command(command_name)).keys
+        command = lookup_command(command_name)
+        return command.keys if command else None
 
     def emacs_command_short_form(command_name: str) -> Optional[str]:
         "Looks up the short form for command_name in emacs_commands.csv."
-        return emacs_commands.get(command_name, Command(command_name)).short
+        command = lookup_command(command_name)
+        return command.short if command else None
 
 
-def load_csv():
-    filepath = Path(__file__).parents[0] / "emacs_commands.csv"
-    with resource.open(filepath) as f:
-        rows = list(csv.reader(f))
+def parse_rows(rows: list[list[str]], filepath) -> list[Command]:
     # Check headers
     assert rows[0] == ["Command", " Key binding", " Short form", " Spoken form"]
 
@@ -53,24 +63,40 @@ def load_csv():
             [x.strip() or None for x in row] + [None, None, None]
         )[:4]
         commands.append(Command(name=name, keys=keys, short=short, spoken=spoken))
+    return commands
+
+
+def generate_command_list(names: list[str]) -> dict[str, str]:
+    """Generates spoken forms for names, reusing those already generated for unchanged rows"""
+    command_list, _ = spoken_forms.update(names)
+    # A copy, since the caller adds the spoken form overrides to it
+    return dict(command_list)
+
+
+def load_csv():
+    with open(EMACS_COMMANDS_FILE, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    commands = parse_rows(rows, EMACS_COMMANDS_FILE)
 
     # Update global command info.
     global emacs_commands
     emacs_commands = {c.name: c for c in commands}
 
     # Generate spoken forms and apply overrides.
-    try:
-        command_list = actions.user.create_spoken_forms_from_list(
-            [c.name for c in commands], generate_subsequences=False
-        )
-    except:
-        pass
-    else:
-        for c in commands:
-            if c.spoken:
-                command_list[c.spoken] = c.name
+    command_list = generate_command_list([c.name for c in commands])
+    for c in commands:
+        if c.spoken:
+            command_list[c.spoken] = c.name
     ctx.lists["self.emacs_command"] = command_list
 
 
-# TODO: register on change to file!
+def on_csv_change(name, flags):
+    if Path(name) != EMACS_COMMANDS_FILE:
+        return
+    load_csv()
+
+
+# Watched when the module loads, like homophones.csv, so that talon drops the
+# watch when it reloads this file instead of adding another one
+fs.watch(str(EMACS_COMMANDS_FILE.parent), on_csv_change)
 app.register("ready", load_csv)
@@ -1,5 +1,7 @@
 from talon import Context, Module, actions, app
 
+from ...core.settle import focused_element, settle_after
+
 ctx = Context()
 mod = Module()
 apps = mod.apps
@@ -49,8 +51,7 @@ class UserActions:
 class BrowserActions:
     def focus_page():
         actions.browser.focus_address()
-        actions.edit.find()
-        actions.sleep("180ms")
+        settle_after(actions.edit.find, focused_element, 0.18, fallback=0.18)
         actions.key("escape")
 
     def go_home():
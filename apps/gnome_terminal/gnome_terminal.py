@@ -23,6 +23,12 @@ class user_actions:
     def tab_jump(number):
         actions.key(f"alt-{number}")
 
+    def movement_key(direction: str, extend: bool) -> str:
+        # Extending is not possible, so leave it to the edit actions below
+        if extend:
+            return ""
+        return actions.next(direction, extend)
+
 
 @ctx.action_class("app")
 class app_actions:
@@ -0,0 +1,283 @@
+"""A minimal client for the i3 IPC protocol, which sway also speaks.
+
+Messages are the magic string "i3-ipc", the payload length and the message type
+as native-endian 32-bit integers, then the payload. Replies have the same
+format, and events are replies whose type has the high bit set. See
+https://i3wm.org/docs/ipc.html
+"""
+
+import json
+import logging
+import os
+import socket
+import struct
+import subprocess
+import threading
+from typing import Any, Callable, Optional
+
+MAGIC = b"i3-ipc"
+HEADER = struct.Struct("=6sII")
+
+RUN_COMMAND = 0
+GET_WORKSPACES = 1
+SUBSCRIBE = 2
+GET_OUTPUTS = 3
+GET_TREE = 4
+GET_VERSION = 7
+
+EVENT_FLAG = 1 << 31
+EVENT_NAMES = {
+    0: "workspace",
+    1: "output",
+    2: "mode",
+    3: "window",
+    4: "barconfig_update",
+    5: "binding",
+    6: "shutdown",
+    7: "tick",
+}
+
+# Called with the event name and its decoded payload
+EventListener = Callable[[str, Any], None]
+
+
+class I3Error(Exception):
+    pass
+
+
+class I3ConnectionLost(I3Error):
+    """i3 closed the connection after a request was sent, as it does when restarting"""
+
+
+def find_socket_path() -> str:
+    for variable in ("I3SOCK", "SWAYSOCK"):
+        path = os.environ.get(variable)
+        if path:
+            return path
+    for program in ("i3", "sway"):
+        try:
+            path = subprocess.check_output(
+                (program, "--get-socketpath"), stderr=subprocess.DEVNULL, timeout=2
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        path = path.decode().strip()
+        if path:
+            return path
+    raise I3Error("Couldn't find the i3 or sway IPC socket")
+
+
+def pack(msg_type: int, payload: str = "") -> bytes:
+    data = payload.encode("utf-8")
+    return HEADER.pack(MAGIC, len(data), msg_type) + data
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("i3 IPC socket closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_raw_message(sock: socket.socket) -> tuple[int, bytes]:
+    magic, length, msg_type = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    if magic != MAGIC:
+        raise I3Error(f"Unexpected data on i3 IPC socket: {magic!r}")
+    return msg_type, _recv_exactly(sock, length)
+
+
+def read_message(sock: socket.socket) -> tuple[int, Any]:
+    """Reads a reply or event, whose payloads are always JSON"""
+    msg_type, payload = read_raw_message(sock)
+    return msg_type, json.loads(payload)
+
+
+class I3Connection:
+    """
+    A persistent connection for requests. It is opened on first use and
+    reopened once if the window manager restarted since, so each request costs
+    one round-trip on a socket rather than starting an i3-msg process.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Callable[[], str]] = None,
+        timeout: float = 2.0,
+    ):
+        self.socket_path = socket_path or find_socket_path
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.lock = threading.Lock()
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+    def _close(self):
+        if self.sock is not None:
+            self.sock.close()
+        self.sock = None
+
+    def _connect(self) -> socket.socket:
+        if self.sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path())
+            except OSError as e:
+                sock.close()
+                raise I3Error(f"Couldn't connect to i3: {e}") from e
+            self.sock = sock
+        return self.sock
+
+    def request_many(self, requests: list[tuple[int, str]]) -> list[Any]:
+        """
+        Sends every request before reading any reply, then returns the replies
+        in order. i3 answers requests on one connection in the order received.
+        """
+        message = b"".join(pack(msg_type, payload) for msg_type, payload in requests)
+        with self.lock:
+            for attempt in range(2):
+                sock = self._connect()
+                try:
+                    sock.sendall(message)
+                    break
+                except (BrokenPipeError, ConnectionResetError) as e:
+                    # i3 drops every connection when it restarts. It can't
+                    # have read anything from a dropped connection, so sending
+                    # again won't run a command twice.
+                    self._close()
+                    if attempt == 1:
+                        raise I3Error(f"Lost connection to i3: {e}") from e
+                except OSError as e:
+                    self._close()
+                    raise I3Error(f"Couldn't send to i3: {e}") from e
+
+            try:
+                replies = []
+                while len(replies) < len(requests):
+                    msg_type, reply = read_message(sock)
+                    # Events only arrive on subscribed connections, but skip
+                    # any rather than mistake them for replies
+                    if not msg_type & EVENT_FLAG:
+                        replies.append(reply)
+                return replies
+            except ConnectionError as e:
+                # The commands may already have run, and some like restart or
+                # kill mustn't run twice, so don't retry
+                self._close()
+                raise I3ConnectionLost(f"Lost connection to i3: {e}") from e
+            except (OSError, ValueError) as e:
+                self._close()
+                raise I3Error(f"Couldn't read reply from i3: {e}") from e
+
+    def request(self, msg_type: int, payload: str = "") -> Any:
+        return self.request_many([(msg_type, payload)])[0]
+
+    def command(self, *commands: str) -> list[dict]:
+        """
+        Runs the commands in one message, the same as `i3-msg "a; b"`, and
+        raises I3Error if any of them failed.
+        """
+        results = self.request(RUN_COMMAND, "; ".join(commands))
+        errors = [r.get("error", "unknown error") for r in results if not r["success"]]
+        if errors:
+            raise I3Error(f"i3 command {'; '.join(commands)!r} failed: {errors}")
+        return results
+
+
+class I3EventSubscription:
+    """
+    Receives window manager events on a background thread, reconnecting and
+    subscribing again after the window manager restarts. Listeners are called on
+    that thread.
+    """
+
+    def __init__(
+        self,
+        events: list[str],
+        socket_path: Optional[Callable[[], str]] = None,
+        retry_interval: float = 1.0,
+    ):
+        self.events = events
+        self.socket_path = socket_path or find_socket_path
+        self.retry_interval = retry_interval
+        self.listeners: dict[str, list[EventListener]] = {}
+        self.sock: Optional[socket.socket] = None
+        self.thread: Optional[threading.Thread] = None
+        self.stopped = threading.Event()
+        self.subscribed = threading.Event()
+
+    def register(self, event: str, listener: EventListener):
+        self.listeners.setdefault(event, []).append(listener)
+
+    def unregister(self, event: str, listener: EventListener):
+        self.listeners[event].remove(listener)
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, name="i3-events", daemon=True)
+        # Lets stop_running_subscriptions find it after talon reloads the module
+        self.thread.i3_subscription = self
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.sock is not None:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def _run(self):
+        while not self.stopped.is_set():
+            try:
+                self._listen()
+            except (OSError, I3Error, ValueError) as e:
+                if not self.stopped.is_set():
+                    logging.debug(f"i3 event subscription lost: {e}")
+            finally:
+                self.subscribed.clear()
+                if self.sock is not None:
+                    self.sock.close()
+                    self.sock = None
+            self.stopped.wait(self.retry_interval)
+
+    def _listen(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path())
+        self.sock.sendall(pack(SUBSCRIBE, json.dumps(self.events)))
+        while not self.stopped.is_set():
+            msg_type, payload = read_message(self.sock)
+            if not msg_type & EVENT_FLAG:
+                if msg_type == SUBSCRIBE:
+                    if not payload.get("success"):
+                        raise I3Error(f"Couldn't subscribe to i3 events: {payload}")
+                    self.subscribed.set()
+                continue
+            name = EVENT_NAMES.get(msg_type & ~EVENT_FLAG)
+            for listener in list(self.listeners.get(name, [])):
+                try:
+                    listener(name, payload)
+                except Exception as e:
+                    logging.error(f"i3 {name} event listener failed: {e}")
+
+
+def stop_running_subscriptions():
+    """
+    Stops every running subscription, including ones started by a copy of the
+    module that talon has since reloaded, which nothing else refers to anymore.
+    """
+    for thread in threading.enumerate():
+        subscription = getattr(thread, "i3_subscription", None)
+        if subscription is not None:
+            subscription.stop()
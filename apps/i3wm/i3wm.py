@@ -1,7 +1,14 @@
-import subprocess
 from typing import Optional, Union
 
-from talon import Context, Module, actions, settings
+from talon import Context, Module, actions, cron, settings
+
+from .i3_ipc import (
+    EventListener,
+    I3Connection,
+    I3ConnectionLost,
+    I3EventSubscription,
+    stop_running_subscriptions,
+)
 
 mod = Module()
 ctx = Context()
@@ -24,45 +31,84 @@ ctx.matches = """
 tag: user.i3wm
 """
 
+# One connection for all commands, instead of starting i3-msg for each
+i3 = I3Connection()
+# Talon runs this file again when it changes without unloading the previous
+# copy, whose event thread and socket would otherwise stay open
+stop_running_subscriptions()
+i3_events = I3EventSubscription(["workspace", "window"])
+_listener_wrappers: dict[tuple[str, EventListener], EventListener] = {}
+
+
+def i3_command(*args: str):
+    """Runs one i3 command, with its arguments joined the same way i3-msg does"""
+    i3.command(" ".join(args))
+
+
+def register_event_listener(event: str, listener: EventListener):
+    """
+    Calls listener(event, payload) on talon's thread for each i3 "workspace" or
+    "window" event. The subscription starts when the first listener registers.
+    """
+
+    def on_event(name, payload):
+        cron.after("0ms", lambda: listener(name, payload))
+
+    _listener_wrappers[(event, listener)] = on_event
+    i3_events.register(event, on_event)
+    i3_events.start()
+
+
+def unregister_event_listener(event: str, listener: EventListener):
+    i3_events.unregister(event, _listener_wrappers.pop((event, listener)))
+
 
 @ctx.action_class("app")
 class AppActions:
     def window_close():
-        subprocess.check_call(("i3-msg", "kill"))
+        i3_command("kill")
 
 
 @mod.action_class
 class Actions:
+    def i3wm_command(command: str):
+        """Run i3 commands, separated by semicolons, in one round-trip"""
+        i3.command(command)
+
     def i3wm_mode(name: str):
         """Switch i3 mode"""
-        subprocess.check_call(("i3-msg", "mode", name))
+        i3_command("mode", name)
 
     def i3wm_reload():
         """Reload the i3 config"""
-        subprocess.check_call(("i3-msg", "reload"))
+        i3_command("reload")
 
     def i3wm_restart():
         """Restart the window manager"""
-        subprocess.check_call(("i3-msg", "restart"))
+        try:
+            i3_command("restart")
+        except I3ConnectionLost:
+            # i3 drops every connection as it restarts, usually before replying
+            pass
 
     def i3wm_layout(layout: Optional[str] = None):
         """Change to specified layout. Toggle split if unspecified."""
         if layout is None:
-            subprocess.check_call(("i3-msg", "layout", "toggle", "split"))
+            i3_command("layout", "toggle", "split")
         else:
-            subprocess.check_call(("i3-msg", "layout", layout))
+            i3_command("layout", layout)
 
     def i3wm_fullscreen():
         """Fullscreen the current container"""
-        subprocess.check_call(("i3-msg", "fullscreen"))
+        i3_command("fullscreen")
 
     def i3wm_split(direction: str):
         """Split the focused container"""
-        subprocess.check_call(("i3-msg", "split", direction))
+        i3_command("split", direction)
 
     def i3wm_float():
         """Toggle whether the focused container should float."""
-        subprocess.check_call(("i3-msg", "floating", "toggle"))
+        i3_command("floating", "toggle")
 
     def i3wm_launch():
         """Trigger the i3 launcher: ex rofi"""
@@ -76,41 +122,37 @@ class Actions:
 
     def i3wm_focus(what: str):
         """Move focus"""
-        subprocess.check_call(("i3-msg", "focus", what))
+        i3_command("focus", what)
 
     def i3wm_switch_to_workspace(which: Union[str, int]):
         """Focus the specified workspace"""
         if isinstance(which, int):
-            subprocess.check_call(("i3-msg", "workspace", "number", str(which)))
+            i3_command("workspace", "number", str(which))
         else:
-            subprocess.check_call(("i3-msg", "workspace", which))
+            i3_command("workspace", which)
 
     def i3wm_show_scratchpad():
         """Focus/cycle/hide the scratchpad"""
-        subprocess.check_call(("i3-msg", "scratchpad", "show"))
+        i3_command("scratchpad", "show")
 
     def i3wm_move(to: str):
         """Move the focused container"""
-        subprocess.check_call(("i3-msg", "move", to))
+        i3_command("move", to)
 
     def i3wm_move_to_workspace(which: Union[str, int]):
         """Move the focused container to the specified workspace"""
         if isinstance(which, int):
-            subprocess.check_call(
-                ("i3-msg", "move", "container", "to", "workspace", "number", str(which))
-            )
+            i3_command("move", "container", "to", "workspace", "number", str(which))
         else:
-            subprocess.check_call(
-                ("i3-msg", "move", "container", "to", "workspace", which)
-            )
+            i3_command("move", "container", "to", "workspace", which)
 
     def i3wm_move_to_output(which: str):
         """Move the focused container to the specified output."""
-        subprocess.check_call(("i3-msg", "move", "container", "to", "output", which))
+        i3_command("move", "container", "to", "output", which)
 
     def i3wm_move_position(where: str):
         """Move the focused container to the specified position."""
-        subprocess.check_call(("i3-msg", "move", "position", where))
+        i3_command("move", "position", where)
 
     def i3wm_lock():
         """Trigger the lock screen"""
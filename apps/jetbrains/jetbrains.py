@@ -1,7 +1,7 @@
+import logging
 import os
 import os.path
 import tempfile
-import time
 from pathlib import Path
 
 import requests
@@ -59,55 +59,129 @@ port_mapping = {
 }
 
 
-def _get_nonce(port, file_prefix):
+# Nonces are cached per port along with the file they came from and its
+# modification time, so that we only re-read the file when the IDE rewrites it.
+_nonce_cache: dict[int, tuple[str, float, str]] = {}
+
+# One keep-alive session per port, so consecutive commands reuse the connection.
+_sessions: dict[int, requests.Session] = {}
+
+_NONCE_PREFIXES = (".vcidea_", "vcidea_")
+
+
+def _nonce_paths(port, file_prefix):
     file_name = file_prefix + str(port)
-    try:
-        with open(os.path.join(tempfile.gettempdir(), file_name)) as fh:
-            return fh.read()
-    except FileNotFoundError as e:
+    return (
+        os.path.join(tempfile.gettempdir(), file_name),
+        os.path.join(str(Path.home()), file_name),
+    )
+
+
+def _read_nonce(port, file_prefix):
+    for path in _nonce_paths(port, file_prefix):
         try:
-            home = str(Path.home())
-            with open(os.path.join(home, file_name)) as fh:
-                return fh.read()
-        except FileNotFoundError as eb:
-            print(f"Could not find {file_name} in tmp or home")
+            mtime = os.stat(path).st_mtime
+            with open(path) as fh:
+                return path, mtime, fh.read()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logging.error(f"Could not read {path}: {e}")
             return None
-    except OSError as e:
-        print(e)
-        return None
+    return None
 
 
-def send_idea_command(cmd):
-    print(f"Sending {cmd}")
+def _get_nonce(port):
+    cached = _nonce_cache.get(port)
+    if cached is not None:
+        path, mtime, nonce = cached
+        try:
+            if os.stat(path).st_mtime == mtime:
+                return nonce
+        except OSError:
+            pass
+        del _nonce_cache[port]
+
+    for file_prefix in _NONCE_PREFIXES:
+        result = _read_nonce(port, file_prefix)
+        if result is not None:
+            _nonce_cache[port] = result
+            return result[2]
+
+    logging.warning(f"Could not find nonce for port {port} in tmp or home")
+    return None
+
+
+def _invalidate_nonce(port):
+    _nonce_cache.pop(port, None)
+
+
+def _get_session(port):
+    session = _sessions.get(port)
+    if session is None:
+        session = requests.Session()
+        # don't route localhost traffic through any configured proxy
+        session.trust_env = False
+        session.proxies = {"http": None, "https": None}
+        _sessions[port] = session
+    return session
+
+
+def _get_port():
     active_app = ui.active_app()
     bundle = active_app.bundle or active_app.name
-    port = port_mapping.get(bundle, None)
-    nonce = _get_nonce(port, ".vcidea_") or _get_nonce(port, "vcidea_")
-    proxies = {"http": None, "https": None}
-    print(f"sending {bundle} {port} {nonce}")
-    if port and nonce:
-        response = requests.get(
-            f"http://localhost:{port}/{nonce}/{cmd}",
-            proxies=proxies,
+    return port_mapping.get(bundle, None)
+
+
+def send_idea_command_to_port(port, cmd, host="localhost"):
+    """Sends a single command to the IDE listening on the given port, reusing its session"""
+    if not port:
+        return None
+
+    for attempt in range(2):
+        nonce = _get_nonce(port)
+        if not nonce:
+            return None
+
+        logging.debug(f"Sending {cmd} to port {port}")
+        response = _get_session(port).get(
+            f"http://{host}:{port}/{nonce}/{cmd}",
             timeout=(0.05, 3.05),
         )
+        # the IDE regenerates its nonce when restarted, so a stale cached
+        # nonce gets rejected; re-read it from disk and try once more
+        if response.status_code in (401, 403) and attempt == 0:
+            _invalidate_nonce(port)
+            continue
+
         response.raise_for_status()
         return response.text
 
 
+def send_idea_commands_to_port(port, commands, host="localhost"):
+    """Sends commands in order over one connection, each waiting only for the previous response"""
+    return [send_idea_command_to_port(port, cmd, host) for cmd in commands]
+
+
+def send_idea_command(cmd):
+    # The command may move the cursor or change the selection without sending keys
+    actions.user.selected_text_invalidate()
+    return send_idea_command_to_port(_get_port(), cmd)
+
+
 def get_idea_location():
     return send_idea_command("location").split()
 
 
 def idea_commands(commands):
     command_list = commands.split(",")
-    print("executing jetbrains", commands)
+    logging.debug(f"executing jetbrains {commands}")
     global extendCommands
     extendCommands = command_list
-    for cmd in command_list:
-        if cmd:
-            send_idea_command(cmd.strip())
-            time.sleep(0.1)
+    actions.user.selected_text_invalidate()
+    send_idea_commands_to_port(
+        _get_port(), [cmd.strip() for cmd in command_list if cmd]
+    )
 
 
 ctx = Context()
@@ -291,6 +365,12 @@ class UserActions:
     def extend_until_line(line: int):
         actions.user.idea(f"extend {line}")
 
+    def movement_key(direction: str, extend: bool) -> str:
+        # Extending by words uses the IDE actions in EditActions
+        if extend and direction in ("word_left", "word_right"):
+            return ""
+        return actions.next(direction, extend)
+
     def select_range(line_start: int, line_end: int):
         # if it's a single line, select the entire thing including the ending new-line5
         if line_start == line_end:
@@ -11,12 +11,10 @@ app: opera
 @ctx.action_class("user")
 class UserActions:
     def tab_duplicate():
-        actions.browser.focus_address()
-        actions.sleep("180ms")
+        actions.user.browser_focus_address_settled()
         possibly_edited_url = actions.edit.selected_text()
         actions.key("esc:2")
-        actions.browser.focus_address()
-        actions.sleep("180ms")
+        actions.user.browser_focus_address_settled()
         url_address = actions.edit.selected_text()
         actions.user.paste(possibly_edited_url)
         actions.app.tab_open()
@@ -79,7 +79,6 @@ class BrowserActions:
         actions.browser.go("vivaldi://downloads")
 
     def go(url: str):
-        actions.browser.focus_address()
-        actions.sleep("150ms")
+        actions.user.browser_focus_address_settled(0.15)
         actions.insert(url)
         actions.key("enter")
@@ -9,6 +9,8 @@ from uuid import uuid4
 
 from talon import Context, Module, actions, speech_system
 
+from ....core.latency_trace import tracer
+
 # How old a request file needs to be before we declare it stale and are willing
 # to remove it
 STALE_TIMEOUT_MS = 60_000
@@ -113,6 +115,7 @@ def handle_existing_request_file(path):
     robust_unlink(path)
 
 
+@tracer.traced("command server rpc")
 def run_command(
     command_id: str,
     *args,
@@ -138,6 +141,9 @@ def run_command(
     # variable argument lists
     args = [x for x in args if x is not NotSet]
 
+    # The command may move the cursor or change the selection without sending keys
+    actions.user.selected_text_invalidate()
+
     communication_dir_path = get_communication_dir_path()
 
     if not communication_dir_path.exists():
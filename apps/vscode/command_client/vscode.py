@@ -2,7 +2,12 @@ from typing import Any
 
 from talon import Context, Module, actions
 
-from .command_client import NoFileServerException, NotSet, run_command
+from .command_client import (
+    NoFileServerException,
+    NotSet,
+    get_communication_dir_path,
+    run_command,
+)
 
 mod = Module()
 
@@ -38,6 +43,26 @@ class VsCodeAction:
     def command_server_directory() -> str:
         return "vscode-command-server"
 
+    def move_cursor(direction: str, count: int, extend: bool = False):
+        # cursorMove jumps by any number of characters or lines in one command
+        unit = {
+            "left": "character",
+            "right": "character",
+            "up": "wrappedLine",
+            "down": "wrappedLine",
+        }.get(direction)
+        # Without the command server, run_command refuses commands with
+        # arguments, so fall back to key presses
+        if unit is None or count <= 0 or not get_communication_dir_path().exists():
+            actions.next(direction, count, extend)
+            return
+        # Wait, so keys sent afterwards can't arrive before the cursor moved
+        run_command(
+            "cursorMove",
+            {"to": direction, "by": unit, "value": count, "select": extend},
+            wait_for_finish=True,
+        )
+
 
 @mod.action_class
 class Actions:
@@ -8,6 +8,7 @@ from talon import Module, actions
 
 from .abbreviate.abbreviate import abbreviations_list
 from .file_extension.file_extension import file_extensions
+from .instrumentation import span
 from .keys.keys import symbol_key_words
 from .numbers.numbers import digits_map, scales, teens, tens
 
@@ -432,6 +433,47 @@ class SpeakableItem:
     value: Any
 
 
+class IncrementalSpokenForms:
+    """
+    Creates spoken forms for a list of sources that changes over time, only
+    generating spoken forms for sources that weren't present in the previous
+    update. Conflict resolution matches create_spoken_forms_from_list.
+    """
+
+    def __init__(self, generate_subsequences: bool = True):
+        self.generate_subsequences = generate_subsequences
+        self.spoken_forms: dict[str, list[str]] = {}
+        self.result: dict[str, str] = {}
+
+    def update(self, sources) -> tuple[dict[str, str], bool]:
+        """Returns the spoken form list and whether it changed since the last update"""
+        sources = list(dict.fromkeys(sources))
+        if sources == list(self.spoken_forms):
+            return self.result, False
+
+        previous = self.spoken_forms
+        with span("IncrementalSpokenForms.update", f"{len(sources)} sources"):
+            self.spoken_forms = {
+                source: previous[source]
+                if source in previous
+                else actions.user.create_spoken_forms(
+                    source, generate_subsequences=self.generate_subsequences
+                )
+                for source in sources
+            }
+
+        # When several sources share a spoken form the shortest source wins,
+        # or the first one in case of a tie
+        result = {}
+        for source, spoken_forms in self.spoken_forms.items():
+            for spoken_form in spoken_forms:
+                existing = result.get(spoken_form)
+                if existing is None or len(source) < len(existing):
+                    result[spoken_form] = source
+        self.result = result
+        return result, True
+
+
 @mod.action_class
 class Actions:
     def create_spoken_forms(
@@ -490,23 +532,24 @@ class Actions:
         generate_subsequences: bool = True,
     ) -> dict[str, Any]:
         """Create spoken forms for all sources in a map, doing conflict resolution"""
-        all_spoken_forms: defaultdict[str, list[SpeakableItem]] = defaultdict(list)
+        with span("create_spoken_forms_from_map", f"{len(sources)} sources"):
+            all_spoken_forms: defaultdict[str, list[SpeakableItem]] = defaultdict(list)
 
-        for name, value in sources.items():
-            spoken_forms = actions.user.create_spoken_forms(
-                name, words_to_exclude, minimum_term_length, generate_subsequences
-            )
-            for spoken_form in spoken_forms:
-                all_spoken_forms[spoken_form].append(SpeakableItem(name, value))
-
-        final_spoken_forms = {}
-        for spoken_form, spoken_form_sources in all_spoken_forms.items():
-            if len(spoken_form_sources) > 1:
-                final_spoken_forms[spoken_form] = min(
-                    spoken_form_sources,
-                    key=lambda speakable_item: len(speakable_item.name),
-                ).value
-            else:
-                final_spoken_forms[spoken_form] = spoken_form_sources[0].value
+            for name, value in sources.items():
+                spoken_forms = actions.user.create_spoken_forms(
+                    name, words_to_exclude, minimum_term_length, generate_subsequences
+                )
+                for spoken_form in spoken_forms:
+                    all_spoken_forms[spoken_form].append(SpeakableItem(name, value))
+
+            final_spoken_forms = {}
+            for spoken_form, spoken_form_sources in all_spoken_forms.items():
+                if len(spoken_form_sources) > 1:
+                    final_spoken_forms[spoken_form] = min(
+                        spoken_form_sources,
+                        key=lambda speakable_item: len(speakable_item.name),
+                    ).value
+                else:
+                    final_spoken_forms[spoken_form] = spoken_form_sources[0].value
 
         return final_spoken_forms
@@ -1,4 +1,6 @@
-from talon import Context, Module, actions, clip
+from talon import Context, Module, actions
+
+from .selected_text import get_selected_text, paste_preserving_clipboard
 
 ctx = Context()
 mod = Module()
@@ -9,12 +11,7 @@ END_OF_WORD_SYMBOLS = ".!?;:—_/\\|@#$%^&*()[]{}<>=+-~`"
 @ctx.action_class("edit")
 class EditActions:
     def selected_text() -> str:
-        with clip.capture() as s:
-            actions.edit.copy()
-        try:
-            return s.text()
-        except clip.NoChange:
-            return ""
+        return get_selected_text()
 
     def line_insert_down():
         actions.edit.line_end()
@@ -72,12 +69,7 @@ class EditActions:
 class Actions:
     def paste(text: str):
         """Pastes text and preserves clipboard"""
-
-        with clip.revert():
-            clip.set_text(text)
-            actions.edit.paste()
-            # sleep here so that clip.revert doesn't revert the clipboard too soon
-            actions.sleep("150ms")
+        paste_preserving_clipboard(text)
 
     def delete_right():
         """Delete character to the right"""
@@ -85,13 +77,11 @@ class Actions:
 
     def words_left(n: int):
         """Moves left by n words."""
-        for _ in range(n):
-            actions.edit.word_left()
+        actions.user.move_cursor("word_left", n)
 
     def words_right(n: int):
         """Moves right by n words."""
-        for _ in range(n):
-            actions.edit.word_right()
+        actions.user.move_cursor("word_right", n)
 
     def cut_word():
         """Cut word under cursor"""
@@ -189,3 +189,17 @@ class EditActions:
 
     def zoom_reset():
         actions.key("ctrl-0")
+
+
+@ctx.action_class("user")
+class UserActions:
+    def movement_key(direction: str, extend: bool) -> str:
+        key = {
+            "left": "left",
+            "right": "right",
+            "up": "up",
+            "down": "down",
+            "word_left": "ctrl-left",
+            "word_right": "ctrl-right",
+        }[direction]
+        return f"shift-{key}" if extend else key
@@ -192,3 +192,17 @@ class EditActions:
 
     def zoom_reset():
         actions.key("cmd-0")
+
+
+@ctx.action_class("user")
+class UserActions:
+    def movement_key(direction: str, extend: bool) -> str:
+        key = {
+            "left": "left",
+            "right": "right",
+            "up": "up",
+            "down": "down",
+            "word_left": "alt-left",
+            "word_right": "alt-right",
+        }[direction]
+        return f"shift-{key}" if extend else key
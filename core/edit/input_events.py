@@ -0,0 +1,60 @@
+from typing import Callable
+
+from talon import Context, Module, actions
+
+mod = Module()
+ctx = Context()
+
+paste_to_insert_threshold_setting = mod.setting(
+    "paste_to_insert_threshold",
+    type=int,
+    default=-1,
+    desc="""Use paste to insert text longer than this many characters.
+Zero means always paste; -1 means never paste.
+""",
+)
+
+# Called with the kind of input ("key", "insert", "mouse_click" or "external")
+# and its value, just before talon sends it. "external" means something other
+# than input, such as an editor RPC command, may have moved the cursor. Modules
+# that cache what they know about the text around the cursor listen here.
+InputListener = Callable[[str, str], None]
+
+listeners: list[InputListener] = []
+
+
+def register(listener: InputListener):
+    listeners.append(listener)
+
+
+def unregister(listener: InputListener):
+    listeners.remove(listener)
+
+
+def notify(kind: str, value: str = ""):
+    for listener in listeners:
+        listener(kind, value)
+
+
+# These are the only global overrides of main.key, main.insert and
+# main.mouse_click. Talon chooses between global contexts overriding the same
+# action by load order, so anything else that needs to change these actions
+# for every app belongs here, after the listeners are notified, rather than in
+# a context of its own. App contexts still override them as usual.
+@ctx.action_class("main")
+class MainActions:
+    def key(key: str):
+        notify("key", key)
+        actions.next(key)
+
+    def insert(text: str):
+        notify("insert", text)
+        threshold = paste_to_insert_threshold_setting.get()
+        if 0 <= threshold < len(text):
+            actions.user.paste(text)
+            return
+        actions.next(text)
+
+    def mouse_click(button: int = 0):
+        notify("mouse_click", str(button))
+        actions.next(button)
@@ -0,0 +1,31 @@
+from talon import Module, actions
+
+mod = Module()
+
+DIRECTIONS = ("left", "right", "up", "down", "word_left", "word_right")
+
+
+@mod.action_class
+class Actions:
+    def move_cursor(direction: str, count: int, extend: bool = False):
+        """Moves the cursor count steps in direction (one of left, right, up, down, word_left or word_right), extending the selection if extend is true.
+
+        When the step has a plain key it is sent once with a repeat count, e.g. "shift-left:37", rather than one action per step. Editors with a native way to jump can override this."""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown cursor direction: {direction}")
+        if count <= 0:
+            return
+        key = actions.user.movement_key(direction, extend)
+        if key:
+            actions.key(f"{key}:{count}")
+            return
+
+        step = getattr(actions.edit, f"extend_{direction}" if extend else direction)
+        for _ in range(count):
+            step()
+
+    def movement_key(direction: str, extend: bool) -> str:
+        """Returns the key that moves the cursor one step in direction, as used by user.move_cursor, or an empty string if the edit action for that step must be called instead.
+
+        Contexts that override one of the edit movement actions, e.g. edit.extend_word_left, must also override this to return an empty string for that step, or the override is bypassed."""
+        return ""
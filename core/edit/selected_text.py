@@ -0,0 +1,94 @@
+from typing import Optional
+
+from talon import Module, actions, app, clip, speech_system, ui
+
+from ..latency_trace import tracer
+from . import input_events
+from .selection_cache import SelectionCache
+
+mod = Module()
+
+setting_selected_text_accessibility = mod.setting(
+    "selected_text_accessibility",
+    type=bool,
+    default=False,
+    desc="Read the selected text through the accessibility API before copying it. Enable it in app contexts where this returns the right text.",
+)
+setting_paste_revert_delay = mod.setting(
+    "paste_revert_delay",
+    type=int,
+    default=150,
+    desc="Milliseconds to wait after pasting before restoring the previous clipboard contents. This is a fixed delay: there's no way to detect when the application has read the clipboard, so raise it for apps that paste the previous contents instead.",
+)
+
+
+def _editor_selected_text() -> Optional[str]:
+    return actions.user.selected_text_from_editor()
+
+
+def _accessibility_selected_text() -> Optional[str]:
+    if not setting_selected_text_accessibility.get():
+        return None
+    try:
+        element = ui.focused_element()
+        if app.platform == "mac":
+            text = element.AXSelectedText
+        elif app.platform == "windows":
+            text = "".join(r.text for r in element.text_pattern.selection)
+        else:
+            return None
+    except Exception:
+        return None
+    # Many elements report no selection rather than failing when they don't
+    # support reading it, so only trust a selection that isn't empty
+    return text or None
+
+
+@tracer.traced("clipboard copy")
+def _clipboard_selected_text() -> str:
+    with clip.capture() as s:
+        actions.edit.copy()
+    try:
+        return s.text()
+    except clip.NoChange:
+        return ""
+
+
+selection = SelectionCache(
+    [_editor_selected_text, _accessibility_selected_text], _clipboard_selected_text
+)
+
+
+def get_selected_text() -> str:
+    return selection.get()
+
+
+@tracer.traced("clipboard paste")
+def paste_preserving_clipboard(text: str):
+    if clip.text() == text:
+        actions.edit.paste()
+        return
+
+    with clip.revert():
+        clip.set_text(text)
+        actions.edit.paste()
+        # There's no way to tell when the application has read the clipboard,
+        # so give it time before clip.revert restores the previous contents
+        actions.sleep(f"{setting_paste_revert_delay.get()}ms")
+
+
+@mod.action_class
+class Actions:
+    def selected_text_invalidate():
+        """Forget the cached selected text and anything else known about the text around the cursor. Call this after changing the selection or moving the cursor without sending keys through talon, e.g. through an editor RPC command"""
+        input_events.notify("external")
+
+    def selected_text_from_editor() -> Optional[str]:
+        """Returns the selected text read through the active editor's RPC channel, or None if it can't. Editors with a command that returns the selection override this to spare edit.selected_text a clipboard round-trip."""
+        return None
+
+
+input_events.register(lambda kind, value: selection.invalidate())
+speech_system.register("pre:phrase", lambda _: selection.invalidate())
+for event in ("win_focus", "app_activate", "element_focus"):
+    ui.register(event, lambda _: selection.invalidate())
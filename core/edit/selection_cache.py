@@ -0,0 +1,56 @@
+import time
+from typing import Callable, Optional
+
+# A strategy returns the selected text, or None if it couldn't tell, in which
+# case the next strategy is tried
+SelectionStrategy = Callable[[], Optional[str]]
+
+
+class SelectionCache:
+    """
+    Reads the selected text with the first strategy that can tell, falling back
+    to copying it, and reuses the result for up to ttl seconds. Call invalidate()
+    whenever something may have changed the selection, such as talon sending a
+    key press, a focus change or the start of a new phrase.
+    """
+
+    def __init__(
+        self,
+        strategies: list[SelectionStrategy],
+        fallback: Callable[[], str],
+        ttl: float = 0.5,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.strategies = strategies
+        self.fallback = fallback
+        self.ttl = ttl
+        self.clock = clock
+        # Bumped by invalidate(). A cached selection is only reused within one
+        # generation.
+        self.generation = 0
+        self.cached: Optional[tuple[int, float, str]] = None
+
+    def invalidate(self):
+        self.generation += 1
+        self.cached = None
+
+    def get(self) -> str:
+        if (
+            self.cached is not None
+            and self.cached[0] == self.generation
+            and self.clock() - self.cached[1] < self.ttl
+        ):
+            return self.cached[2]
+
+        text = None
+        for strategy in self.strategies:
+            text = strategy()
+            if text is not None:
+                break
+        if text is None:
+            text = self.fallback()
+
+        # Stamp the generation after reading, since copying the selection sends
+        # a key press through talon, which invalidates the cache itself
+        self.cached = (self.generation, self.clock(), text)
+        return text
@@ -3,6 +3,8 @@ import subprocess
 
 from talon import Context, Module, app
 
+from .system_command import process_manager
+
 # path to community/knausj root directory
 REPO_DIR = os.path.dirname(os.path.dirname(__file__))
 SETTINGS_DIR = os.path.join(REPO_DIR, "settings")
@@ -73,8 +75,9 @@ class LinuxActions:
 # Helper for linux and mac.
 def open_with_subprocess(path, args):
     """Tries to open a file using the given subprocess arguments."""
+    handle = process_manager.run_blocking(args, timeout=0.5, capture_output=False)
     try:
-        return subprocess.run(args, timeout=0.5, check=True)
+        handle.check()
     except subprocess.TimeoutExpired:
         app.notify(f"Timeout trying to open file for editing: {path}")
         raise
@@ -1,12 +1,13 @@
 import itertools
 import math
-import re
 from collections import defaultdict
 from itertools import islice
 from typing import Iterable
 
 from talon import Context, Module, actions, imgui, registry
 
+from .help_index import refresh_rule_word_map
+
 mod = Module()
 mod.list("help_contexts", desc="list of available contexts")
 mod.tag("help_open", "tag for commands that are available only when help is visible")
@@ -433,18 +434,6 @@ def refresh_context_command_map(enabled_only=False):
     update_active_contexts_cache(active_contexts)
 
 
-def refresh_rule_word_map(context_command_map):
-    rule_word_map = defaultdict(set)
-
-    for context_name, commands in context_command_map.items():
-        for rule in commands:
-            tokens = {token for token in re.split(r"\W+", rule) if token.isalpha()}
-            for token in tokens:
-                rule_word_map[token].add((context_name, rule))
-
-    return rule_word_map
-
-
 events_registered = False
 
 
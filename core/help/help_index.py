@@ -0,0 +1,14 @@
+import re
+from collections import defaultdict
+
+
+def refresh_rule_word_map(context_command_map):
+    rule_word_map = defaultdict(set)
+
+    for context_name, commands in context_command_map.items():
+        for rule in commands:
+            tokens = {token for token in re.split(r"\W+", rule) if token.isalpha()}
+            for token in tokens:
+                rule_word_map[token].add((context_name, rule))
+
+    return rule_word_map
@@ -0,0 +1,24 @@
+from contextlib import contextmanager
+
+from .latency_trace import NO_SPAN, tracer
+from .load_profiler import profiler
+
+
+def span(kind: str, label: str = ""):
+    """
+    Records kind with the load profiler and the latency tracer, whichever are
+    on. While both are off this is the shared no-op context.
+    """
+    if profiler.enabled:
+        if tracer.enabled:
+            return _both(kind, label)
+        return profiler.span(kind, label)
+    if tracer.enabled:
+        return tracer.span(kind)
+    return NO_SPAN
+
+
+@contextmanager
+def _both(kind: str, label: str):
+    with profiler.span(kind, label), tracer.span(kind):
+        yield
@@ -0,0 +1,147 @@
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Name of the span covering a whole phrase, from pre:phrase to post:phrase
+PHRASE = "phrase"
+
+# Returned by LatencyTracer.span while the tracer is off
+NO_SPAN = nullcontext()
+
+
+@dataclass
+class TraceSpan:
+    name: str
+    # perf_counter() seconds
+    start: float
+    end: float = 0.0
+    # How many spans this one is nested in
+    depth: int = 0
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class PhraseTrace:
+    text: str
+    start: float
+    end: Optional[float] = None
+    spans: list[TraceSpan] = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+
+class LatencyTracer:
+    """
+    Records how long phrases and the traced steps within them take. Spans are
+    kept in a ring buffer of max_spans for the percentiles, and the last
+    max_phrases phrases keep their own spans for the timeline. Spans from
+    other threads, such as list updates from file watchers, only count towards
+    the percentiles, and each thread tracks its own nesting depth.
+    """
+
+    def __init__(self, max_spans: int = 5000, max_phrases: int = 20):
+        self.enabled = False
+        self.spans: deque[TraceSpan] = deque(maxlen=max_spans)
+        self.phrases: deque[PhraseTrace] = deque(maxlen=max_phrases)
+        self.current: Optional[PhraseTrace] = None
+        # threading.get_ident() of the thread that began the current phrase
+        self.phrase_thread: Optional[int] = None
+        self.local = threading.local()
+
+    def resize(self, max_spans: int, max_phrases: int):
+        if self.spans.maxlen != max_spans:
+            self.spans = deque(self.spans, maxlen=max_spans)
+        if self.phrases.maxlen != max_phrases:
+            self.phrases = deque(self.phrases, maxlen=max_phrases)
+
+    def clear(self):
+        self.spans.clear()
+        self.phrases.clear()
+
+    def begin_phrase(self, text: str):
+        if not self.enabled:
+            self.current = None
+            return
+        self.current = PhraseTrace(text, time.perf_counter())
+        self.phrase_thread = threading.get_ident()
+        self.phrases.append(self.current)
+        self.local.depth = 0
+
+    def end_phrase(self):
+        phrase = self.current
+        if phrase is None:
+            return
+        self.current = None
+        self.phrase_thread = None
+        phrase.end = time.perf_counter()
+        self.spans.append(TraceSpan(PHRASE, phrase.start, phrase.end))
+
+    def span(self, name: str):
+        if not self.enabled:
+            return NO_SPAN
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str):
+        depth = getattr(self.local, "depth", 0)
+        span = TraceSpan(name, time.perf_counter(), depth=depth)
+        self.local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self.local.depth = depth
+            span.end = time.perf_counter()
+            self.spans.append(span)
+            phrase = self.current
+            if phrase is not None and self.phrase_thread == threading.get_ident():
+                phrase.spans.append(span)
+
+    def traced(self, name: str):
+        """Decorator recording a span named <name> for each call"""
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self._span(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def percentiles(self) -> dict[str, dict[str, float]]:
+        """The count and p50, p95 and p99 seconds of every span name in the ring buffer, slowest p95 first"""
+        durations: dict[str, list[float]] = {}
+        for span in self.spans:
+            durations.setdefault(span.name, []).append(span.seconds)
+
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            result[name] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+            }
+        return dict(sorted(result.items(), key=lambda item: -item[1]["p95"]))
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of a non-empty sorted list"""
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+tracer = LatencyTracer()
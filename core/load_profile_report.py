@@ -0,0 +1,40 @@
+import logging
+
+from talon import Module, actions, app, registry
+
+from .load_profiler import ENABLE_VARIABLE, format_report, profiler
+from .user_settings import SETTINGS_DIR
+
+mod = Module()
+
+REPORT_PATH = SETTINGS_DIR / "load_profile.json"
+
+
+def record_registry_lists():
+    # Talon keeps one version of a list per context that assigns it
+    profiler.record_lists(
+        {name: max(maps, key=len, default={}) for name, maps in registry.lists.items()}
+    )
+
+
+@mod.action_class
+class Actions:
+    def load_profile_report():
+        """Logs how long modules took to load and writes the details to settings/load_profile.json. Only records anything when talon was started with TALON_LOAD_PROFILE set."""
+        if not profiler.enabled:
+            logging.info(
+                f"Set {ENABLE_VARIABLE}=1 before starting talon to record load times"
+            )
+            return
+        record_registry_lists()
+        report = profiler.report()
+        profiler.write_report(REPORT_PATH, report)
+        logging.info(f"{format_report(report)}\nFull report in {REPORT_PATH}")
+
+
+def on_ready():
+    if profiler.enabled:
+        actions.user.load_profile_report()
+
+
+app.register("ready", on_ready)
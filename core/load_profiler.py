@@ -0,0 +1,310 @@
+import argparse
+import functools
+import importlib
+import importlib.abc
+import json
+import os
+import sys
+import time
+import types
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Mapping, Optional, Sized
+
+ROOT = Path(__file__).parents[1]
+PACKAGES = ["core", "lang", "apps", "plugin", "tags"]
+
+# Returned by LoadProfiler.span while the profiler is off, so instrumented code
+# only pays for a method call
+NO_SPAN = nullcontext()
+
+# Set this environment variable before starting talon to record how long each
+# module takes to load. Only modules loaded after this one are covered, which
+# is most of them since everything reading a CSV setting imports it first.
+ENABLE_VARIABLE = "TALON_LOAD_PROFILE"
+
+
+@dataclass
+class Span:
+    kind: str
+    label: str
+    # The module being imported when the span ran, if any
+    module: Optional[str]
+    seconds: float
+
+
+class LoadProfiler:
+    """
+    Records how long each module in this repository takes to import, and how
+    long known expensive steps such as reading CSV lists take within them.
+    Imports are timed by wrapping the loader of every module under root.
+    """
+
+    def __init__(self, root: Path = ROOT):
+        self.root = root.resolve()
+        self.enabled = False
+        self.finder = TimingFinder(self)
+        # Module name to [seconds including nested imports, seconds excluding them, times loaded]
+        self.imports: dict[str, list] = {}
+        self.spans: list[Span] = []
+        self.list_sizes: dict[str, int] = {}
+        # [module name, seconds spent in nested imports] of the imports in progress
+        self.stack: list[list] = []
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            # Talon reloading this module leaves the previous copy's finder
+            # behind, which would time every import again. Match on the name,
+            # since each copy of the module has its own TimingFinder class.
+            sys.meta_path[:] = [
+                finder
+                for finder in sys.meta_path
+                if type(finder).__name__ != TimingFinder.__name__
+            ]
+            sys.meta_path.insert(0, self.finder)
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            if self.finder in sys.meta_path:
+                sys.meta_path.remove(self.finder)
+
+    def module_name(self, path: str) -> Optional[str]:
+        """The name of the module at path relative to root, eg core.user_settings"""
+        try:
+            relative = Path(path).resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        parts = relative.with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join(parts)
+
+    @contextmanager
+    def importing(self, name: str):
+        self.stack.append([name, 0.0])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _, nested = self.stack.pop()
+            if self.stack:
+                self.stack[-1][1] += seconds
+            record = self.imports.setdefault(name, [0.0, 0.0, 0])
+            record[0] += seconds
+            record[1] += seconds - nested
+            record[2] += 1
+
+    def span(self, kind: str, label: str = ""):
+        if not self.enabled:
+            return NO_SPAN
+        return self._span(kind, label)
+
+    @contextmanager
+    def _span(self, kind: str, label: str):
+        module = self.stack[-1][0] if self.stack else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.spans.append(Span(kind, label, module, seconds))
+
+    def timed(self, kind: str):
+        """Decorator recording a span for each call, labelled with the first argument"""
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                label = str(args[0]) if args else ""
+                with self._span(kind, label):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record_lists(self, lists: Mapping[str, Sized]):
+        for name, values in lists.items():
+            self.list_sizes[name] = len(values)
+
+    def report(self) -> dict:
+        """Everything recorded so far, each part sorted with the slowest or largest first"""
+        modules = [
+            {
+                "module": name,
+                "seconds": total,
+                "self_seconds": own,
+                "loads": loads,
+            }
+            for name, (total, own, loads) in self.imports.items()
+        ]
+        modules.sort(key=lambda module: module["self_seconds"], reverse=True)
+
+        kinds = defaultdict(lambda: {"calls": 0, "seconds": 0.0})
+        for span in self.spans:
+            kinds[span.kind]["calls"] += 1
+            kinds[span.kind]["seconds"] += span.seconds
+
+        return {
+            "seconds": sum(own for _, own, _ in self.imports.values()),
+            "modules": modules,
+            "kinds": dict(
+                sorted(kinds.items(), key=lambda kind: kind[1]["seconds"], reverse=True)
+            ),
+            "spans": [
+                asdict(span)
+                for span in sorted(
+                    self.spans, key=lambda span: span.seconds, reverse=True
+                )
+            ],
+            "lists": dict(
+                sorted(self.list_sizes.items(), key=lambda item: item[1], reverse=True)
+            ),
+        }
+
+    def write_report(self, path: Path, report: Optional[dict] = None):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report or self.report(), f, indent=2)
+
+
+def format_report(report: dict, limit: int = 20) -> str:
+    lines = [
+        f"Loaded {len(report['modules'])} modules in {report['seconds'] * 1000:.1f}ms",
+        "Slowest modules, excluding their nested imports:",
+    ]
+    for module in report["modules"][:limit]:
+        lines.append(
+            f"  {module['self_seconds'] * 1000:8.2f}ms  {module['module']}"
+            + (f" ({module['loads']} loads)" if module["loads"] > 1 else "")
+        )
+    if report["kinds"]:
+        lines.append("Time spent in:")
+        for kind, totals in report["kinds"].items():
+            lines.append(
+                f"  {totals['seconds'] * 1000:8.2f}ms  {kind} ({totals['calls']} calls)"
+            )
+    if report["spans"]:
+        lines.append("Slowest calls:")
+        for span in report["spans"][:limit]:
+            lines.append(
+                f"  {span['seconds'] * 1000:8.2f}ms  {span['kind']}({span['label']})"
+                + (f" in {span['module']}" if span["module"] else "")
+            )
+    if report["lists"]:
+        lines.append("Largest lists:")
+        for name, size in list(report["lists"].items())[:limit]:
+            lines.append(f"  {size:8}  {name}")
+    return "\n".join(lines)
+
+
+class TimingFinder(importlib.abc.MetaPathFinder):
+    """Finds modules with the other finders, and wraps the loader of the ones under the profiler's root"""
+
+    def __init__(self, profiler: LoadProfiler):
+        self.profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.origin and hasattr(spec.loader, "exec_module"):
+            name = self.profiler.module_name(spec.origin)
+            if name is not None:
+                spec.loader = TimedLoader(spec.loader, self.profiler, name)
+        return spec
+
+
+class TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, profiler: LoadProfiler, name: str):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self.profiler.importing(self.name):
+            self.loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+profiler = LoadProfiler()
+
+if os.environ.get(ENABLE_VARIABLE):
+    profiler.enable()
+
+
+def profile_offline(
+    packages: list[str] = PACKAGES, root: Path = ROOT
+) -> tuple[dict, dict[str, str]]:
+    """
+    Imports every module in packages against the talon stubs in test/stubs,
+    and returns the report along with the modules that failed to import,
+    usually because they use parts of talon the stubs don't implement.
+    """
+    stubs = str(root / "test" / "stubs")
+    if stubs not in sys.path:
+        sys.path.insert(0, stubs)
+    import talon
+
+    # Talon loads the user directory as a package, which the modules'
+    # relative imports depend on
+    package = types.ModuleType("user")
+    package.__path__ = [str(root)]
+    sys.modules.setdefault("user", package)
+
+    # Use the profiler the modules will import, not this module's copy when
+    # it is run as a script
+    user_profiler = importlib.import_module("user.core.load_profiler").profiler
+    user_profiler.enable()
+    failed = {}
+    try:
+        for directory in packages:
+            for path in sorted((root / directory).glob("**/*.py")):
+                name = "user." + user_profiler.module_name(str(path))
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    failed[name[len("user.") :]] = f"{type(e).__name__}: {e}"
+    finally:
+        user_profiler.disable()
+
+    user_profiler.record_lists(talon.Context.lists)
+    return user_profiler.report(), failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Profile importing this repository against the talon stubs in test/stubs"
+    )
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--limit", type=int, default=20, help="rows per section")
+    args = parser.parse_args()
+
+    report, failed = profile_offline()
+    report["failed"] = failed
+    print(format_report(report, args.limit))
+    print(f"{len(failed)} modules failed to import against the stubs")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
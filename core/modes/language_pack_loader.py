@@ -0,0 +1,36 @@
+from talon import Module, actions, app, registry
+
+from .language_packs import language_packs
+
+mod = Module()
+
+setting_lazy = mod.setting(
+    "language_lists_lazy",
+    type=bool,
+    default=True,
+    desc="Only build a language's lists the first time code.language is that language. Set to false to build them all at startup.",
+)
+
+
+def on_update_contexts():
+    language = actions.code.language()
+    # Contexts update far more often than the language changes
+    if language != language_packs.current_language:
+        language_packs.activate(language)
+
+
+@mod.action_class
+class Actions:
+    def language_packs_stats() -> dict[str, bool]:
+        """Returns which language modules have built their lists"""
+        return language_packs.stats()
+
+
+def on_ready():
+    if not setting_lazy.get():
+        language_packs.load_all()
+    on_update_contexts()
+    registry.register("update_contexts", on_update_contexts)
+
+
+app.register("ready", on_ready)
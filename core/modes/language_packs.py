@@ -0,0 +1,77 @@
+from typing import Any, Callable
+
+# Builds the lists a language module assigns to its context, keyed by list name
+ListsBuilder = Callable[[], dict[str, Any]]
+
+
+class LanguagePack:
+    """The lists of a language module, built and assigned to its context the first time one of its languages is active"""
+
+    def __init__(self, name: str, ctx, languages: tuple[str, ...], build: ListsBuilder):
+        self.name = name
+        self.ctx = ctx
+        self.languages = languages
+        self.build = build
+        self.loaded = False
+
+    def __repr__(self):
+        return f"LanguagePack({self.name!r}, loaded={self.loaded})"
+
+    def load(self) -> bool:
+        """Assigns the lists to the context unless that already happened. Returns whether it did."""
+        if self.loaded:
+            return False
+        self.loaded = True
+        # One update rather than one assignment per list, so Talon only
+        # rebuilds the context once
+        self.ctx.lists.update(self.build())
+        return True
+
+
+class LanguagePacks:
+    """
+    Language modules register their lists here instead of assigning them at
+    import time, so only the languages that are actually used are built and
+    compiled into the grammar.
+    """
+
+    def __init__(self):
+        # Keyed by the builder's qualified name, so a module that is reloaded
+        # replaces its pack rather than adding another
+        self.packs: dict[str, LanguagePack] = {}
+        self.current_language = None
+
+    def lists(self, ctx, *languages: str) -> Callable[[ListsBuilder], ListsBuilder]:
+        """Decorator registering a function that returns the lists for ctx, which matches code.language <languages>"""
+
+        def decorator(build: ListsBuilder) -> ListsBuilder:
+            name = f"{build.__module__}.{build.__qualname__}"
+            pack = LanguagePack(name, ctx, languages, build)
+            self.packs[name] = pack
+            # The language might have become active before this module loaded,
+            # eg when it is reloaded after an edit
+            if self.current_language in languages:
+                pack.load()
+            return build
+
+        return decorator
+
+    def activate(self, language: str) -> list[LanguagePack]:
+        """Loads the packs for <language> that aren't loaded yet, and returns them"""
+        self.current_language = language
+        return [
+            pack
+            for pack in self.packs.values()
+            if language in pack.languages and pack.load()
+        ]
+
+    def load_all(self):
+        for pack in self.packs.values():
+            pack.load()
+
+    def stats(self) -> dict[str, bool]:
+        """Which packs are loaded, by name"""
+        return {name: pack.loaded for name, pack in self.packs.items()}
+
+
+language_packs = LanguagePacks()
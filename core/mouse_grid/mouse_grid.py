@@ -1,12 +1,15 @@
 # courtesy of https://github.com/timo/
 # see https://github.com/timo/talon_scripts
 import math
+from functools import lru_cache
 from typing import Union
 
 from talon import Context, Module, actions, canvas, cron, ctrl, screen, settings, ui
 from talon.skia import Paint, Rect
 from talon.types.point import Point2d
 
+from ..screens.screens import get_topology
+
 mod = Module()
 narrow_expansion = mod.setting(
     "grid_narrow_expansion",
@@ -29,21 +32,89 @@ mod.tag(
 ctx = Context()
 
 
+def rect_contains(outer: Rect, inner: Rect) -> bool:
+    return (
+        outer.x <= inner.x
+        and outer.y <= inner.y
+        and inner.x + inner.width <= outer.x + outer.width
+        and inner.y + inner.height <= outer.y + outer.height
+    )
+
+
+def clamp_rect(rect: Rect, bounds: Rect) -> Rect:
+    """The part of rect that lies within bounds"""
+    left = max(rect.x, bounds.x)
+    top = max(rect.y, bounds.y)
+    right = min(rect.x + rect.width, bounds.x + bounds.width)
+    bottom = min(rect.y + rect.height, bounds.y + bounds.height)
+    return Rect(left, top, max(0, right - left), max(0, bottom - top))
+
+
+@lru_cache(maxsize=32)
+def grid_lines(width, height) -> tuple:
+    """The two vertical and two horizontal grid lines, relative to the top left"""
+    return (
+        (width // 3, 0, width // 3, height),
+        (2 * width // 3, 0, 2 * width // 3, height),
+        (0, height // 3, width, height // 3),
+        (0, 2 * height // 3, width, 2 * height // 3),
+    )
+
+
+@lru_cache(maxsize=32)
+def cross_lines(width, height, expansion, one_bottom_left) -> tuple:
+    """
+    Lines for the small crosses drawn inside each of the nine fields, relative to
+    the top left of the grid
+    """
+    lines = []
+    for which in range(1, 10):
+        offset_x, offset_y, field_width, field_height = narrowed_field(
+            which, width, height, expansion, one_bottom_left
+        )
+        for row in range(0, 2):
+            for col in range(0, 2):
+                cx = offset_x + field_width / 6 + (col + 0.5) * field_width / 3
+                cy = offset_y + field_height / 6 + (row + 0.5) * field_height / 3
+
+                lines.append((cx - 10, cy, cx + 10, cy))
+                lines.append((cx, cy - 10, cx, cy + 10))
+    return tuple(lines)
+
+
+def narrowed_field(which, width, height, expansion, one_bottom_left):
+    """The (x, y, width, height) of field which, relative to the top left of the grid"""
+    row = int(which - 1) // 3
+    col = int(which - 1) % 3
+    if one_bottom_left:
+        row = 2 - row
+    return (
+        int(col * width // 3) - expansion,
+        int(row * height // 3) - expansion,
+        (width // 3) + expansion * 2,
+        (height // 3) + expansion * 2,
+    )
+
+
 class MouseSnapNine:
     def __init__(self):
         self.screen = None
         self.rect = None
         self.history = []
         self.img = None
+        self.img_rect = None
         self.mcanvas = None
         self.active = False
         self.count = 0
         self.was_zoom_mouse_active = False
         self.was_control_mouse_active = False
         self.was_control1_mouse_active = False
+        # Caches for label_layout
+        self.label_metrics = {}
+        self.label_cache = {}
 
     def setup(self, *, rect: Rect = None, screen_num: int = None):
-        screens = ui.screens()
+        screens = get_topology().unsorted
         # each if block here might set the rect to None to indicate failure
         if rect is not None:
             try:
@@ -108,78 +179,45 @@ class MouseSnapNine:
 
     def draw(self, canvas):
         paint = canvas.paint
+        one_bottom_left = settings["user.grids_put_one_bottom_left"]
 
-        def draw_grid(offset_x, offset_y, width, height):
-            canvas.draw_line(
-                offset_x + width // 3,
-                offset_y,
-                offset_x + width // 3,
-                offset_y + height,
-            )
-            canvas.draw_line(
-                offset_x + 2 * width // 3,
-                offset_y,
-                offset_x + 2 * width // 3,
-                offset_y + height,
-            )
-
-            canvas.draw_line(
-                offset_x,
-                offset_y + height // 3,
-                offset_x + width,
-                offset_y + height // 3,
-            )
-            canvas.draw_line(
-                offset_x,
-                offset_y + 2 * height // 3,
-                offset_x + width,
-                offset_y + 2 * height // 3,
-            )
-
-        def draw_crosses(offset_x, offset_y, width, height):
-            for row in range(0, 2):
-                for col in range(0, 2):
-                    cx = offset_x + width / 6 + (col + 0.5) * width / 3
-                    cy = offset_y + height / 6 + (row + 0.5) * height / 3
-
-                    canvas.draw_line(cx - 10, cy, cx + 10, cy)
-                    canvas.draw_line(cx, cy - 10, cx, cy + 10)
+        def draw_lines(lines, offset_x, offset_y):
+            for x1, y1, x2, y2 in lines:
+                canvas.draw_line(
+                    offset_x + x1, offset_y + y1, offset_x + x2, offset_y + y2
+                )
 
         grid_stroke = 1
 
         def draw_text(offset_x, offset_y, width, height):
             canvas.paint.text_align = canvas.paint.TextAlign.CENTER
-            for row in range(3):
-                for col in range(3):
-                    text_string = ""
-                    if settings["user.grids_put_one_bottom_left"]:
-                        text_string = f"{(2 - row)*3+col+1}"
-                    else:
-                        text_string = f"{row*3+col+1}"
-                    text_rect = canvas.paint.measure_text(text_string)[1]
-                    background_rect = text_rect.copy()
-                    background_rect.center = Point2d(
-                        offset_x + width / 6 + col * width / 3,
-                        offset_y + height / 6 + row * height / 3,
-                    )
-                    background_rect = background_rect.inset(-4)
-                    paint.color = "9999995f"
-                    paint.style = Paint.Style.FILL
-                    canvas.draw_rect(background_rect)
-                    paint.color = "00ff00ff"
-                    canvas.draw_text(
-                        text_string,
-                        offset_x + width / 6 + col * width / 3,
-                        offset_y + height / 6 + row * height / 3 + text_rect.height / 2,
+            labels = self.label_layout(paint, width, height, one_bottom_left)
+            for text_string, background, text_x, text_y in labels:
+                paint.color = "9999995f"
+                paint.style = Paint.Style.FILL
+                canvas.draw_rect(
+                    Rect(
+                        offset_x + background.x,
+                        offset_y + background.y,
+                        background.width,
+                        background.height,
                     )
+                )
+                paint.color = "00ff00ff"
+                canvas.draw_text(text_string, offset_x + text_x, offset_y + text_y)
 
         if self.count < 2:
             paint.color = "00ff007f"
-            for which in range(1, 10):
-                gap = 35 - self.count * 10
-                if not self.active:
-                    gap = 45
-                draw_crosses(*self.calc_narrow(which, self.rect))
+            draw_lines(
+                cross_lines(
+                    self.rect.width,
+                    self.rect.height,
+                    narrow_expansion.get(),
+                    one_bottom_left,
+                ),
+                self.rect.x,
+                self.rect.y,
+            )
 
         paint.stroke_width = grid_stroke
         if self.active:
@@ -197,26 +235,69 @@ class MouseSnapNine:
             x = self.screen.x + (self.screen.width - w) / 2
             y = self.screen.y + (self.screen.height - h) / 2
             self.draw_zoom(canvas, x, y, w, h)
-            draw_grid(x, y, w, h)
+            draw_lines(grid_lines(w, h), x, y)
             draw_text(x, y, w, h)
         else:
-            draw_grid(self.rect.x, self.rect.y, self.rect.width, self.rect.height)
+            draw_lines(
+                grid_lines(self.rect.width, self.rect.height), self.rect.x, self.rect.y
+            )
 
             paint.textsize += 12 - self.count * 3
             draw_text(self.rect.x, self.rect.y, self.rect.width, self.rect.height)
 
+    def label_layout(self, paint, width, height, one_bottom_left):
+        """
+        Returns (label, background rect, text x, text y) for each of the nine labels,
+        relative to the top left of the grid. Cached per grid size, text size and
+        numpad orientation since measuring text is comparatively slow.
+        """
+        key = (width, height, paint.textsize, one_bottom_left)
+        labels = self.label_cache.get(key)
+        if labels is not None:
+            return labels
+
+        labels = []
+        for row in range(3):
+            for col in range(3):
+                if one_bottom_left:
+                    text_string = f"{(2 - row)*3+col+1}"
+                else:
+                    text_string = f"{row*3+col+1}"
+                metrics_key = (paint.textsize, text_string)
+                text_rect = self.label_metrics.get(metrics_key)
+                if text_rect is None:
+                    text_rect = paint.measure_text(text_string)[1]
+                    self.label_metrics[metrics_key] = text_rect
+                center_x = width / 6 + col * width / 3
+                center_y = height / 6 + row * height / 3
+                background_rect = text_rect.copy()
+                background_rect.center = Point2d(center_x, center_y)
+                background_rect = background_rect.inset(-4)
+                labels.append(
+                    (
+                        text_string,
+                        background_rect,
+                        center_x,
+                        center_y + text_rect.height / 2,
+                    )
+                )
+
+        if len(self.label_cache) >= 32:
+            self.label_cache.clear()
+        self.label_cache[key] = labels
+        return labels
+
     def calc_narrow(self, which, rect):
-        rect = rect.copy()
-        bdr = narrow_expansion.get()
-        row = int(which - 1) // 3
-        col = int(which - 1) % 3
-        if settings["user.grids_put_one_bottom_left"]:
-            row = 2 - row
-        rect.x += int(col * rect.width // 3) - bdr
-        rect.y += int(row * rect.height // 3) - bdr
-        rect.width = (rect.width // 3) + bdr * 2
-        rect.height = (rect.height // 3) + bdr * 2
-        return rect
+        x, y, width, height = narrowed_field(
+            which,
+            rect.width,
+            rect.height,
+            narrow_expansion.get(),
+            settings["user.grids_put_one_bottom_left"],
+        )
+        # Keep the expanded field within the grid it was narrowed from, so it
+        # stays inside an earlier zoom capture that can be reused
+        return clamp_rect(Rect(rect.x + x, rect.y + y, width, height), rect)
 
     def narrow(self, which, move=True):
         if which < 1 or which > 9:
@@ -235,16 +316,30 @@ class MouseSnapNine:
             self.mcanvas.freeze()
 
     def update_screenshot(self):
+        # The capture is at full resolution, so when narrowing within the region
+        # we already captured we can just draw the relevant part of it
+        if self.img is not None and rect_contains(self.img_rect, self.rect):
+            self.mcanvas.freeze()
+            return
+
         def finish_capture():
             self.img = screen.capture_rect(self.rect)
+            self.img_rect = self.rect.copy()
             self.mcanvas.freeze()
 
         self.mcanvas.hide()
         cron.after("16ms", finish_capture)
 
     def draw_zoom(self, canvas, x, y, w, h):
-        if self.img:
-            src = Rect(0, 0, self.img.width, self.img.height)
+        if self.img and rect_contains(self.img_rect, self.rect):
+            scale_x = self.img.width / self.img_rect.width
+            scale_y = self.img.height / self.img_rect.height
+            src = Rect(
+                (self.rect.x - self.img_rect.x) * scale_x,
+                (self.rect.y - self.img_rect.y) * scale_y,
+                self.rect.width * scale_x,
+                self.rect.height * scale_y,
+            )
             dst = Rect(x, y, w, h)
             canvas.draw_image_rect(self.img, src, dst)
 
@@ -0,0 +1,315 @@
+import logging
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional, Union
+
+# States a process goes through. It ends in one of the last four.
+QUEUED = "queued"
+RUNNING = "running"
+FINISHED = "finished"
+TIMED_OUT = "timed out"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+Command = Union[str, list[str]]
+
+# Children a command started in the background can keep its output pipes open
+# after it exits, so only wait this long for both of them to close
+OUTPUT_GRACE_SECONDS = 1.0
+
+
+class ProcessHandle:
+    """
+    A command submitted to a ProcessManager. The last lines of its stdout and
+    stderr are kept in ring buffers while it runs.
+    """
+
+    def __init__(
+        self,
+        args: Command,
+        shell: bool,
+        timeout: Optional[float],
+        capture_output: bool,
+        output_lines: int,
+        on_complete: Optional[Callable[["ProcessHandle"], None]],
+        popen_kwargs: dict,
+    ):
+        self.args = args
+        self.shell = shell
+        self.timeout = timeout
+        self.capture_output = capture_output
+        self.on_complete = on_complete
+        self.popen_kwargs = popen_kwargs
+        self.state = QUEUED
+        self.returncode: Optional[int] = None
+        self.error: Optional[Exception] = None
+        self.stdout: deque[str] = deque(maxlen=output_lines)
+        self.stderr: deque[str] = deque(maxlen=output_lines)
+        self.process: Optional[subprocess.Popen] = None
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ProcessHandle({self.args!r}, state={self.state!r}, returncode={self.returncode})"
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the command has ended. Returns False if timeout expired first."""
+        return self.done.wait(timeout)
+
+    def cancel(self):
+        """Stops the command, or keeps it from starting if it is still queued"""
+        with self.lock:
+            if self.done.is_set():
+                return
+            if self.state == RUNNING and self.process is not None:
+                self.state = CANCELLED
+                self.kill()
+            elif self.state == QUEUED:
+                self.state = CANCELLED
+                self.done.set()
+
+    def kill(self):
+        """Kills the process, and with shell=True every process the shell started"""
+        if not self.shell:
+            self.process.kill()
+        elif sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(self.process.pid)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            try:
+                # The shell leads its own process group, see ProcessManager.execute
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                self.process.kill()
+
+    def check(self):
+        """Raises the same exceptions subprocess.run(check=True, timeout=...) would"""
+        if self.state == TIMED_OUT:
+            raise subprocess.TimeoutExpired(self.args, self.timeout)
+        if self.error is not None:
+            raise self.error
+        if self.returncode:
+            raise subprocess.CalledProcessError(
+                self.returncode,
+                self.args,
+                "".join(self.stdout),
+                "".join(self.stderr),
+            )
+
+    def output(self) -> str:
+        return "".join(self.stdout)
+
+
+class ProcessManager:
+    """
+    Runs commands and keeps track of them. Each command may have a timeout
+    after which it is killed, and a completion callback which is called on the
+    thread that waited for it.
+
+    There are three ways to run a command:
+    - run() queues it on a bounded pool of worker threads. Commands beyond
+      max_workers wait in the queue, so only use it for commands that end soon
+      or have a timeout.
+    - launch() starts it straight away on its own thread, for programs such as
+      editors or browsers that may run for as long as talon does.
+    - run_blocking() runs it on the caller's thread, for callers that need the
+      result before carrying on. It doesn't use the pool, and cancel_all()
+      doesn't stop it.
+    """
+
+    def __init__(self, max_workers: int = 4, output_lines: int = 200):
+        self.max_workers = max_workers
+        self.output_lines = output_lines
+        self.queue: queue.Queue[ProcessHandle] = queue.Queue()
+        self.threads: list[threading.Thread] = []
+        self.active: set[ProcessHandle] = set()
+        self.lock = threading.Lock()
+
+    def run(
+        self,
+        args: Command,
+        shell: bool = False,
+        timeout: Optional[float] = None,
+        capture_output: bool = True,
+        on_complete: Optional[Callable[[ProcessHandle], None]] = None,
+        **popen_kwargs,
+    ) -> ProcessHandle:
+        """
+        Queues a command on the pool and returns its handle straight away. Pass
+        capture_output=False for commands that start long-lived children, such
+        as opening a file in an editor, which would otherwise hold on to the
+        output pipes.
+        """
+        handle = self._handle(
+            args, shell, timeout, capture_output, on_complete, popen_kwargs
+        )
+        with self.lock:
+            self.active.add(handle)
+            # Start another worker if every existing one is busy
+            all_busy = self.queue.unfinished_tasks >= len(self.threads)
+            if all_busy and len(self.threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"process-manager-{len(self.threads)}",
+                    daemon=True,
+                )
+                self.threads.append(thread)
+                thread.start()
+            self.queue.put(handle)
+        return handle
+
+    def launch(
+        self,
+        args: Command,
+        shell: bool = False,
+        timeout: Optional[float] = None,
+        capture_output: bool = True,
+        on_complete: Optional[Callable[[ProcessHandle], None]] = None,
+        **popen_kwargs,
+    ) -> ProcessHandle:
+        """Starts a command on its own thread, outside the pool, and returns its handle straight away"""
+        handle = self._handle(
+            args, shell, timeout, capture_output, on_complete, popen_kwargs
+        )
+        with self.lock:
+            self.active.add(handle)
+        threading.Thread(
+            target=self._complete,
+            args=(handle,),
+            name="process-manager-launch",
+            daemon=True,
+        ).start()
+        return handle
+
+    def run_blocking(
+        self,
+        args: Command,
+        shell: bool = False,
+        timeout: Optional[float] = None,
+        capture_output: bool = True,
+        **popen_kwargs,
+    ) -> ProcessHandle:
+        """Runs a command on the caller's thread and returns its handle once it has ended"""
+        handle = self._handle(args, shell, timeout, capture_output, None, popen_kwargs)
+        self.execute(handle)
+        return handle
+
+    def _handle(
+        self, args, shell, timeout, capture_output, on_complete, popen_kwargs
+    ) -> ProcessHandle:
+        return ProcessHandle(
+            args,
+            shell,
+            timeout,
+            capture_output,
+            self.output_lines,
+            on_complete,
+            popen_kwargs,
+        )
+
+    def running(self) -> list[ProcessHandle]:
+        with self.lock:
+            return list(self.active)
+
+    def cancel_all(self):
+        """Stops the commands started with run() or launch()"""
+        for handle in self.running():
+            handle.cancel()
+
+    def _work(self):
+        while True:
+            handle = self.queue.get()
+            try:
+                self._complete(handle)
+            finally:
+                self.queue.task_done()
+
+    def _complete(self, handle: ProcessHandle):
+        try:
+            self.execute(handle)
+        finally:
+            with self.lock:
+                self.active.discard(handle)
+        if handle.on_complete is not None:
+            try:
+                handle.on_complete(handle)
+            except Exception as e:
+                logging.error(f"Completion callback for {handle.args!r} failed: {e}")
+
+    def execute(self, handle: ProcessHandle):
+        """Runs the command on this thread"""
+        popen_kwargs = dict(handle.popen_kwargs)
+        if handle.shell and sys.platform != "win32":
+            # So the shell and everything it starts can be killed together
+            popen_kwargs.setdefault("start_new_session", True)
+        with handle.lock:
+            if handle.state != QUEUED:
+                # Cancelled while it was waiting
+                return
+            try:
+                handle.process = subprocess.Popen(
+                    handle.args,
+                    shell=handle.shell,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE if handle.capture_output else None,
+                    stderr=subprocess.PIPE if handle.capture_output else None,
+                    text=True,
+                    errors="replace",
+                    **popen_kwargs,
+                )
+            except OSError as e:
+                handle.state = FAILED
+                handle.error = e
+                handle.done.set()
+                return
+            handle.state = RUNNING
+
+        readers = []
+        if handle.capture_output:
+            readers = [
+                threading.Thread(
+                    target=_read_lines,
+                    args=(handle.process.stdout, handle.stdout),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=_read_lines,
+                    args=(handle.process.stderr, handle.stderr),
+                    daemon=True,
+                ),
+            ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            handle.returncode = handle.process.wait(handle.timeout)
+        except subprocess.TimeoutExpired:
+            handle.kill()
+            handle.returncode = handle.process.wait()
+            with handle.lock:
+                if handle.state == RUNNING:
+                    handle.state = TIMED_OUT
+
+        deadline = time.monotonic() + OUTPUT_GRACE_SECONDS
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+        with handle.lock:
+            if handle.state == RUNNING:
+                handle.state = FINISHED
+            handle.done.set()
+
+
+def _read_lines(pipe, buffer: deque):
+    with pipe:
+        for line in pipe:
+            buffer.append(line)
@@ -0,0 +1,80 @@
+from typing import Optional
+
+from talon import ui
+
+DIRECTIONS = ("left", "right", "up", "down")
+
+
+class ScreenTopology:
+    """
+    Snapshot of the screen layout: the screens in numbering order, their visible
+    rects and scales, and which screen is next to which in each direction. Only
+    rebuilt when the screens change. Kept apart from screens.py, which needs a
+    running talon, so the geometry can be tested.
+    """
+
+    def __init__(self, screens: list["ui.Screen"]):
+        self.unsorted = screens
+        # Screens are numbered left-to-right by their left edge
+        self.screens = sorted(screens, key=lambda screen: screen.visible_rect.left)
+        self.visible_rects = [screen.visible_rect for screen in self.screens]
+        self.scales = [screen.scale for screen in self.screens]
+        self.neighbors = [
+            {
+                direction: find_neighbor(self.visible_rects, index, direction)
+                for direction in DIRECTIONS
+            }
+            for index in range(len(self.screens))
+        ]
+
+    def index_of(self, screen: "ui.Screen") -> int:
+        return self.screens.index(screen)
+
+    def neighbor(self, screen: "ui.Screen", direction: str) -> Optional["ui.Screen"]:
+        index = self.neighbors[self.index_of(screen)][direction]
+        return None if index is None else self.screens[index]
+
+
+def find_neighbor(rects, index: int, direction: str) -> Optional[int]:
+    """
+    Finds the screen adjacent to rects[index] in direction. Screens that overlap it
+    along the other axis are preferred, then the closest one, so this works for
+    layouts with several rows of screens as well as a single row.
+    """
+    rect = rects[index]
+    best = None
+    best_key = None
+    for other_index, other in enumerate(rects):
+        if other_index == index:
+            continue
+
+        if direction == "left":
+            gap = rect.left - other.right
+            overlap = min(rect.bot, other.bot) - max(rect.top, other.top)
+            along = other.center.x < rect.center.x
+        elif direction == "right":
+            gap = other.left - rect.right
+            overlap = min(rect.bot, other.bot) - max(rect.top, other.top)
+            along = other.center.x > rect.center.x
+        elif direction == "up":
+            gap = rect.top - other.bot
+            overlap = min(rect.right, other.right) - max(rect.left, other.left)
+            along = other.center.y < rect.center.y
+        else:
+            gap = other.top - rect.bot
+            overlap = min(rect.right, other.right) - max(rect.left, other.left)
+            along = other.center.y > rect.center.y
+
+        # Screens that overlap this one in the direction of travel are only
+        # neighbors if they are mostly beyond its center
+        if not along or gap < -min(rect.width, rect.height) / 2:
+            continue
+
+        distance = abs(other.center.x - rect.center.x) + abs(
+            other.center.y - rect.center.y
+        )
+        key = (overlap <= 0, max(gap, 0), distance)
+        if best_key is None or key < best_key:
+            best, best_key = other_index, key
+
+    return best
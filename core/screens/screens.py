@@ -1,8 +1,34 @@
+from typing import Optional
+
 from talon import Module, cron, ui
 from talon.canvas import Canvas
 
+from .screen_topology import DIRECTIONS, ScreenTopology
+
 mod = Module()
 
+_topology: Optional[ScreenTopology] = None
+
+
+def get_topology(screen: Optional[ui.Screen] = None) -> ScreenTopology:
+    """
+    The current screen topology. Passing a screen rebuilds it if that screen
+    isn't in it, which happens when the screens changed but the screen_change
+    event hasn't arrived yet.
+    """
+    global _topology
+    if _topology is None or (screen is not None and screen not in _topology.screens):
+        _topology = ScreenTopology(list(ui.screens()))
+    return _topology
+
+
+def _on_screen_change(_):
+    global _topology
+    _topology = None
+
+
+ui.register("screen_change", _on_screen_change)
+
 
 @mod.action_class
 class Actions:
@@ -32,21 +58,25 @@ class Actions:
         """Get the screen after this one"""
         return get_screen_by_offset(screen, 1)
 
+    def screens_get_adjacent(screen: ui.Screen, direction: str) -> Optional[ui.Screen]:
+        """Get the screen physically next to this one in direction (left, right, up or down), if any"""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown direction {direction!r}")
+        return get_topology(screen).neighbor(screen, direction)
+
 
 def get_screen_by_offset(screen: ui.Screen, offset: int) -> ui.Screen:
-    screens = get_sorted_screens()
-    index = (screens.index(screen) + offset) % len(screens)
-    return screens[index]
+    topology = get_topology(screen)
+    index = (topology.index_of(screen) + offset) % len(topology.screens)
+    return topology.screens[index]
 
 
 def get_sorted_screens():
     """Return screens sorted by their topmost, then leftmost, edge.
     Screens will be sorted leftto-right, then top-to-bottom as a tiebreak.
     """
-    return sorted(
-        ui.screens(),
-        key=lambda screen: screen.visible_rect.left,
-    )
+    # A copy, since callers may change it and the topology is shared
+    return list(get_topology().screens)
 
 
 def show_screen_number(screen: ui.Screen, number: int):
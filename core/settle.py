@@ -0,0 +1,103 @@
+"""Waiting for an application to react to input, instead of sleeping for a fixed time.
+
+Fixed sleeps have to be long enough for the slowest case, so most of the time
+they just waste time. Instead, read something cheap that the input is expected
+to change, such as the focused element, and poll it until it changes or a
+timeout expires. The timeout should be no longer than the sleep it replaces,
+since it is how long we wait when the change never comes.
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+from talon import ui
+
+# Sentinel returned by probes that can't read anything on this platform
+UNKNOWN = object()
+
+# Element properties that identify it without changing as the user types in it,
+# on the platforms that have them. Element objects themselves can't be compared,
+# because each call to ui.focused_element() returns a new one.
+ELEMENT_KEY_ATTRIBUTES = (
+    # Windows
+    "runtime_id",
+    "automation_id",
+    "control_type",
+    "class_name",
+    "name",
+    # Mac
+    "AXIdentifier",
+    "AXRole",
+    "AXSubrole",
+    "AXTitle",
+    "AXDescription",
+)
+
+
+def wait_until(
+    condition: Callable[[], bool], timeout: float = 0.5, interval: float = 0.01
+) -> bool:
+    """
+    Polls condition every interval seconds until it returns True or timeout
+    seconds have passed. Returns whether the condition was met.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        if condition():
+            return True
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+
+
+def wait_for_change(
+    probe: Callable[[], Any],
+    before: Any,
+    timeout: float = 0.5,
+    interval: float = 0.01,
+    fallback: Optional[float] = None,
+) -> bool:
+    """
+    Waits until probe returns something other than before. If the probe can't
+    tell on this platform, sleeps for fallback seconds instead, which should be
+    the fixed delay the call site used before, or timeout if not given.
+    """
+    if before is UNKNOWN:
+        time.sleep(timeout if fallback is None else fallback)
+        return False
+    return wait_until(lambda: probe() != before, timeout, interval)
+
+
+def settle_after(
+    action: Callable[[], None],
+    probe: Callable[[], Any],
+    timeout: float = 0.5,
+    interval: float = 0.01,
+    fallback: Optional[float] = None,
+) -> bool:
+    """Runs action, then waits until probe returns something different from before it ran"""
+    before = probe()
+    action()
+    return wait_for_change(probe, before, timeout, interval, fallback)
+
+
+def element_key(element: Any) -> Any:
+    """The element's identifying properties, or UNKNOWN if none can be read"""
+    key = []
+    for attribute in ELEMENT_KEY_ATTRIBUTES:
+        try:
+            value = getattr(element, attribute)
+        except Exception:
+            continue
+        if isinstance(value, list):
+            value = tuple(value)
+        key.append((attribute, value))
+    return tuple(key) if key else UNKNOWN
+
+
+def focused_element() -> Any:
+    try:
+        return element_key(ui.focused_element())
+    except Exception:
+        return UNKNOWN
@@ -0,0 +1,146 @@
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from .snippet_types import Snippet
+
+
+class SnippetLayer:
+    """
+    The snippets defined for a single language, and the list entries they
+    contribute. A layer is never changed after it is built, so every language
+    that inherits from it shares the same one instead of a copy.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        snippets: list[Snippet],
+        parents: tuple["SnippetLayer", ...] = (),
+    ):
+        self.language = language
+        # Ordered from most general to most specific
+        self.parents = parents
+        self.snippets: Mapping[str, Snippet] = MappingProxyType(
+            {snippet.name: snippet for snippet in snippets}
+        )
+        insertions, insertions_phrase, wrappers = create_lists(language, snippets)
+        self.insertions: Mapping[str, str] = MappingProxyType(insertions)
+        self.insertions_phrase: Mapping[str, str] = MappingProxyType(insertions_phrase)
+        self.wrappers: Mapping[str, str] = MappingProxyType(wrappers)
+
+    def __repr__(self):
+        return f"SnippetLayer({self.language!r}, {len(self.snippets)} snippets)"
+
+    def chain(self) -> tuple["SnippetLayer", ...]:
+        """This layer and its parents, from most general to most specific"""
+        return (*self.parents, self)
+
+    def resolve(self, name: str) -> Optional[Snippet]:
+        """Finds snippet <name> in the most specific layer of the chain that defines it"""
+        for layer in reversed(self.chain()):
+            snippet = layer.snippets.get(name)
+            if snippet is not None:
+                return snippet
+        return None
+
+
+class SnippetLists:
+    """The Talon lists for one chain of layers, merged so that specific layers override general ones"""
+
+    def __init__(self, layers: tuple[SnippetLayer, ...]):
+        self.insertions: dict[str, str] = {}
+        self.insertions_phrase: dict[str, str] = {}
+        self.wrappers: dict[str, str] = {}
+        for layer in layers:
+            self.insertions.update(layer.insertions)
+            self.insertions_phrase.update(layer.insertions_phrase)
+            self.wrappers.update(layer.wrappers)
+
+
+class SnippetIndex:
+    """
+    Snippets for every language, stored once in the layer of the language they
+    are defined for. A language that inherits from others, eg typescript from
+    javascript and the global `_` snippets, points at their layers.
+    """
+
+    def __init__(
+        self,
+        language_to_snippets: dict[str, list[Snippet]],
+        language_to_supers: dict[str, list[str]],
+    ):
+        """
+        Args:
+            language_to_snippets (dict[str, list[Snippet]]): The snippets defined for each language
+            language_to_supers (dict[str, list[str]]): For each language, the languages it inherits from followed by itself, from most general to most specific
+        """
+        self.layers: dict[str, SnippetLayer] = {}
+
+        def get_layer(language: str) -> SnippetLayer:
+            if language not in self.layers:
+                supers = language_to_supers.get(language, [language])
+                self.layers[language] = SnippetLayer(
+                    language,
+                    language_to_snippets.get(language, []),
+                    tuple(get_layer(lang) for lang in supers if lang != language),
+                )
+            return self.layers[language]
+
+        for language in language_to_supers:
+            get_layer(language)
+
+        self.lists_cache: dict[tuple[int, ...], SnippetLists] = {}
+
+    def get(self, language: str, name: str) -> Optional[Snippet]:
+        layer = self.layers.get(language)
+        if layer is None:
+            return None
+        return layer.resolve(name)
+
+    def lists(self, language: str) -> SnippetLists:
+        """
+        The Talon lists for <language>. Languages whose chains contain the same
+        snippets, such as every language without snippets of its own, share
+        one set of lists.
+        """
+        layers = tuple(
+            layer for layer in self.layers[language].chain() if layer.snippets
+        )
+        key = tuple(id(layer.snippets) for layer in layers)
+        if key not in self.lists_cache:
+            self.lists_cache[key] = SnippetLists(layers)
+        return self.lists_cache[key]
+
+
+def create_lists(
+    lang: str,
+    snippets: list[Snippet],
+) -> tuple[dict[str, str], dict[str, str], dict[str, str]]:
+    """Creates the lists for the given language, and returns them as a tuple of (insertions, insertions_phrase, wrappers)
+
+    Args:
+        lang (str): The language of the snippets
+        snippets (list[Snippet]): The list of snippets for the given language
+    """
+    insertions = {}
+    insertions_phrase = {}
+    wrappers = {}
+
+    for snippet in snippets:
+        id_lang = f"{lang}.{snippet.name}"
+
+        if snippet.phrases is not None:
+            for phrase in snippet.phrases:
+                insertions[phrase] = id_lang
+
+        if snippet.variables is not None:
+            for var in snippet.variables:
+                if var.insertion_formatters is not None and snippet.phrases is not None:
+                    for phrase in snippet.phrases:
+                        insertions_phrase[phrase] = id_lang
+
+                if var.wrapper_phrases is not None:
+                    for phrase in var.wrapper_phrases:
+                        wrappers[phrase] = f"{id_lang}.{var.name}"
+
+    return insertions, insertions_phrase, wrappers
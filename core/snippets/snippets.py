@@ -5,6 +5,7 @@ from pathlib import Path
 from talon import Context, Module, actions, app, fs
 
 from ..modes.language_modes import language_ids
+from .snippet_index import SnippetIndex
 from .snippet_types import Snippet
 from .snippets_parser import create_snippets_from_file
 
@@ -27,7 +28,7 @@ context_map = {
     # `_` represents the global context, ie snippets available regardless of language
     "_": Context(),
 }
-snippets_map = {}
+snippet_index = SnippetIndex({}, {})
 
 # Create a context for each defined language
 for lang in language_ids:
@@ -58,36 +59,28 @@ class Actions:
             lang = actions.code.language() or "_"
             name = f"{lang}.{name}"
 
-        if name not in snippets_map:
+        lang, _, snippet_name = name.partition(".")
+        snippet = snippet_index.get(lang, snippet_name)
+
+        if snippet is None:
             raise ValueError(f"Unknown snippet '{name}'")
 
-        return snippets_map[name]
+        return snippet
 
 
 def update_snippets():
-    language_to_snippets = group_by_language(get_snippets())
+    global snippet_index
 
-    snippets_map.clear()
+    snippet_index = SnippetIndex(
+        group_by_language(get_snippets()),
+        {lang: get_super_languages(lang) for lang in context_map},
+    )
 
     for lang, ctx in context_map.items():
-        insertion_map = {}
-        insertions_phrase_map = {}
-        wrapper_map = {}
-
-        for lang_super in get_super_languages(lang):
-            snippets, insertions, insertions_phrase, wrappers = create_lists(
-                lang,
-                lang_super,
-                language_to_snippets.get(lang_super, []),
-            )
-            snippets_map.update(snippets)
-            insertion_map.update(insertions)
-            insertions_phrase_map.update(insertions_phrase)
-            wrapper_map.update(wrappers)
-
-        ctx.lists["user.snippet"] = insertion_map
-        ctx.lists["user.snippet_with_phrase"] = insertions_phrase_map
-        ctx.lists["user.snippet_wrapper"] = wrapper_map
+        lists = snippet_index.lists(lang)
+        ctx.lists["user.snippet"] = lists.insertions
+        ctx.lists["user.snippet_with_phrase"] = lists.insertions_phrase
+        ctx.lists["user.snippet_wrapper"] = lists.wrappers
 
 
 def get_snippets() -> list[Snippet]:
@@ -139,47 +132,6 @@ def group_by_language(snippets: list[Snippet]) -> dict[str, list[Snippet]]:
     return result
 
 
-def create_lists(
-    lang_ctx: str,
-    lang_snippets: str,
-    snippets: list[Snippet],
-) -> tuple[dict[str, list[Snippet]], dict[str, str], dict[str, str], dict[str, str]]:
-    """Creates the lists for the given language, and returns them as a tuple of (snippets, insertions, insertions_phrase, wrappers)
-
-    Args:
-        lang_ctx (str): The language of the context match
-        lang_snippets (str): The language of the snippets
-        snippets (list[Snippet]): The list of snippets for the given language
-    """
-    snippets_map = {}
-    insertions = {}
-    insertions_phrase = {}
-    wrappers = {}
-
-    for snippet in snippets:
-        id_ctx = f"{lang_ctx}.{snippet.name}"
-        id_lang = f"{lang_snippets}.{snippet.name}"
-
-        # Make sure that the snippet is added to the map for the context language
-        snippets_map[id_ctx] = snippet
-
-        if snippet.phrases is not None:
-            for phrase in snippet.phrases:
-                insertions[phrase] = id_lang
-
-        if snippet.variables is not None:
-            for var in snippet.variables:
-                if var.insertion_formatters is not None and snippet.phrases is not None:
-                    for phrase in snippet.phrases:
-                        insertions_phrase[phrase] = id_lang
-
-                if var.wrapper_phrases is not None:
-                    for phrase in var.wrapper_phrases:
-                        wrappers[phrase] = f"{id_lang}.{var.name}"
-
-    return snippets_map, insertions, insertions_phrase, wrappers
-
-
 def on_ready():
     fs.watch(str(SNIPPETS_DIR), lambda _1, _2: update_snippets())
 
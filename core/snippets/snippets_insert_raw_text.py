@@ -69,14 +69,12 @@ def parse_snippet(body: str):
 
 def up(n: int):
     """Move cursor up <n> rows"""
-    for _ in range(n):
-        actions.edit.up()
+    actions.user.move_cursor("up", n)
 
 
 def right(n: int):
     """Move cursor right <n> columns"""
-    for _ in range(n):
-        actions.edit.right()
+    actions.user.move_cursor("right", n)
 
 
 def key(stop: Stop):
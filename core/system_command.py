@@ -1,17 +1,58 @@
-import os
-import subprocess
+import logging
 
-from talon import Module
+from talon import Module, cron
+
+from .process_manager import FINISHED, ProcessHandle, ProcessManager
 
 mod = Module()
 
+setting_timeout = mod.setting(
+    "system_command_timeout",
+    type=float,
+    default=0,
+    desc="Seconds after which a command started with user.system_command_nb is killed. 0 means never.",
+)
+
+# Shared by everything that runs external commands, so they don't block talon
+# and can be inspected or cancelled
+process_manager = ProcessManager()
+
+
+def _report(handle: ProcessHandle):
+    if handle.state == FINISHED and handle.returncode == 0:
+        return
+    stderr = "".join(handle.stderr).strip()
+    message = f"Command {handle.args!r} {handle.state}"
+    if handle.returncode:
+        message += f" with exit code {handle.returncode}"
+    if stderr:
+        message += f": {stderr}"
+    logging.error(message)
+
 
 @mod.action_class
 class Actions:
     def system_command(cmd: str):
         """execute a command on the system"""
-        os.system(cmd)
+        # Like os.system, output goes to talon's log rather than being captured,
+        # so children left running in the background don't hold the call up
+        _report(process_manager.run_blocking(cmd, shell=True, capture_output=False))
 
     def system_command_nb(cmd: str):
         """execute a command on the system without blocking"""
-        subprocess.Popen(cmd, shell=True)
+        timeout = setting_timeout.get() or None
+        # Commands with a timeout end soon enough to share the bounded pool.
+        # Without one it often starts a program that runs until the user closes
+        # it, which would take up a worker, so it gets its own thread. Failures
+        # are reported on talon's thread.
+        start = process_manager.run if timeout else process_manager.launch
+        start(
+            cmd,
+            shell=True,
+            timeout=timeout,
+            on_complete=lambda handle: cron.after("0ms", lambda: _report(handle)),
+        )
+
+    def system_command_cancel_all():
+        """Stop every command started with user.system_command_nb that is still running"""
+        process_manager.cancel_all()
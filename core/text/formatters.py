@@ -1,6 +1,7 @@
 import logging
 import re
-from typing import Union
+from functools import lru_cache
+from typing import Iterator, Optional, Union
 
 from talon import Context, Module, actions, app
 from talon.grammar import Phrase
@@ -52,12 +53,18 @@ def format_phrase(m: Union[str, Phrase], formatters: str):
     return result
 
 
-def format_phrase_without_adding_to_history(word_list, formatters: str):
+@lru_cache(maxsize=64)
+def compile_formatters(formatters: str):
     # A formatter is a pair (keep_spaces, function). We drop spaces if any
     # formatter does; we apply their functions in reverse order.
     formatters = [all_formatters[name] for name in formatters.split(",")]
     separator = " " if all(x[0] for x in formatters) else ""
     functions = [x[1] for x in reversed(formatters)]
+    return separator, functions
+
+
+def format_phrase_without_adding_to_history(word_list, formatters: str):
+    separator, functions = compile_formatters(formatters)
     words = []
     for i, word in enumerate(word_list):
         for f in functions:
@@ -310,12 +317,10 @@ class Actions:
         if not selected:
             app.notify("Asked to reformat selection, but nothing selected!")
             return
-        if formatters not in all_prose_formatters:
-            selected = unformat_text(selected)
         # Delete separately for compatibility with programs that don't overwrite
         # selected text (e.g. Emacs)
         edit.delete()
-        text = actions.self.formatted_text(selected, formatters)
+        text = reformat(selected, formatters)
         actions.insert(text)
         return text
 
@@ -333,9 +338,7 @@ class Actions:
 
     def reformat_text(text: str, formatters: str) -> str:
         """Reformat the text."""
-        if formatters not in all_prose_formatters:
-            text = unformat_text(text)
-        return actions.user.formatted_text(text, formatters)
+        return reformat(text, formatters)
 
     def insert_many(strings: list[str]) -> None:
         """Insert a list of strings, sequentially."""
@@ -343,18 +346,98 @@ class Actions:
             actions.insert(string)
 
 
+def _char_kind(c: str) -> str:
+    if c.isupper():
+        return "upper"
+    if c.isdigit():
+        return "digit"
+    if c.isalpha():
+        return "lower"
+    return "separator"
+
+
+def tokenize(text: str) -> Iterator[tuple[str, Optional[list[str]]]]:
+    """
+    Splits text into identifiers and the text between them in one pass.
+    Yields (identifier, words) for each identifier, where words are its
+    lowercased camelCase humps and runs of letters or digits, and (text, None)
+    for everything else, so that joining the first elements gives back text.
+    Underscores are separators within an identifier, like in snake_case.
+    """
+    n = len(text)
+    i = 0
+    while i < n:
+        start = i
+        if not (text[i].isalnum() or text[i] == "_"):
+            while i < n and not (text[i].isalnum() or text[i] == "_"):
+                i += 1
+            yield text[start:i], None
+            continue
+
+        words = []
+        word_start = None
+        prev = "separator"
+        while i < n and (text[i].isalnum() or text[i] == "_"):
+            kind = _char_kind(text[i])
+            if kind == "separator":
+                if word_start is not None:
+                    words.append(text[word_start:i].lower())
+                    word_start = None
+            elif word_start is None:
+                word_start = i
+            elif (
+                (prev == "lower" and kind == "upper")
+                or (kind == "digit") != (prev == "digit")
+                or (
+                    prev == "upper"
+                    and kind == "upper"
+                    and i + 1 < n
+                    and _char_kind(text[i + 1]) == "lower"
+                )
+            ):
+                # camelCase hump, letters meeting digits, or the last capital
+                # of an acronym starting a new word as in HTTPServer
+                words.append(text[word_start:i].lower())
+                word_start = i
+            prev = kind
+            i += 1
+        if word_start is not None:
+            words.append(text[word_start:i].lower())
+        yield text[start:i], words
+
+
+def unformat_words(text: str) -> list[str]:
+    """Splits text into lowercase words, dropping all punctuation"""
+    return [word for _, words in tokenize(text) if words for word in words]
+
+
 def unformat_text(text: str) -> str:
     """Remove format from text"""
-    unformatted = re.sub(r"[\W_]+", " ", text)
-    # Split on camelCase, including numbers
-    # FIXME: handle non-ASCII letters!
-    unformatted = re.sub(
-        r"(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|(?<=[a-zA-Z])(?=[0-9])|(?<=[0-9])(?=[a-zA-Z])",
-        " ",
-        unformatted,
+    return " ".join(unformat_words(text))
+
+
+def reformat_identifiers(text: str, formatters: str) -> str:
+    """
+    Reformats each identifier in text separately, keeping the text between
+    them, e.g. every variable name in a block of code.
+    """
+    return "".join(
+        token
+        if words is None
+        else format_phrase_without_adding_to_history(words, formatters)
+        for token, words in tokenize(text)
     )
-    # TODO: Separate out studleycase vars
-    return unformatted.lower()
+
+
+def reformat(text: str, formatters: str) -> str:
+    """Reformats a single phrase, or each identifier when text has several lines"""
+    if formatters in all_prose_formatters:
+        return actions.user.formatted_text(text, formatters)
+    if "\n" in text:
+        result = reformat_identifiers(text, formatters)
+        actions.user.add_phrase_to_history(result)
+        return result
+    return actions.user.formatted_text(unformat_text(text), formatters)
 
 
 ctx.lists["self.formatters"] = formatter_words.keys()
@@ -0,0 +1,101 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Hashable, Optional
+
+# Only the end of the text before the cursor matters for spacing and
+# capitalization, so don't keep more than this
+MAX_BEFORE_LENGTH = 200
+
+# Forget the text this many seconds after dictation last inserted any, since
+# the user may have typed or clicked in the meantime
+TTL_SECONDS = 5.0
+
+
+class ShadowBuffer:
+    """
+    Tracks the text around the cursor while talon is the only thing typing there.
+
+    Dictation learns the surrounding text by peeking, which costs a dozen key
+    presses and two clipboard round-trips. After that, as long as only dictation
+    inserts text at the cursor, the text before the cursor is what was peeked
+    plus what was inserted since, and the text after it is unchanged. Any other
+    key press, insert, click or focus change makes that unknown again.
+
+    Key presses and clicks made outside talon can't be seen. To limit how long
+    they go unnoticed, the buffer is forgotten ttl seconds after the last
+    update, and at the start of a phrase if the focus has moved since the
+    previous one.
+    """
+
+    def __init__(
+        self, ttl: float = TTL_SECONDS, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.clock = clock
+        self.before: Optional[str] = None
+        self.after: Optional[str] = None
+        self.updated = 0.0
+        # Identifies where the focus was at the start of the last phrase
+        self.focus: Optional[Hashable] = None
+        # Set while dictation itself is typing, so its own input isn't mistaken
+        # for something that invalidates the buffer
+        self.recording = False
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self):
+        self.before = None
+        self.after = None
+
+    def on_phrase(self, focus: Hashable):
+        """Call at the start of each phrase with something identifying the focused window or element"""
+        if focus != self.focus:
+            self.reset()
+        self.focus = focus
+
+    def on_input(self, kind: str, value: str):
+        if not self.recording:
+            self.reset()
+
+    @contextmanager
+    def own_input(self):
+        """Input sent inside this block is accounted for by the caller"""
+        self.recording = True
+        try:
+            yield
+        finally:
+            self.recording = False
+
+    def lookup(self, left: bool, right: bool) -> tuple[Optional[str], Optional[str]]:
+        """
+        Returns the known (before, after) text, either of which may be None if it
+        isn't known. Counts a hit if everything asked for is known.
+        """
+        if self.clock() - self.updated > self.ttl:
+            self.reset()
+        if (left and self.before is None) or (right and self.after is None):
+            self.misses += 1
+        else:
+            self.hits += 1
+        return self.before, self.after
+
+    def update(
+        self,
+        before: Optional[str],
+        after: Optional[str],
+        inserted: str,
+        inserted_after: str = "",
+    ):
+        """
+        Records that inserted was typed and inserted_after was typed after it
+        with the cursor left between the two, when before and after were the text
+        around the cursor. Either may be None if it isn't known.
+        """
+        self.before = (
+            None if before is None else (before + inserted)[-MAX_BEFORE_LENGTH:]
+        )
+        self.after = None if after is None else inserted_after + after
+        self.updated = self.clock()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
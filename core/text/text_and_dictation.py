@@ -2,7 +2,10 @@
 import re
 from typing import Callable, Optional
 
-from talon import Context, Module, actions, grammar, ui
+from talon import Context, Module, actions, grammar, speech_system, ui
+
+from ..edit import input_events
+from .shadow_buffer import ShadowBuffer
 
 mod = Module()
 
@@ -327,6 +330,27 @@ dictation_formatter = DictationFormat()
 ui.register("app_deactivate", lambda app: dictation_formatter.reset())
 ui.register("win_focus", lambda win: dictation_formatter.reset())
 
+# What context sensitive dictation knows about the text around the cursor
+shadow_buffer = ShadowBuffer()
+input_events.register(shadow_buffer.on_input)
+for event in ("app_deactivate", "win_focus", "element_focus"):
+    ui.register(event, lambda _: shadow_buffer.reset())
+
+
+def focused_window_id() -> Optional[int]:
+    try:
+        return ui.active_window().id
+    except Exception:
+        return None
+
+
+def on_pre_phrase(_):
+    # Focus events can be missed, e.g. while talon is asleep
+    shadow_buffer.on_phrase(focused_window_id())
+
+
+speech_system.register("pre:phrase", on_pre_phrase)
+
 
 def reformat_last_utterance(formatter):
     text = actions.user.get_last_phrase()
@@ -375,7 +399,8 @@ class Actions:
     def dictation_insert(text: str, auto_cap: bool = True) -> str:
         """Inserts dictated text, formatted appropriately."""
         add_space_after = False
-        if setting_context_sensitive_dictation.get():
+        context_sensitive = setting_context_sensitive_dictation.get()
+        if context_sensitive:
             # Peek left if we might need leading space or auto-capitalization;
             # peek right if we might need trailing space. NB. We peek right
             # BEFORE insertion to avoid breaking the undo-chain between the
@@ -385,16 +410,38 @@ class Actions:
                 or text != auto_capitalize(text, "sentence start")[0]
             )
             need_right = not omit_space_after(text)
-            before, after = actions.user.dictation_peek(need_left, need_right)
-            dictation_formatter.update_context(before)
-            add_space_after = after is not None and needs_space_between(text, after)
+            # Only peek for what the shadow buffer doesn't already know
+            before, after = shadow_buffer.lookup(need_left, need_right)
+            peek_left = need_left and before is None
+            peek_right = need_right and after is None
+            if peek_left or peek_right:
+                with shadow_buffer.own_input():
+                    peeked = actions.user.dictation_peek(peek_left, peek_right)
+                if peek_left:
+                    before = peeked[0]
+                if peek_right:
+                    after = peeked[1]
+            dictation_formatter.update_context(before if need_left else None)
+            add_space_after = (
+                need_right and after is not None and needs_space_between(text, after)
+            )
         text = dictation_formatter.format(text, auto_cap)
         # Straighten curly quotes that were introduced to obtain proper
         # spacing. The formatter context still has the original curly quotes
         # so that future dictation is properly formatted.
         text = text.replace("“", '"').replace("”", '"')
         actions.user.add_phrase_to_history(text)
-        actions.user.insert_between(text, " " if add_space_after else "")
+        space_after = " " if add_space_after else ""
+        if not context_sensitive:
+            actions.user.insert_between(text, space_after)
+            return
+        with shadow_buffer.own_input():
+            actions.user.insert_between(text, space_after)
+        shadow_buffer.update(before, after, text, space_after)
+
+    def dictation_shadow_buffer_stats() -> dict:
+        """Returns how many context sensitive dictation peeks were answered by the shadow buffer (hits) and how many needed a real peek (misses)"""
+        return shadow_buffer.stats()
 
     def dictation_peek(left: bool, right: bool) -> tuple[Optional[str], Optional[str]]:
         """
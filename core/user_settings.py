@@ -4,6 +4,8 @@ from pathlib import Path
 
 from talon import resource
 
+from .load_profiler import profiler
+
 # NOTE: This method requires this module to be one folder below the top-level
 #   community/knausj folder.
 SETTINGS_DIR = Path(__file__).parents[1] / "settings"
@@ -12,6 +14,7 @@ if not SETTINGS_DIR.is_dir():
     os.mkdir(SETTINGS_DIR)
 
 
+@profiler.timed("get_list_from_csv")
 def get_list_from_csv(
     filename: str, headers: tuple[str, str], default: dict[str, str] = {}
 ):
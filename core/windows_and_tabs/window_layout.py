@@ -0,0 +1,155 @@
+"""Named multi-window layouts built on window_snap.
+
+A layout places several applications at once, e.g. "layout coding" might put the
+editor on the left two thirds of screen 1, a terminal on the right third and the
+browser on screen 2. Layouts live in settings/window_layouts.csv, one row per
+application:
+
+    Layout, Application, Position, Screen
+    coding, Code, left two thirds, 1
+    coding, Terminal, right third, 1
+    coding, Firefox, full, 2
+
+Position is either one of the `user.window_snap_positions` names or four
+fractions of the screen, "left top right bottom". Screen is optional and defaults
+to the screen the window is already on.
+"""
+
+import csv
+import os
+from typing import Optional
+
+from talon import Context, Module, actions, app, resource, ui
+
+from ..screens.screens import get_topology
+from ..user_settings import SETTINGS_DIR
+from .window_positions import (
+    LayoutEntry,
+    RelativeScreenPos,
+    format_position,
+    parse_layouts,
+)
+
+LAYOUTS_FILE = SETTINGS_DIR / "window_layouts.csv"
+HEADERS = ["Layout", "Application", "Position", "Screen"]
+
+mod = Module()
+mod.list("window_layout", desc="Names of saved window layouts")
+ctx = Context()
+
+
+def read_layout_rows() -> list[list[str]]:
+    if not LAYOUTS_FILE.is_file():
+        with open(LAYOUTS_FILE, "w", encoding="utf-8", newline="") as file:
+            csv.writer(file).writerow(HEADERS)
+
+    # Read via resource so talon reloads this script when the file changes
+    with resource.open(str(LAYOUTS_FILE), "r") as f:
+        rows = [[cell.strip() for cell in row] for row in csv.reader(f)]
+    return [row for row in rows[1:] if row]
+
+
+def load_layouts() -> dict[str, list[LayoutEntry]]:
+    # Positions come from window_snap's action, so they're resolved when a
+    # layout is used rather than while this module loads
+    layouts, errors = parse_layouts(layout_rows, actions.user.window_snap_positions())
+    for error in errors:
+        print(f'"{LAYOUTS_FILE}": {error}')
+    return layouts
+
+
+layout_rows = read_layout_rows()
+ctx.lists["self.window_layout"] = {row[0]: row[0] for row in layout_rows}
+
+
+def _find_app(apps_by_name: dict[str, ui.App], name: str) -> Optional[ui.App]:
+    if name in apps_by_name:
+        return apps_by_name[name]
+    lower = name.lower()
+    for app_name, application in apps_by_name.items():
+        if app_name.lower().startswith(lower):
+            return application
+    return None
+
+
+def _running_apps_by_name() -> dict[str, ui.App]:
+    apps_by_name = {}
+    for application in ui.apps(background=False):
+        apps_by_name.setdefault(application.name, application)
+        if app.platform == "windows":
+            apps_by_name.setdefault(application.exe.split(os.path.sep)[-1], application)
+    return apps_by_name
+
+
+def plan_layout(entries: list[LayoutEntry]) -> list[tuple[ui.Window, ui.Rect]]:
+    """Resolves every window and computes its target rect before anything is moved"""
+    apps_by_name = _running_apps_by_name()
+    sorted_screens = get_topology().screens
+    moves = []
+    for entry in entries:
+        application = _find_app(apps_by_name, entry.app_name)
+        if application is None:
+            continue
+        window = application.active_window
+        if window is None:
+            continue
+
+        if entry.screen_number is None:
+            screen = window.screen
+        else:
+            if not 1 <= entry.screen_number <= len(sorted_screens):
+                continue
+            screen = sorted_screens[entry.screen_number - 1]
+
+        rect = screen.visible_rect
+        pos = entry.position
+        moves.append(
+            (
+                window,
+                ui.Rect(
+                    rect.x + rect.width * pos.left,
+                    rect.y + rect.height * pos.top,
+                    rect.width * (pos.right - pos.left),
+                    rect.height * (pos.bottom - pos.top),
+                ),
+            )
+        )
+    return moves
+
+
+@mod.action_class
+class Actions:
+    def window_layout_apply(name: str):
+        """Moves every application in the named layout to its position in one pass"""
+        layouts = load_layouts()
+        if name not in layouts:
+            app.notify(f"Unknown window layout: {name}")
+            return
+        for window, rect in plan_layout(layouts[name]):
+            actions.user.move_window_to_rect(window, rect)
+
+    def window_layout_save(name: str):
+        """Saves the position of every visible application's active window as the named layout"""
+        rows = []
+        for application in ui.apps(background=False):
+            window = application.active_window
+            if window is None or window.rect.width == 0:
+                continue
+            screen = window.screen
+            rect, visible = window.rect, screen.visible_rect
+            position = RelativeScreenPos(
+                (rect.left - visible.left) / visible.width,
+                (rect.top - visible.top) / visible.height,
+                (rect.right - visible.left) / visible.width,
+                (rect.bot - visible.top) / visible.height,
+            )
+            screen_number = get_topology(screen).index_of(screen) + 1
+            rows.append(
+                [name, application.name, format_position(position), screen_number]
+            )
+
+        existing = [row for row in read_layout_rows() if row[0] != name]
+        with open(LAYOUTS_FILE, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(HEADERS)
+            writer.writerows(existing + rows)
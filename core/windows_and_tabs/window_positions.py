@@ -0,0 +1,63 @@
+"""Window positions, and the layouts built from them, independent of talon so they can be tested."""
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+
+class RelativeScreenPos:
+    """Represents a window position as a fraction of the screen."""
+
+    def __init__(self, left, top, right, bottom):
+        self.left = left
+        self.top = top
+        self.bottom = bottom
+        self.right = right
+
+
+@dataclass
+class LayoutEntry:
+    app_name: str
+    position: RelativeScreenPos
+    screen_number: Optional[int]
+
+
+def parse_position(
+    position: str, named_positions: Mapping[str, RelativeScreenPos]
+) -> RelativeScreenPos:
+    """A position name, or four fractions of the screen "left top right bottom". Raises ValueError otherwise."""
+    if position in named_positions:
+        return named_positions[position]
+    left, top, right, bottom = (float(x) for x in position.split())
+    return RelativeScreenPos(left, top, right, bottom)
+
+
+def format_position(position: RelativeScreenPos) -> str:
+    return " ".join(
+        f"{x:.4f}"
+        for x in (position.left, position.top, position.right, position.bottom)
+    )
+
+
+def parse_layouts(
+    rows: list[list[str]], named_positions: Mapping[str, RelativeScreenPos]
+) -> tuple[dict[str, list[LayoutEntry]], list[str]]:
+    """The entries of each layout in rows, and a message for every row that was skipped"""
+    layouts: dict[str, list[LayoutEntry]] = {}
+    errors = []
+    for row in rows:
+        if len(row) < 3:
+            errors.append(f"Expected at least three values in row: {row}")
+            continue
+        name, app_name, position = row[:3]
+        screen = row[3] if len(row) > 3 and row[3] else None
+        try:
+            entry = LayoutEntry(
+                app_name,
+                parse_position(position, named_positions),
+                int(screen) if screen is not None else None,
+            )
+        except ValueError:
+            errors.append(f"Invalid position or screen in row: {row}")
+            continue
+        layouts.setdefault(name, []).append(entry)
+    return layouts, errors
@@ -12,6 +12,8 @@ from typing import Optional
 
 from talon import Context, Module, actions, ui
 
+from .window_positions import RelativeScreenPos
+
 mod = Module()
 mod.list(
     "window_snap_positions",
@@ -199,16 +201,6 @@ def _snap_window_helper(window, pos):
     )
 
 
-class RelativeScreenPos:
-    """Represents a window position as a fraction of the screen."""
-
-    def __init__(self, left, top, right, bottom):
-        self.left = left
-        self.top = top
-        self.bottom = bottom
-        self.right = right
-
-
 _snap_positions = {
     # Halves
     # .---.---.     .-------.
@@ -310,6 +302,14 @@ class Actions:
         _bring_forward(window)
         _snap_window_helper(window, position)
 
+    def window_snap_positions() -> dict[str, RelativeScreenPos]:
+        """Get the predefined window positions by name, as in `user.window_snap_positions`."""
+        return dict(_snap_positions)
+
+    def move_window_to_rect(window: ui.Window, rect: ui.Rect):
+        """Move and resize a window to rect, in screen coordinates."""
+        _set_window_pos(window, rect.x, rect.y, rect.width, rect.height)
+
     def move_app_to_screen(app_name: str, screen_number: int):
         """Move a specific application to another screen."""
         window = _get_app_window(app_name)
@@ -1,5 +1,7 @@
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 mod.setting(
     "use_stdint_datatypes ",
@@ -13,123 +15,131 @@ ctx.matches = r"""
 code.language: c
 """
 
-ctx.lists["self.c_pointers"] = {
-    "pointer": "*",
-    "pointer to pointer": "**",
-}
-
-ctx.lists["self.stdint_signed"] = {
-    "signed": "",
-    "unsigned": "u",
-}
-
-ctx.lists["self.c_signed"] = {
-    "signed": "signed ",
-    "unsigned": "unsigned ",
-}
-
-ctx.lists["self.c_keywords"] = {
-    "static": "static",
-    "volatile": "volatile",
-    "register": "register",
-}
-
-ctx.lists["self.stdint_types"] = {
-    "character": "int8_t",
-    "char": "int8_t",
-    "short": "int16_t",
-    "long": "int32_t",
-    "long long": "int64_t",
-    "int": "int32_t",
-    "integer": "int32_t",
-    "void": "void",
-    "double": "double",
-    "struct": "struct",
-    "struck": "struct",
-    "num": "enum",
-    "union": "union",
-    "float": "float",
-}
-
-ctx.lists["self.c_types"] = {
-    "character": "char",
-    "char": "char",
-    "short": "short",
-    "long": "long",
-    "int": "int",
-    "integer": "int",
-    "void": "void",
-    "double": "double",
-    "struct": "struct",
-    "struck": "struct",
-    "num": "enum",
-    "union": "union",
-    "float": "float",
-}
-
-ctx.lists["user.code_libraries"] = {
-    "assert": "assert.h",
-    "type": "ctype.h",
-    "error": "errno.h",
-    "float": "float.h",
-    "limits": "limits.h",
-    "locale": "locale.h",
-    "math": "math.h",
-    "set jump": "setjmp.h",
-    "signal": "signal.h",
-    "arguments": "stdarg.h",
-    "definition": "stddef.h",
-    "input": "stdio.h",
-    "output": "stdio.h",
-    "library": "stdlib.h",
-    "string": "string.h",
-    "time": "time.h",
-    "standard int": "stdint.h",
-}
-
-ctx.lists["user.code_common_function"] = {
-    "mem copy": "memcpy",
-    "mem set": "memset",
-    "string cat": "strcat",
-    "stir cat": "strcat",
-    "stir en cat": "strncat",
-    "stir elle cat": "strlcat",
-    "stir copy": "strcpy",
-    "stir en copy": "strncpy",
-    "stir elle copy": "strlcpy",
-    "string char": "strchr",
-    "string dupe": "strdup",
-    "stir dupe": "strdup",
-    "stir comp": "strcmp",
-    "stir en comp": "strncmp",
-    "string len": "strlen",
-    "stir len": "strlen",
-    "is digit": "isdigit",
-    "get char": "getchar",
-    "print eff": "printf",
-    "es print eff": "sprintf",
-    "es en print eff": "sprintf",
-    "stir to int": "strtoint",
-    "stir to unsigned int": "strtouint",
-    "ay to eye": "atoi",
-    "em map": "mmap",
-    "ma map": "mmap",
-    "em un map": "munmap",
-    "size of": "sizeof",
-    "ef open": "fopen",
-    "ef write": "fwrite",
-    "ef read": "fread",
-    "ef close": "fclose",
-    "exit": "exit",
-    "signal": "signal",
-    "set jump": "setjmp",
-    "get op": "getopt",
-    "malloc": "malloc",
-    "see alloc": "calloc",
-    "alloc ah": "alloca",
-    "re alloc": "realloc",
-    "free": "free",
-}
+
+@language_packs.lists(ctx, "c")
+def c_lists():
+    lists = {}
+
+    lists["self.c_pointers"] = {
+        "pointer": "*",
+        "pointer to pointer": "**",
+    }
+
+    lists["self.stdint_signed"] = {
+        "signed": "",
+        "unsigned": "u",
+    }
+
+    lists["self.c_signed"] = {
+        "signed": "signed ",
+        "unsigned": "unsigned ",
+    }
+
+    lists["self.c_keywords"] = {
+        "static": "static",
+        "volatile": "volatile",
+        "register": "register",
+    }
+
+    lists["self.stdint_types"] = {
+        "character": "int8_t",
+        "char": "int8_t",
+        "short": "int16_t",
+        "long": "int32_t",
+        "long long": "int64_t",
+        "int": "int32_t",
+        "integer": "int32_t",
+        "void": "void",
+        "double": "double",
+        "struct": "struct",
+        "struck": "struct",
+        "num": "enum",
+        "union": "union",
+        "float": "float",
+    }
+
+    lists["self.c_types"] = {
+        "character": "char",
+        "char": "char",
+        "short": "short",
+        "long": "long",
+        "int": "int",
+        "integer": "int",
+        "void": "void",
+        "double": "double",
+        "struct": "struct",
+        "struck": "struct",
+        "num": "enum",
+        "union": "union",
+        "float": "float",
+    }
+
+    lists["user.code_libraries"] = {
+        "assert": "assert.h",
+        "type": "ctype.h",
+        "error": "errno.h",
+        "float": "float.h",
+        "limits": "limits.h",
+        "locale": "locale.h",
+        "math": "math.h",
+        "set jump": "setjmp.h",
+        "signal": "signal.h",
+        "arguments": "stdarg.h",
+        "definition": "stddef.h",
+        "input": "stdio.h",
+        "output": "stdio.h",
+        "library": "stdlib.h",
+        "string": "string.h",
+        "time": "time.h",
+        "standard int": "stdint.h",
+    }
+
+    lists["user.code_common_function"] = {
+        "mem copy": "memcpy",
+        "mem set": "memset",
+        "string cat": "strcat",
+        "stir cat": "strcat",
+        "stir en cat": "strncat",
+        "stir elle cat": "strlcat",
+        "stir copy": "strcpy",
+        "stir en copy": "strncpy",
+        "stir elle copy": "strlcpy",
+        "string char": "strchr",
+        "string dupe": "strdup",
+        "stir dupe": "strdup",
+        "stir comp": "strcmp",
+        "stir en comp": "strncmp",
+        "string len": "strlen",
+        "stir len": "strlen",
+        "is digit": "isdigit",
+        "get char": "getchar",
+        "print eff": "printf",
+        "es print eff": "sprintf",
+        "es en print eff": "sprintf",
+        "stir to int": "strtoint",
+        "stir to unsigned int": "strtouint",
+        "ay to eye": "atoi",
+        "em map": "mmap",
+        "ma map": "mmap",
+        "em un map": "munmap",
+        "size of": "sizeof",
+        "ef open": "fopen",
+        "ef write": "fwrite",
+        "ef read": "fread",
+        "ef close": "fclose",
+        "exit": "exit",
+        "signal": "signal",
+        "set jump": "setjmp",
+        "get op": "getopt",
+        "malloc": "malloc",
+        "see alloc": "calloc",
+        "alloc ah": "alloca",
+        "re alloc": "realloc",
+        "free": "free",
+    }
+
+    return lists
+
 
 mod.list("c_pointers", desc="Common C pointers")
 mod.list("c_signed", desc="Common C datatype signed modifiers")
@@ -1,14 +1,24 @@
 from talon import Context, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 ctx.matches = r"""
 code.language: csharp
 """
-ctx.lists["user.code_common_function"] = {
-    "integer": "int.TryParse",
-    "print": "Console.WriteLine",
-    "string": ".ToString",
-}
+
+
+@language_packs.lists(ctx, "csharp")
+def csharp_lists():
+    lists = {}
+
+    lists["user.code_common_function"] = {
+        "integer": "int.TryParse",
+        "print": "Console.WriteLine",
+        "string": ".ToString",
+    }
+
+    return lists
 
 
 @ctx.action_class("user")
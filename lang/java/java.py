@@ -1,91 +1,100 @@
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 mod = Module()
 ctx.matches = r"""
 code.language: java
 """
 
-# Primitive Types
-java_primitive_types = {
-    "boolean": "boolean",
-    "int": "int",
-    "float": "float",
-    "byte": "byte",
-    "double": "double",
-    "short": "short",
-    "long": "long",
-    "char": "char",
-    "void": "void",
-}
-
-# Java Boxed Types
-java_boxed_types = {
-    "Byte": "Byte",
-    "Integer": "Integer",
-    "Double": "Double",
-    "Short": "Short",
-    "Float": "Float",
-    "Long": "Long",
-    "Boolean": "Boolean",
-    "Character": "Character",
-    "Void": "Void",
-}
-
 mod.list("java_boxed_type", desc="Java Boxed Types")
-ctx.lists["self.java_boxed_type"] = java_boxed_types
-
-# Common Classes
-java_common_classes = {
-    "Object": "Object",
-    "string": "String",
-    "thread": "Thread",
-    "exception": "Exception",
-}
-
 mod.list("java_common_class", desc="Java Common Classes")
-ctx.lists["self.java_common_class"] = java_common_classes
-
-
-# Java Generic Data Structures
-java_generic_data_structures = {
-    # Interfaces
-    "set": "Set",
-    "list": "List",
-    "queue": "Queue",
-    "deque": "Deque",
-    "map": "Map",
-    # Classes
-    "hash set": "HashSet",
-    "array list": "ArrayList",
-    "hash map": "HashMap",
-}
-
-unboxed_types = java_primitive_types.copy()
-unboxed_types.update(java_common_classes)
-unboxed_types.update(java_generic_data_structures)
-
-ctx.lists["user.code_type"] = unboxed_types
-
 mod.list("java_generic_data_structure", desc="Java Generic Data Structures")
-ctx.lists["self.java_generic_data_structure"] = java_generic_data_structures
-
-# Java Modifies
-java_modifiers = {
-    "public": "public",
-    "private": "private",
-    "protected": "protected",
-    "static": "static",
-    "synchronized": "synchronized",
-    "volatile": "volatile",
-    "transient": "transient",
-    "abstract": "abstract",
-    "interface": "interface",
-    "final": "final",
-}
-
 mod.list("java_modifier", desc="Java Modifiers")
-ctx.lists["self.java_modifier"] = java_modifiers
+
+
+@language_packs.lists(ctx, "java")
+def java_lists():
+    lists = {}
+
+    # Primitive Types
+    java_primitive_types = {
+        "boolean": "boolean",
+        "int": "int",
+        "float": "float",
+        "byte": "byte",
+        "double": "double",
+        "short": "short",
+        "long": "long",
+        "char": "char",
+        "void": "void",
+    }
+
+    # Java Boxed Types
+    java_boxed_types = {
+        "Byte": "Byte",
+        "Integer": "Integer",
+        "Double": "Double",
+        "Short": "Short",
+        "Float": "Float",
+        "Long": "Long",
+        "Boolean": "Boolean",
+        "Character": "Character",
+        "Void": "Void",
+    }
+
+    lists["self.java_boxed_type"] = java_boxed_types
+
+    # Common Classes
+    java_common_classes = {
+        "Object": "Object",
+        "string": "String",
+        "thread": "Thread",
+        "exception": "Exception",
+    }
+
+    lists["self.java_common_class"] = java_common_classes
+
+    # Java Generic Data Structures
+    java_generic_data_structures = {
+        # Interfaces
+        "set": "Set",
+        "list": "List",
+        "queue": "Queue",
+        "deque": "Deque",
+        "map": "Map",
+        # Classes
+        "hash set": "HashSet",
+        "array list": "ArrayList",
+        "hash map": "HashMap",
+    }
+
+    unboxed_types = java_primitive_types.copy()
+    unboxed_types.update(java_common_classes)
+    unboxed_types.update(java_generic_data_structures)
+
+    lists["user.code_type"] = unboxed_types
+
+    lists["self.java_generic_data_structure"] = java_generic_data_structures
+
+    # Java Modifies
+    java_modifiers = {
+        "public": "public",
+        "private": "private",
+        "protected": "protected",
+        "static": "static",
+        "synchronized": "synchronized",
+        "volatile": "volatile",
+        "transient": "transient",
+        "abstract": "abstract",
+        "interface": "interface",
+        "final": "final",
+    }
+
+    lists["self.java_modifier"] = java_modifiers
+
+    return lists
 
 
 @ctx.action_class("user")
@@ -1,5 +1,7 @@
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 ctx.matches = r"""
@@ -9,69 +11,78 @@ code.language: javascriptreact
 code.language: typescriptreact
 """
 
-ctx.lists["user.code_common_function"] = {
-    "abs": "Math.abs",
-    "entries": "Object.entries",
-    "fetch": "fetch",
-    "floor": "Math.floor",
-    "from entries": "Object.fromEntries",
-    "keys": "Object.keys",
-    "log": "console.log",
-    "max": "Math.max",
-    "min": "Math.min",
-    "print": "console.log",
-    "round": "Math.round",
-    "values": "Object.values",
-}
-
 mod.list("code_common_member_function", "Function to use in a dotted chain, eg .foo()")
 
-ctx.lists["user.code_common_member_function"] = {
-    "catch": "catch",
-    "concat": "concat",
-    "filter": "filter",
-    "finally": "finally",
-    "find": "find",
-    "flat map": "flatMap",
-    "for each": "forEach",
-    "join": "join",
-    "includes": "includes",
-    "map": "map",
-    "pop": "pop",
-    "push": "push",
-    "reduce": "reduce",
-    "slice": "slice",
-    "some": "some",
-    "split": "split",
-    "substring": "substring",
-    "then": "then",
-}
-
-ctx.lists["user.code_keyword"] = {
-    "a sink": "async ",
-    "await": "await ",
-    "break": "break",
-    "class": "class ",
-    "const": "const ",
-    "continue": "continue",
-    "default": "default ",
-    "export": "export ",
-    "false": "false",
-    "function": "function ",
-    "import": "import ",
-    "let": "let ",
-    "new": "new ",
-    "null": "null",
-    "private": "private ",
-    "protected": "protected ",
-    "public": "public ",
-    "return": "return ",
-    "throw": "throw ",
-    "true": "true",
-    "try": "try ",
-    "undefined": "undefined",
-    "yield": "yield ",
-}
+
+@language_packs.lists(
+    ctx, "javascript", "typescript", "javascriptreact", "typescriptreact"
+)
+def javascript_lists():
+    lists = {}
+
+    lists["user.code_common_function"] = {
+        "abs": "Math.abs",
+        "entries": "Object.entries",
+        "fetch": "fetch",
+        "floor": "Math.floor",
+        "from entries": "Object.fromEntries",
+        "keys": "Object.keys",
+        "log": "console.log",
+        "max": "Math.max",
+        "min": "Math.min",
+        "print": "console.log",
+        "round": "Math.round",
+        "values": "Object.values",
+    }
+
+    lists["user.code_common_member_function"] = {
+        "catch": "catch",
+        "concat": "concat",
+        "filter": "filter",
+        "finally": "finally",
+        "find": "find",
+        "flat map": "flatMap",
+        "for each": "forEach",
+        "join": "join",
+        "includes": "includes",
+        "map": "map",
+        "pop": "pop",
+        "push": "push",
+        "reduce": "reduce",
+        "slice": "slice",
+        "some": "some",
+        "split": "split",
+        "substring": "substring",
+        "then": "then",
+    }
+
+    lists["user.code_keyword"] = {
+        "a sink": "async ",
+        "await": "await ",
+        "break": "break",
+        "class": "class ",
+        "const": "const ",
+        "continue": "continue",
+        "default": "default ",
+        "export": "export ",
+        "false": "false",
+        "function": "function ",
+        "import": "import ",
+        "let": "let ",
+        "new": "new ",
+        "null": "null",
+        "private": "private ",
+        "protected": "protected ",
+        "public": "public ",
+        "return": "return ",
+        "throw": "throw ",
+        "true": "true",
+        "try": "try ",
+        "undefined": "undefined",
+        "yield": "yield ",
+    }
+
+    return lists
 
 
 @ctx.action_class("user")
@@ -1,5 +1,7 @@
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 ctx.matches = r"""
@@ -14,67 +16,74 @@ mod.setting(
 )
 mod.tag("stylua", desc="Tag for stylua linting commands")
 
-ctx.lists["user.code_common_function"] = {
-    "to number": "tonumber",
-    "I pairs": "ipairs",
-    "print": "print",
-    "print F": "printf",
-    "type": "type",
-    "assert": "assert",
-    "get meta table": "getmetatable",
-    "set meta table": "setmetatable",
-    # io
-    "I O write": "io.write",
-    "I O read": "io.read",
-    "I O open": "io.open",
-    # string
-    "format": "string.format",
-    "string G find": "string.gfind",
-    "string find": "string.strfind",
-    "string len": "string.strlen",
-    "string upper": "string.strupper",
-    "string lower": "string.strlower",
-    "string sub": "string.strsub",
-    "string G sub": "string.gsub",
-    "string match": "string.match",
-    "string G match": "string.gmatch",
-    # table
-    "table unpack": "table.unpack",
-    "table insert": "table.insert",
-    "tabel get N": "table.getn",
-    "tabel sort": "table.sort",
-    # math
-    "math max": "math.max",
-    # json
-    "jason parse": "json.parse",
-    # http
-    "H T T P get": "http.get",
-    "web get": "http.get",
-    # os
-    "O S date": "os.date",
-    "O S time": "os.time",
-    "O S clock": "os.clock",
-    "O S rename": "os.rename",
-    "O S remove": "os.remove",
-    "O S getenv": "os.getenv",
-    "O S execute": "os.execute",
-}
-
-ctx.lists["user.code_libraries"] = {
-    "bit": "bit",
-    "I O": "io",
-    "string": "string",
-    "U T F eight": "utf8",
-    "table": "table",
-    "math": "math",
-    "O S": "os",
-    "debug": "debug",
-    "L F S": "lfs",
-    "socket": "socket",
-    "H T T P": "http",
-    "web": "http",
-    "jason": "json",
-}
+
+@language_packs.lists(ctx, "lua")
+def lua_lists():
+    lists = {}
+
+    lists["user.code_common_function"] = {
+        "to number": "tonumber",
+        "I pairs": "ipairs",
+        "print": "print",
+        "print F": "printf",
+        "type": "type",
+        "assert": "assert",
+        "get meta table": "getmetatable",
+        "set meta table": "setmetatable",
+        # io
+        "I O write": "io.write",
+        "I O read": "io.read",
+        "I O open": "io.open",
+        # string
+        "format": "string.format",
+        "string G find": "string.gfind",
+        "string find": "string.strfind",
+        "string len": "string.strlen",
+        "string upper": "string.strupper",
+        "string lower": "string.strlower",
+        "string sub": "string.strsub",
+        "string G sub": "string.gsub",
+        "string match": "string.match",
+        "string G match": "string.gmatch",
+        # table
+        "table unpack": "table.unpack",
+        "table insert": "table.insert",
+        "tabel get N": "table.getn",
+        "tabel sort": "table.sort",
+        # math
+        "math max": "math.max",
+        # json
+        "jason parse": "json.parse",
+        # http
+        "H T T P get": "http.get",
+        "web get": "http.get",
+        # os
+        "O S date": "os.date",
+        "O S time": "os.time",
+        "O S clock": "os.clock",
+        "O S rename": "os.rename",
+        "O S remove": "os.remove",
+        "O S getenv": "os.getenv",
+        "O S execute": "os.execute",
+    }
+
+    lists["user.code_libraries"] = {
+        "bit": "bit",
+        "I O": "io",
+        "string": "string",
+        "U T F eight": "utf8",
+        "table": "table",
+        "math": "math",
+        "O S": "os",
+        "debug": "debug",
+        "L F S": "lfs",
+        "socket": "socket",
+        "H T T P": "http",
+        "web": "http",
+        "jason": "json",
+    }
+
+    return lists
 
 
 @mod.capture(rule="{self.lua_functions}")
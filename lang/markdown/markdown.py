@@ -1,5 +1,7 @@
 from talon import Context, Module
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 
@@ -8,12 +10,20 @@ code.language: markdown
 """
 
 mod.list("markdown_code_block_language", desc="Languages for code blocks")
-ctx.lists["user.markdown_code_block_language"] = {
-    "typescript": "typescript",
-    "python": "python",
-    "code": "",
-    "ruby": "ruby",
-    "shell": "shell",
-    "bash": "bash",
-    "json": "json",
-}
+
+
+@language_packs.lists(ctx, "markdown")
+def markdown_lists():
+    lists = {}
+
+    lists["user.markdown_code_block_language"] = {
+        "typescript": "typescript",
+        "python": "python",
+        "code": "",
+        "ruby": "ruby",
+        "shell": "shell",
+        "bash": "bash",
+        "json": "json",
+    }
+
+    return lists
@@ -1,19 +1,28 @@
 from talon import Context, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 ctx.matches = r"""
 code.language: php
 """
 
-ctx.lists["user.code_type"] = {
-    "int": "int",
-    "float": "float",
-    "string": "string",
-    "bool": "bool",
-    "array": "array",
-    "null": "null",
-    "void": "void",
-}
+
+@language_packs.lists(ctx, "php")
+def php_lists():
+    lists = {}
+
+    lists["user.code_type"] = {
+        "int": "int",
+        "float": "float",
+        "string": "string",
+        "bool": "bool",
+        "array": "array",
+        "null": "null",
+        "void": "void",
+    }
+
+    return lists
 
 
 @ctx.action_class("user")
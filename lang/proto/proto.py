@@ -1,5 +1,7 @@
 from talon import Context, Module
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 
 ctx = Context()
@@ -7,20 +9,27 @@ ctx.matches = r"""
 code.language: protobuf
 """
 
-ctx.lists["user.code_type"] = {
-    "string": "string",
-    "bytes": "bytes",
-    "you sixty four": "uint64",
-    "you thirty two": "uint32",
-    "eye sixty four": "int64",
-    "eye thirty two": "int32",
-    "sin sixty four": "sint64",
-    "sin thirty two": "sint32",
-    "fixed sixty four": "fixed64",
-    "fixed thirty two": "fixed32",
-    "as fixed sixty four": "sfixed64",
-    "as fixed thirty two": "sfixed32",
-    "boolean": "bool",
-    "double": "double",
-    "float": "float",
-}
+
+@language_packs.lists(ctx, "protobuf")
+def proto_lists():
+    lists = {}
+
+    lists["user.code_type"] = {
+        "string": "string",
+        "bytes": "bytes",
+        "you sixty four": "uint64",
+        "you thirty two": "uint32",
+        "eye sixty four": "int64",
+        "eye thirty two": "int32",
+        "sin sixty four": "sint64",
+        "sin thirty two": "sint32",
+        "fixed sixty four": "fixed64",
+        "fixed thirty two": "fixed32",
+        "as fixed sixty four": "sfixed64",
+        "as fixed thirty two": "sfixed32",
+        "boolean": "bool",
+        "double": "double",
+        "float": "float",
+    }
+
+    return lists
@@ -2,148 +2,159 @@ import re
 
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 ctx.matches = r"""
 code.language: python
 """
-ctx.lists["user.code_common_function"] = {
-    "enumerate": "enumerate",
-    "integer": "int",
-    "length": "len",
-    "list": "list",
-    "print": "print",
-    "range": "range",
-    "set": "set",
-    "split": "split",
-    "string": "str",
-    "update": "update",
-}
-
-"""a set of fields used in python docstrings that will follow the
-reStructuredText format"""
-docstring_fields = {
-    "class": ":class:",
-    "function": ":func:",
-    "parameter": ":param:",
-    "raise": ":raise:",
-    "returns": ":return:",
-    "type": ":type:",
-    "return type": ":rtype:",
-    # these are sphinx-specific
-    "see also": ".. seealso:: ",
-    "notes": ".. notes:: ",
-    "warning": ".. warning:: ",
-    "todo": ".. todo:: ",
-}
 
 mod.list("python_docstring_fields", desc="python docstring fields")
-ctx.lists["user.python_docstring_fields"] = docstring_fields
-
-ctx.lists["user.code_type"] = {
-    "boolean": "bool",
-    "integer": "int",
-    "string": "str",
-    "none": "None",
-    "dick": "Dict",
-    "float": "float",
-    "any": "Any",
-    "tuple": "Tuple",
-    "union": "UnionAny",
-    "iterable": "Iterable",
-    "vector": "Vector",
-    "bytes": "bytes",
-    "sequence": "Sequence",
-    "callable": "Callable",
-    "list": "List",
-    "no return": "NoReturn",
-}
-
-ctx.lists["user.code_keyword"] = {
-    "break": "break",
-    "continue": "continue",
-    "class": "class ",
-    "return": "return ",
-    "import": "import ",
-    "null": "None",
-    "none": "None",
-    "true": "True",
-    "false": "False",
-    "yield": "yield ",
-    "from": "from ",
-}
-
-exception_list = [
-    "BaseException",
-    "SystemExit",
-    "KeyboardInterrupt",
-    "GeneratorExit",
-    "Exception",
-    "StopIteration",
-    "StopAsyncIteration",
-    "ArithmeticError",
-    "FloatingPointError",
-    "OverflowError",
-    "ZeroDivisionError",
-    "AssertionError",
-    "AttributeError",
-    "BufferError",
-    "EOFError",
-    "ImportError",
-    "ModuleNotFoundError",
-    "LookupError",
-    "IndexError",
-    "KeyError",
-    "MemoryError",
-    "NameError",
-    "UnboundLocalError",
-    "OSError",
-    "BlockingIOError",
-    "ChildProcessError",
-    "ConnectionError",
-    "BrokenPipeError",
-    "ConnectionAbortedError",
-    "ConnectionRefusedError",
-    "ConnectionResetError",
-    "FileExistsError",
-    "FileNotFoundError",
-    "InterruptedError",
-    "IsADirectoryError",
-    "NotADirectoryError",
-    "PermissionError",
-    "ProcessLookupError",
-    "TimeoutError",
-    "ReferenceError",
-    "RuntimeError",
-    "NotImplementedError",
-    "RecursionError",
-    "SyntaxError",
-    "IndentationError",
-    "TabError",
-    "SystemError",
-    "TypeError",
-    "ValueError",
-    "UnicodeError",
-    "UnicodeDecodeError",
-    "UnicodeEncodeError",
-    "UnicodeTranslateError",
-    "Warning",
-    "DeprecationWarning",
-    "PendingDeprecationWarning",
-    "RuntimeWarning",
-    "SyntaxWarning",
-    "UserWarning",
-    "FutureWarning",
-    "ImportWarning",
-    "UnicodeWarning",
-    "BytesWarning",
-    "ResourceWarning",
-]
 mod.list("python_exception", desc="python exceptions")
-ctx.lists["user.python_exception"] = {
-    " ".join(re.findall("[A-Z][^A-Z]*", exception)).lower(): exception
-    for exception in exception_list
-}
+
+
+@language_packs.lists(ctx, "python")
+def python_lists():
+    lists = {}
+
+    lists["user.code_common_function"] = {
+        "enumerate": "enumerate",
+        "integer": "int",
+        "length": "len",
+        "list": "list",
+        "print": "print",
+        "range": "range",
+        "set": "set",
+        "split": "split",
+        "string": "str",
+        "update": "update",
+    }
+
+    # a set of fields used in python docstrings that will follow the
+    # reStructuredText format
+    docstring_fields = {
+        "class": ":class:",
+        "function": ":func:",
+        "parameter": ":param:",
+        "raise": ":raise:",
+        "returns": ":return:",
+        "type": ":type:",
+        "return type": ":rtype:",
+        # these are sphinx-specific
+        "see also": ".. seealso:: ",
+        "notes": ".. notes:: ",
+        "warning": ".. warning:: ",
+        "todo": ".. todo:: ",
+    }
+
+    lists["user.python_docstring_fields"] = docstring_fields
+
+    lists["user.code_type"] = {
+        "boolean": "bool",
+        "integer": "int",
+        "string": "str",
+        "none": "None",
+        "dick": "Dict",
+        "float": "float",
+        "any": "Any",
+        "tuple": "Tuple",
+        "union": "UnionAny",
+        "iterable": "Iterable",
+        "vector": "Vector",
+        "bytes": "bytes",
+        "sequence": "Sequence",
+        "callable": "Callable",
+        "list": "List",
+        "no return": "NoReturn",
+    }
+
+    lists["user.code_keyword"] = {
+        "break": "break",
+        "continue": "continue",
+        "class": "class ",
+        "return": "return ",
+        "import": "import ",
+        "null": "None",
+        "none": "None",
+        "true": "True",
+        "false": "False",
+        "yield": "yield ",
+        "from": "from ",
+    }
+
+    exception_list = [
+        "BaseException",
+        "SystemExit",
+        "KeyboardInterrupt",
+        "GeneratorExit",
+        "Exception",
+        "StopIteration",
+        "StopAsyncIteration",
+        "ArithmeticError",
+        "FloatingPointError",
+        "OverflowError",
+        "ZeroDivisionError",
+        "AssertionError",
+        "AttributeError",
+        "BufferError",
+        "EOFError",
+        "ImportError",
+        "ModuleNotFoundError",
+        "LookupError",
+        "IndexError",
+        "KeyError",
+        "MemoryError",
+        "NameError",
+        "UnboundLocalError",
+        "OSError",
+        "BlockingIOError",
+        "ChildProcessError",
+        "ConnectionError",
+        "BrokenPipeError",
+        "ConnectionAbortedError",
+        "ConnectionRefusedError",
+        "ConnectionResetError",
+        "FileExistsError",
+        "FileNotFoundError",
+        "InterruptedError",
+        "IsADirectoryError",
+        "NotADirectoryError",
+        "PermissionError",
+        "ProcessLookupError",
+        "TimeoutError",
+        "ReferenceError",
+        "RuntimeError",
+        "NotImplementedError",
+        "RecursionError",
+        "SyntaxError",
+        "IndentationError",
+        "TabError",
+        "SystemError",
+        "TypeError",
+        "ValueError",
+        "UnicodeError",
+        "UnicodeDecodeError",
+        "UnicodeEncodeError",
+        "UnicodeTranslateError",
+        "Warning",
+        "DeprecationWarning",
+        "PendingDeprecationWarning",
+        "RuntimeWarning",
+        "SyntaxWarning",
+        "UserWarning",
+        "FutureWarning",
+        "ImportWarning",
+        "UnicodeWarning",
+        "BytesWarning",
+        "ResourceWarning",
+    ]
+    lists["user.python_exception"] = {
+        " ".join(re.findall("[A-Z][^A-Z]*", exception)).lower(): exception
+        for exception in exception_list
+    }
+
+    return lists
 
 
 @ctx.action_class("user")
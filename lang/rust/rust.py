@@ -2,6 +2,8 @@ from typing import Any, Callable, TypeVar
 
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 # rust specific grammar
 mod.list("code_type_modifier", desc="List of type modifiers for active language")
@@ -190,37 +192,47 @@ all_traits = {
 }
 
 
-# tag: libraries_gui
-ctx.lists["user.code_libraries"] = {
-    "eye oh": "std::io",
-    "file system": "std::fs",
-    "envy": "std::env",
-    "collections": "std::collections",
-}
+@language_packs.lists(ctx, "rust")
+def rust_lists():
+    lists = {}
 
-# tag: functions_common
-ctx.lists["user.code_common_function"] = {
-    "drop": "drop",
-    "catch unwind": "catch_unwind",
-    "iterator": "iter",
-    "into iterator": "into_iter",
-    "from iterator": "from_iter",
-    **all_macros,
-}
+    # tag: libraries_gui
+    lists["user.code_libraries"] = {
+        "eye oh": "std::io",
+        "file system": "std::fs",
+        "envy": "std::env",
+        "collections": "std::collections",
+    }
+
+    # tag: functions_common
+    lists["user.code_common_function"] = {
+        "drop": "drop",
+        "catch unwind": "catch_unwind",
+        "iterator": "iter",
+        "into iterator": "into_iter",
+        "from iterator": "from_iter",
+        **all_macros,
+    }
 
-# tag: functions
-ctx.lists["user.code_type"] = all_types
+    # tag: functions
+    lists["user.code_type"] = all_types
 
-# rust specific grammar
-ctx.lists["user.code_type_modifier"] = {
-    "mutable": "mut ",
-    "mute": "mut ",
-    "borrowed": "&",
-    "borrowed mutable": "&mut ",
-    "borrowed mute": "&mut ",
-    "mutable borrowed": "&mut ",
-    "mute borrowed": "&mut ",
-}
+    # rust specific grammar
+    lists["user.code_type_modifier"] = {
+        "mutable": "mut ",
+        "mute": "mut ",
+        "borrowed": "&",
+        "borrowed mutable": "&mut ",
+        "borrowed mute": "&mut ",
+        "mutable borrowed": "&mut ",
+        "mute borrowed": "&mut ",
+    }
+
+    lists["user.code_macros"] = all_macros
+
+    lists["user.code_trait"] = all_traits
+
+    return lists
 
 
 @ctx.capture("user.code_type", rule="[{user.code_type_modifier}] {user.code_type}")
@@ -229,11 +241,6 @@ def code_type(m) -> str:
     return "".join(m)
 
 
-ctx.lists["user.code_macros"] = all_macros
-
-ctx.lists["user.code_trait"] = all_traits
-
-
 @ctx.action_class("user")
 class UserActions:
     # tag: comment_line
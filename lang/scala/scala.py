@@ -1,87 +1,97 @@
 from talon import Context, Module, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 mod = Module()
 ctx.matches = r"""
 code.language: scala
 """
 
-# Scala Common Types
-scala_common_types = {
-    "boolean": "Boolean",
-    "int": "Int",
-    "float": "Float",
-    "byte": "Byte",
-    "double": "Double",
-    "short": "Short",
-    "long": "Long",
-    "char": "Char",
-    "unit": "Unit",
-    "any": "Any",
-    "any val": "AnyVal",
-    "string": "String",
-    "thread": "Thread",
-    "exception": "Exception",
-    "throwable": "Throwable",
-    "none": "None",
-    "success": "Success",
-    "failure": "Failure",
-}
-
-# Scala Common Generic Types
-scala_common_generic_types = {
-    "array": "Array",
-    "deck": "Deque",
-    "future": "Future",
-    "list": "List",
-    "map": "Map",
-    "nil": "Nil",
-    "option": "Option",
-    "queue": "Queue",
-    "seek": "Seq",
-    "set": "Set",
-    "some": "Some",
-    "stack": "Stack",
-    "try": "Try",
-}
-
-scala_types = scala_common_types.copy()
-scala_types.update(scala_common_generic_types)
-ctx.lists["user.code_type"] = scala_types
-
-# Scala Modifies
-scala_modifiers = {
-    "public": "public",
-    "private": "private",
-    "protected": "protected",
-}
-
 mod.list("scala_modifier", desc="Scala Modifiers")
-ctx.lists["user.scala_modifier"] = scala_modifiers
-
-scala_keywords = {
-    "abstract": "abstract",
-    "case class": "case class",
-    "def": "def",
-    "extends": "extends",
-    "implicit": "implicit",
-    "lazy val": "lazy val",
-    "new": "new",
-    "object": "object",
-    "override": "override",
-    "package": "package",
-    "sealed": "sealed",
-    "throw": "throw",
-    "trait": "trait",
-    "type": "type",
-    "val": "val",
-    "var": "var",
-    "with": "with",
-    "yield": "yield",
-}
-
 mod.list("scala_keyword", desc="Scala Keywords")
-ctx.lists["user.scala_keyword"] = scala_keywords
+
+
+@language_packs.lists(ctx, "scala")
+def scala_lists():
+    lists = {}
+
+    # Scala Common Types
+    scala_common_types = {
+        "boolean": "Boolean",
+        "int": "Int",
+        "float": "Float",
+        "byte": "Byte",
+        "double": "Double",
+        "short": "Short",
+        "long": "Long",
+        "char": "Char",
+        "unit": "Unit",
+        "any": "Any",
+        "any val": "AnyVal",
+        "string": "String",
+        "thread": "Thread",
+        "exception": "Exception",
+        "throwable": "Throwable",
+        "none": "None",
+        "success": "Success",
+        "failure": "Failure",
+    }
+
+    # Scala Common Generic Types
+    scala_common_generic_types = {
+        "array": "Array",
+        "deck": "Deque",
+        "future": "Future",
+        "list": "List",
+        "map": "Map",
+        "nil": "Nil",
+        "option": "Option",
+        "queue": "Queue",
+        "seek": "Seq",
+        "set": "Set",
+        "some": "Some",
+        "stack": "Stack",
+        "try": "Try",
+    }
+
+    scala_types = scala_common_types.copy()
+    scala_types.update(scala_common_generic_types)
+    lists["user.code_type"] = scala_types
+
+    # Scala Modifies
+    scala_modifiers = {
+        "public": "public",
+        "private": "private",
+        "protected": "protected",
+    }
+
+    lists["user.scala_modifier"] = scala_modifiers
+
+    scala_keywords = {
+        "abstract": "abstract",
+        "case class": "case class",
+        "def": "def",
+        "extends": "extends",
+        "implicit": "implicit",
+        "lazy val": "lazy val",
+        "new": "new",
+        "object": "object",
+        "override": "override",
+        "package": "package",
+        "sealed": "sealed",
+        "throw": "throw",
+        "trait": "trait",
+        "type": "type",
+        "val": "val",
+        "var": "var",
+        "with": "with",
+        "yield": "yield",
+    }
+
+    lists["user.scala_keyword"] = scala_keywords
+
+    return lists
 
 
 @ctx.action_class("user")
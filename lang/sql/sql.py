@@ -1,12 +1,21 @@
 from talon import Context, actions
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 ctx.matches = r"""
 code.language: sql
 """
 
-# these vary by dialect
-ctx.lists["user.code_common_function"] = {"count": "Count", "min": "Min", "max": "Max"}
+
+@language_packs.lists(ctx, "sql")
+def sql_lists():
+    lists = {}
+
+    # these vary by dialect
+    lists["user.code_common_function"] = {"count": "Count", "min": "Min", "max": "Max"}
+
+    return lists
 
 
 @ctx.action_class("user")
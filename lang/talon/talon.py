@@ -1,5 +1,8 @@
 from talon import Context, Module, actions, app, registry
 
+from ...core.create_spoken_forms import IncrementalSpokenForms
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 
@@ -33,16 +36,26 @@ mod.list("talon_modes")
 ctx.matches = r"""
 code.language: talon
 """
-ctx.lists["user.code_common_function"] = {
-    "insert": "insert",
-    "key": "key",
-    "print": "print",
-    "repeat": "repeat",
-}
 
 
-def on_update_decls(decls):
-    # todo modes?
+@language_packs.lists(ctx, "talon")
+def talon_lists():
+    lists = {}
+
+    lists["user.code_common_function"] = {
+        "insert": "insert",
+        "key": "key",
+        "print": "print",
+        "repeat": "repeat",
+    }
+
+    return lists
+
+
+# Spoken forms are only generated for names that are new since the last
+# update, and a list is only reassigned when its names actually changed.
+decls_spoken_forms = {
+    thing: IncrementalSpokenForms(generate_subsequences=False)
     for thing in [
         "actions",
         "lists",
@@ -52,13 +65,17 @@ def on_update_decls(decls):
         "settings",
         "scopes",
         "modes",
-    ]:
+    ]
+}
+
+
+def on_update_decls(decls):
+    # todo modes?
+    for thing, spoken_forms in decls_spoken_forms.items():
         l = getattr(decls, thing)
-        ctx_talon_lists.lists[
-            f"user.talon_{thing}"
-        ] = actions.user.create_spoken_forms_from_list(
-            l.keys(), generate_subsequences=False
-        )
+        talon_list, changed = spoken_forms.update(l.keys())
+        if changed:
+            ctx_talon_lists.lists[f"user.talon_{thing}"] = talon_list
         # print(
         #     "List: {} \n {}".format(thing, str(ctx_talon_lists.lists[f"user.talon_{thing}"]))
         # )
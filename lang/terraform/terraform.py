@@ -1,49 +1,59 @@
 from talon import Context, Module, actions
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 mod = Module()
 ctx.matches = r"""
 code.language: terraform
 """
 
-types = {
-    "string": "string",
-    "number": "number",
-    "bool": "bool",
-    "list": "list",
-    "map": "map",
-    "null": "null",
-}
-
-ctx.lists["user.code_type"] = types
-
-common_properties = {
-    "name": "name",
-    "type": "type",
-    "description": "description",
-    "default": "default",
-    "for each": "for_each",
-    "count": "count",
-    "prevent destroy": "prevent_destroy",
-    "nullable": "nullable",
-    "sensitive": "sensitive",
-    "depends on": "depends_on",
-    "provider": "provider",
-    "source": "source",
-}
-
 mod.list("terraform_common_property", desc="Terraform Modifier")
-ctx.lists["self.terraform_common_property"] = common_properties
+mod.list("terraform_module_block", desc="Simple Terraform Block")
 
-module_blocks = {
-    "variable": "variable",
-    "output": "output",
-    "provider": "provider",
-    "module": "module",
-}
 
-mod.list("terraform_module_block", desc="Simple Terraform Block")
-ctx.lists["self.terraform_module_block"] = module_blocks
+@language_packs.lists(ctx, "terraform")
+def terraform_lists():
+    lists = {}
+
+    types = {
+        "string": "string",
+        "number": "number",
+        "bool": "bool",
+        "list": "list",
+        "map": "map",
+        "null": "null",
+    }
+
+    lists["user.code_type"] = types
+
+    common_properties = {
+        "name": "name",
+        "type": "type",
+        "description": "description",
+        "default": "default",
+        "for each": "for_each",
+        "count": "count",
+        "prevent destroy": "prevent_destroy",
+        "nullable": "nullable",
+        "sensitive": "sensitive",
+        "depends on": "depends_on",
+        "provider": "provider",
+        "source": "source",
+    }
+
+    lists["self.terraform_common_property"] = common_properties
+
+    module_blocks = {
+        "variable": "variable",
+        "output": "output",
+        "provider": "provider",
+        "module": "module",
+    }
+
+    lists["self.terraform_module_block"] = module_blocks
+
+    return lists
 
 
 @mod.action_class
@@ -1,5 +1,7 @@
 from talon import Context, actions, settings
 
+from ...core.modes.language_packs import language_packs
+
 ctx = Context()
 ctx.matches = r"""
 code.language: typescript
@@ -8,15 +10,22 @@ code.language: typescriptreact
 mode: command
 """
 
-ctx.lists["user.code_type"] = {
-    "boolean": "boolean",
-    "integer": "int",
-    "string": "string",
-    "null": "null",
-    "undefined": "undefined",
-    "number": "number",
-    "any": "any",
-}
+
+@language_packs.lists(ctx, "typescript", "typescriptreact")
+def typescript_lists():
+    lists = {}
+
+    lists["user.code_type"] = {
+        "boolean": "boolean",
+        "integer": "int",
+        "string": "string",
+        "null": "null",
+        "undefined": "undefined",
+        "number": "number",
+        "any": "any",
+    }
+
+    return lists
 
 
 @ctx.action_class("user")
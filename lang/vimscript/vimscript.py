@@ -1,31 +1,41 @@
 from talon import Context, Module, actions
 
+from ...core.modes.language_packs import language_packs
+
 mod = Module()
 ctx = Context()
 ctx.matches = r"""
 code.language: vimscript
 """
 
-ctx.lists["self.vimscript_functions"] = {
-    "string len": "strlen",
-    "get line": "getline",
-    "set line": "setline",
-    "length": "len",
-}
-
-ctx.lists["self.vimscript_scope"] = {
-    "argument": "a:",
-    "arg": "a:",
-    "buffer": "b:",
-    "buf": "b:",
-    "window": "w:",
-    "win": "w:",
-    "tab": "t:",
-    "special": "v:",
-    "global": "g:",
-    "local": "l:",
-    "script local": "s:",
-}
+
+@language_packs.lists(ctx, "vimscript")
+def vimscript_lists():
+    lists = {}
+
+    lists["self.vimscript_functions"] = {
+        "string len": "strlen",
+        "get line": "getline",
+        "set line": "setline",
+        "length": "len",
+    }
+
+    lists["self.vimscript_scope"] = {
+        "argument": "a:",
+        "arg": "a:",
+        "buffer": "b:",
+        "buf": "b:",
+        "window": "w:",
+        "win": "w:",
+        "tab": "t:",
+        "special": "v:",
+        "global": "g:",
+        "local": "l:",
+        "script local": "s:",
+    }
+
+    return lists
+
 
 mod.list("vimscript_functions", desc="Standard built-in vimscript functions")
 mod.list("vimscript_scope", desc="vimscript scoping types for functions and variables")
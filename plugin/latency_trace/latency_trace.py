@@ -0,0 +1,99 @@
+from talon import Module, actions, imgui, speech_system
+
+from ...core.latency_trace import PhraseTrace, tracer
+
+mod = Module()
+setting_enabled = mod.setting(
+    "latency_trace",
+    type=bool,
+    default=False,
+    desc="Record how long each phrase and the traced steps within it take",
+)
+setting_spans = mod.setting(
+    "latency_trace_spans",
+    type=int,
+    default=5000,
+    desc="How many spans to keep for the percentiles",
+)
+setting_phrases = mod.setting(
+    "latency_trace_phrases",
+    type=int,
+    default=10,
+    desc="How many phrases to show in the latency trace timeline",
+)
+
+# Width of a whole phrase in the timeline, in characters
+TIMELINE_WIDTH = 40
+
+
+def pre_phrase(d):
+    tracer.enabled = setting_enabled.get()
+    if tracer.enabled:
+        tracer.resize(setting_spans.get(), setting_phrases.get())
+    tracer.begin_phrase(" ".join(d.get("text", [])))
+
+
+def post_phrase(_):
+    tracer.end_phrase()
+
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1000:7.1f}ms"
+
+
+def timeline_rows(phrase: PhraseTrace) -> list[str]:
+    total = phrase.seconds
+    rows = [f"{ms(total)}  {phrase.text}"]
+    for span in phrase.spans:
+        offset = round((span.start - phrase.start) / total * TIMELINE_WIDTH)
+        width = max(1, round(span.seconds / total * TIMELINE_WIDTH))
+        bar = " " * offset + "#" * width
+        rows.append(
+            f"{ms(span.seconds)}  |{bar:<{TIMELINE_WIDTH}}| {'  ' * span.depth}{span.name}"
+        )
+    return rows
+
+
+@imgui.open(y=0)
+def gui(gui: imgui.GUI):
+    gui.text("Latency trace")
+    if not tracer.enabled:
+        gui.text("Not recording, enable user.latency_trace")
+    gui.line()
+    for name, stats in list(tracer.percentiles().items())[:10]:
+        gui.text(
+            f"{name}: n={stats['count']} p50 {ms(stats['p50'])} p95 {ms(stats['p95'])} p99 {ms(stats['p99'])}"
+        )
+    gui.line()
+    # Most recent phrase first, skipping the one showing this window
+    for phrase in reversed(tracer.phrases):
+        if phrase.end is None:
+            continue
+        for row in timeline_rows(phrase):
+            gui.text(row)
+        gui.spacer()
+    if gui.button("Latency trace close"):
+        actions.user.latency_trace_hide()
+
+
+speech_system.register("pre:phrase", pre_phrase)
+speech_system.register("post:phrase", post_phrase)
+
+
+@mod.action_class
+class Actions:
+    def latency_trace_show():
+        """Shows the timeline and percentiles of the latency trace"""
+        gui.show()
+
+    def latency_trace_hide():
+        """Hides the latency trace"""
+        gui.hide()
+
+    def latency_trace_clear():
+        """Forgets all recorded phrases and spans"""
+        tracer.clear()
+
+    def latency_trace_stats() -> dict:
+        """Returns the count and p50, p95 and p99 seconds of each traced step. Whole phrases are under the name phrase."""
+        return tracer.percentiles()
@@ -7,6 +7,10 @@ from talon.ui import Rect
 
 canvas: Canvas = None
 current_mode = ""
+current_modes: set[str] = set()
+# Bumped whenever one of the settings below changes, so cached colors and paint
+# objects are rebuilt for the new settings
+settings_generation = 0
 mod = Module()
 
 setting_show = mod.setting(
@@ -98,19 +102,48 @@ def get_colors():
     return f"{color_mode}{color_alpha}", f"{color_gradient}"
 
 
+class PaintCache:
+    """
+    Colors, shader and image filter for the current mode and settings. They only
+    change when the mode, the settings or the canvas size do, so they are built
+    once and reused for every draw until then.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.color_mode = ""
+        self.color_gradient = ""
+        self.shader = None
+        self.imagefilter = None
+        self.draws = 0
+        self.rebuilds = 0
+
+    def get(self, x: float, y: float, radius: float) -> "PaintCache":
+        key = (current_mode, settings_generation, x, y, radius)
+        if key != self.key:
+            self.key = key
+            self.rebuilds += 1
+            self.color_mode, self.color_gradient = get_colors()
+            self.shader = skia.Shader.radial_gradient(
+                (x, y), radius, [self.color_mode, self.color_gradient]
+            )
+            self.imagefilter = ImageFilter.drop_shadow(1, 1, 1, 1, self.color_gradient)
+        return self
+
+
+paint_cache = PaintCache()
+
+
 def on_draw(c: SkiaCanvas):
-    color_mode, color_gradient = get_colors()
     x, y = c.rect.center.x, c.rect.center.y
     radius = c.rect.height / 2 - 2
+    paint = paint_cache.get(x, y, radius)
+    paint_cache.draws += 1
 
-    c.paint.shader = skia.Shader.radial_gradient(
-        (x, y), radius, [color_mode, color_gradient]
-    )
-
-    c.paint.imagefilter = ImageFilter.drop_shadow(1, 1, 1, 1, color_gradient)
-
+    c.paint.shader = paint.shader
+    c.paint.imagefilter = paint.imagefilter
     c.paint.style = c.paint.Style.FILL
-    c.paint.color = color_mode
+    c.paint.color = paint.color_mode
     c.draw_circle(x, y, radius)
 
 
@@ -159,8 +192,13 @@ def update_indicator():
 
 
 def on_update_contexts():
-    global current_mode
+    global current_mode, current_modes
     modes = scope.get("mode")
+    # Contexts update far more often than modes change
+    if modes == current_modes:
+        return
+    current_modes = set(modes)
+
     if "sleep" in modes:
         mode = "sleep"
     elif "dictation" in modes:
@@ -179,14 +217,23 @@ def on_update_contexts():
 
 
 def on_update_settings(updated_settings: set[str]):
+    global settings_generation
     if setting_paths & updated_settings:
+        settings_generation += 1
         update_indicator()
 
 
+@mod.action_class
+class Actions:
+    def mode_indicator_stats() -> dict:
+        """Returns how many times the mode indicator was drawn and how many times its paint was rebuilt"""
+        return {"draws": paint_cache.draws, "rebuilds": paint_cache.rebuilds}
+
+
 def on_ready():
     registry.register("update_contexts", on_update_contexts)
     registry.register("update_settings", on_update_settings)
-    ui.register("screen_change", lambda _: update_indicator)
+    ui.register("screen_change", lambda _: update_indicator())
 
 
 app.register("ready", on_ready)
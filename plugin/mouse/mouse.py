@@ -1,14 +1,19 @@
 import os
 
-from talon import Context, Module, actions, app, clip, cron, ctrl, imgui, ui
+from talon import Context, Module, actions, app, clip, ctrl, imgui, ui
 from talon_plugins import eye_zoom_mouse
 
+from .scroll_engine import (
+    gaze_scroll_curves,
+    scroll_engine,
+    scroll_stats,
+    window_under_pointer,
+)
+
 key = actions.key
 self = actions.self
 scroll_amount = 0
 click_job = None
-scroll_job = None
-gaze_job = None
 cancel_scroll_on_pop = True
 control_mouse_forced = False
 hiss_scroll_up = False
@@ -101,6 +106,18 @@ setting_mouse_wheel_horizontal_amount = mod.setting(
     default=40,
     desc="The amount to scroll left/right",
 )
+setting_mouse_scroll_tick_interval = mod.setting(
+    "mouse_scroll_tick_interval",
+    type=int,
+    default=16,
+    desc="Milliseconds between steps of continuous and gaze scrolling. Scroll speed does not depend on this",
+)
+setting_mouse_gaze_scroll_curve = mod.setting(
+    "mouse_gaze_scroll_curve",
+    type=str,
+    default="cubic",
+    desc="How gaze scroll speed grows with distance from the middle of the window. One of cubic, quadratic, linear or smoothstep",
+)
 
 continuous_scoll_mode = ""
 
@@ -167,9 +184,7 @@ class Actions:
         global continuous_scoll_mode
         continuous_scoll_mode = "scroll down continuous"
         mouse_scroll(setting_mouse_continuous_scroll_amount.get())()
-
-        if scroll_job is None:
-            start_scroll()
+        start_scroll()
 
         if setting_mouse_hide_mouse_gui.get() == 0:
             gui_wheel.show()
@@ -183,9 +198,8 @@ class Actions:
         global continuous_scoll_mode
         continuous_scoll_mode = "scroll up continuous"
         mouse_scroll(-setting_mouse_continuous_scroll_amount.get())()
+        start_scroll()
 
-        if scroll_job is None:
-            start_scroll()
         if setting_mouse_hide_mouse_gui.get() == 0:
             gui_wheel.show()
 
@@ -216,6 +230,10 @@ class Actions:
             actions.tracking.control_toggle(True)
             control_mouse_forced = True
 
+    def mouse_scroll_stats() -> dict:
+        """Returns counters for continuous and gaze scrolling: ticks, dropped ticks, scroll deltas and window lookups"""
+        return scroll_stats.as_dict()
+
     def copy_mouse_position():
         """Copy the current mouse position coordinates"""
         position = ctrl.mouse_pos()
@@ -286,9 +304,7 @@ def show_cursor_helper(show):
 @ctx.action_class("user")
 class UserActions:
     def noise_trigger_pop():
-        if setting_mouse_enable_pop_stops_scroll.get() >= 1 and (
-            gaze_job or scroll_job
-        ):
+        if setting_mouse_enable_pop_stops_scroll.get() >= 1 and scroll_engine.running:
             # Allow pop to stop scroll
             stop_scroll()
         else:
@@ -334,19 +350,24 @@ def mouse_scroll(amount):
     return scroll
 
 
-def scroll_continuous_helper():
-    global scroll_amount
+def scroll_continuous_helper(intervals: float) -> float:
     # print("scroll_continuous_helper")
     if scroll_amount and (eye_zoom_mouse.zoom_mouse.state == eye_zoom_mouse.STATE_IDLE):
-        actions.mouse_scroll(by_lines=False, y=int(scroll_amount / 10))
+        return scroll_amount / 10 * intervals
+    return 0
 
 
 def start_scroll():
-    global scroll_job
-    scroll_job = cron.interval("60ms", scroll_continuous_helper)
+    # Continuous scrolling takes over from gaze scrolling, but repeating it
+    # only changes scroll_amount
+    if scroll_engine.step is scroll_continuous_helper:
+        return
+    scroll_engine.start(
+        scroll_continuous_helper, setting_mouse_scroll_tick_interval.get()
+    )
 
 
-def gaze_scroll():
+def gaze_scroll(intervals: float) -> float:
     # print("gaze_scroll")
     if (
         eye_zoom_mouse.zoom_mouse.state == eye_zoom_mouse.STATE_IDLE
@@ -354,51 +375,37 @@ def gaze_scroll():
         x, y = ctrl.mouse_pos()
 
         # the rect for the window containing the mouse
-        rect = None
-
-        # on windows, check the active_window first since ui.windows() is not z-ordered
-        if app.platform == "windows" and ui.active_window().rect.contains(x, y):
-            rect = ui.active_window().rect
-        else:
-            windows = ui.windows()
-            for w in windows:
-                if w.rect.contains(x, y):
-                    rect = w.rect
-                    break
-
+        rect = window_under_pointer.find(x, y)
         if rect is None:
             # print("no window found!")
-            return
+            return 0
 
         midpoint = rect.y + rect.height / 2
-        amount = int(((y - midpoint) / (rect.height / 10)) ** 3)
-        actions.mouse_scroll(by_lines=False, y=amount)
+        offset = (y - midpoint) / (rect.height / 2)
+        curve = gaze_scroll_curves.get(
+            setting_mouse_gaze_scroll_curve.get(), gaze_scroll_curves["cubic"]
+        )
+        return curve(offset) * intervals
 
-    # print(f"gaze_scroll: {midpoint} {rect.height} {amount}")
+    return 0
 
 
 def stop_scroll():
-    global scroll_amount, scroll_job, gaze_job, continuous_scoll_mode
+    global scroll_amount, continuous_scoll_mode
     scroll_amount = 0
-    if scroll_job:
-        cron.cancel(scroll_job)
-
-    if gaze_job:
-        cron.cancel(gaze_job)
+    scroll_engine.stop()
 
     global control_mouse_forced
     if control_mouse_forced:
         actions.tracking.control_toggle(False)
         control_mouse_forced = False
 
-    scroll_job = None
-    gaze_job = None
     gui_wheel.hide()
 
     continuous_scoll_mode = ""
 
 
 def start_cursor_scrolling():
-    global scroll_job, gaze_job
     stop_scroll()
-    gaze_job = cron.interval("60ms", gaze_scroll)
+    window_under_pointer.invalidate()
+    scroll_engine.start(gaze_scroll, setting_mouse_scroll_tick_interval.get())
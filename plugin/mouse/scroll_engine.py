@@ -0,0 +1,158 @@
+import math
+import time
+from typing import Callable, Optional
+
+from talon import actions, app, cron, ui
+
+# The original scroll speeds were tuned for a 60ms tick, so scroll amounts are
+# expressed per 60ms and scaled by the time that actually elapsed between ticks.
+REFERENCE_INTERVAL_MS = 60
+
+# Never scale a single tick by more than this many intervals, so a long stall
+# (e.g. the system was busy) doesn't turn into one huge jump.
+MAX_TICK_CATCH_UP = 4
+
+
+def _smoothstep(n: float) -> float:
+    m = abs(n)
+    return math.copysign(3 * m**2 - 2 * m**3, n)
+
+
+# Gaze scroll acceleration curves. Each maps the pointer's offset from the
+# window's vertical midpoint, from -1 at the top edge to 1 at the bottom edge,
+# to pixels scrolled per 60ms. Other modules may add their own.
+gaze_scroll_curves: dict[str, Callable[[float], float]] = {
+    "cubic": lambda n: (5 * n) ** 3,
+    "quadratic": lambda n: 125 * n * abs(n),
+    "linear": lambda n: 125 * n,
+    "smoothstep": lambda n: 125 * _smoothstep(n),
+}
+
+
+class ScrollStats:
+    """Instrumentation counters for continuous and gaze scrolling"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.scroll_events = 0
+        self.total_delta = 0
+        self.window_lookups = 0
+        self.window_cache_hits = 0
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+def windows_top_down() -> list:
+    """Every window's rect, topmost first"""
+    rects = [w.rect for w in ui.windows()]
+    # on windows, check the active_window first since ui.windows() is not z-ordered
+    if app.platform == "windows":
+        rects.insert(0, ui.active_window().rect)
+    return rects
+
+
+class WindowUnderPointer:
+    """
+    Finds the rect of the topmost window under the pointer. The window rects are
+    listed once and reused until a window event might have changed them or
+    their order, so each tick only checks a list of rects.
+    """
+
+    def __init__(
+        self, stats: ScrollStats, windows: Callable[[], list] = windows_top_down
+    ):
+        self.stats = stats
+        self.windows = windows
+        self.rects: Optional[list] = None
+
+    def invalidate(self, *args):
+        self.rects = None
+
+    def find(self, x: float, y: float):
+        if self.rects is None:
+            self.stats.window_lookups += 1
+            self.rects = self.windows()
+        else:
+            self.stats.window_cache_hits += 1
+
+        for rect in self.rects:
+            if rect.contains(x, y):
+                return rect
+        return None
+
+
+class ScrollEngine:
+    """
+    Calls a step function on a fixed tick and scrolls by the number of pixels it
+    returns. The step function receives how many 60ms intervals elapsed since the
+    previous tick, so scroll speed doesn't depend on the tick rate. Fractions of a
+    pixel are carried over to the next tick.
+    """
+
+    def __init__(
+        self, stats: ScrollStats, clock: Callable[[], float] = time.perf_counter
+    ):
+        self.stats = stats
+        self.clock = clock
+        self.job = None
+        self.step: Optional[Callable[[float], float]] = None
+        self.interval_ms = REFERENCE_INTERVAL_MS
+        self.residual = 0.0
+        self.last_tick = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self.job is not None
+
+    def start(self, step: Callable[[float], float], interval_ms: int):
+        self.stop()
+        self.step = step
+        self.interval_ms = max(1, interval_ms)
+        self.residual = 0.0
+        self.last_tick = self.clock()
+        self.job = cron.interval(f"{self.interval_ms}ms", self._tick)
+
+    def stop(self):
+        if self.job is not None:
+            cron.cancel(self.job)
+        self.job = None
+        self.step = None
+        self.residual = 0.0
+
+    def _tick(self):
+        now = self.clock()
+        elapsed_ms = (now - self.last_tick) * 1000
+        self.last_tick = now
+
+        self.stats.ticks += 1
+        intervals = elapsed_ms / self.interval_ms
+        if intervals >= 1.5:
+            self.stats.dropped_ticks += round(intervals) - 1
+
+        elapsed_ms = min(elapsed_ms, MAX_TICK_CATCH_UP * self.interval_ms)
+        pixels = self.step(elapsed_ms / REFERENCE_INTERVAL_MS)
+        if not pixels:
+            return
+
+        self.residual += pixels
+        delta = int(self.residual)
+        if delta == 0:
+            return
+
+        self.residual -= delta
+        self.stats.scroll_events += 1
+        self.stats.total_delta += delta
+        actions.mouse_scroll(by_lines=False, y=delta)
+
+
+scroll_stats = ScrollStats()
+window_under_pointer = WindowUnderPointer(scroll_stats)
+scroll_engine = ScrollEngine(scroll_stats)
+
+for event in ("win_open", "win_close", "win_move", "win_resize", "win_focus"):
+    ui.register(event, window_under_pointer.invalidate)
@@ -5,6 +5,8 @@ from typing import Optional
 from talon import Context, Module, actions, app, clip, cron, screen, ui
 from talon.canvas import Canvas
 
+from .screenshot_writer import ScreenshotWriter
+
 mod = Module()
 
 default_folder = ""
@@ -19,6 +21,38 @@ screenshot_folder = mod.setting(
     default=default_folder,
     desc="Where to save screenshots. Note this folder must exist.",
 )
+screenshot_format = mod.setting(
+    "screenshot_format",
+    type=str,
+    default="png",
+    desc="Image format to save screenshots in. One of png, jpeg or webp.",
+)
+screenshot_quality = mod.setting(
+    "screenshot_quality",
+    type=int,
+    default=90,
+    desc="Quality from 0 to 100 used when saving screenshots in a lossy format (jpeg or webp).",
+)
+screenshot_notify = mod.setting(
+    "screenshot_notify",
+    type=bool,
+    default=False,
+    desc="Show a notification once each screenshot has been saved.",
+)
+
+# Encoding large captures can take hundreds of milliseconds, so it's done in the
+# background and the screenshot actions return as soon as the capture is taken
+writer = ScreenshotWriter()
+
+
+def on_screenshot_written(path: str, error: Optional[Exception]):
+    if error is not None:
+        app.notify(f"Failed to save screenshot: {error}")
+    elif screenshot_notify.get():
+        app.notify(f"Saved screenshot {os.path.basename(path)}")
+
+
+writer.add_listener(on_screenshot_written)
 
 
 @mod.action_class
@@ -67,8 +101,9 @@ class Actions:
         selected_screen = get_screen(screen_num)
         flash_rect(rect)
         img = screen.capture_rect(rect)
-        path = get_screenshot_path(title)
-        img.write_file(path)
+        fmt = screenshot_format.get()
+        path = get_screenshot_path(title, fmt)
+        writer.submit(img, path, fmt, screenshot_quality.get())
 
 
 def clipboard_rect(rect: ui.Rect):
@@ -77,11 +112,12 @@ def clipboard_rect(rect: ui.Rect):
     clip.set_image(img)
 
 
-def get_screenshot_path(title: str = ""):
+def get_screenshot_path(title: str = "", fmt: str = "png"):
     if title:
         title = f" - {title.replace('.', '_')}"
     date = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-    filename = f"Screenshot {date}{title}.png"
+    extension = "jpg" if fmt == "jpeg" else fmt
+    filename = f"Screenshot {date}{title}.{extension}"
     folder_path = screenshot_folder.get()
     path = os.path.expanduser(os.path.join(folder_path, filename))
     return os.path.normpath(path)
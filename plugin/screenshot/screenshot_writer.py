@@ -0,0 +1,101 @@
+import itertools
+import logging
+import queue
+import threading
+from typing import Callable, Optional
+
+from talon import cron
+
+# Called with the path and None on success, or the path and the exception if
+# encoding or writing failed
+ScreenshotListener = Callable[[str, Optional[Exception]], None]
+
+
+class ScreenshotWriter:
+    """
+    Encodes and writes captured images on background threads, so that taking a
+    screenshot doesn't block the action thread. Submitting blocks only when
+    max_pending images are already waiting, which bounds the memory held by
+    captures that haven't been written yet.
+
+    Threads exit after idle_seconds without work and are started again by the
+    next submit, so the writer of a reloaded module doesn't leave threads behind.
+    """
+
+    def __init__(
+        self, workers: int = 2, max_pending: int = 4, idle_seconds: float = 5.0
+    ):
+        self.workers = workers
+        self.idle_seconds = idle_seconds
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.listeners: list[ScreenshotListener] = []
+        self.threads: list[threading.Thread] = []
+        # Numbers this writer's threads. With the writer's id in their names too,
+        # threads can be told apart from those of a previous writer, or from
+        # idle ones that haven't exited yet.
+        self.thread_numbers = itertools.count()
+        self.lock = threading.Lock()
+
+    def add_listener(self, listener: ScreenshotListener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: ScreenshotListener):
+        self.listeners.remove(listener)
+
+    def submit(self, img, path: str, fmt: str = "png", quality: int = 100):
+        """Takes ownership of img, which must not be used by the caller afterwards"""
+        # Queue first, so a thread exiting because the queue was empty has
+        # already left self.threads and is replaced
+        self.queue.put((img, path, fmt, quality))
+        self._ensure_started()
+
+    def wait(self):
+        """Blocks until every submitted image has been written"""
+        self.queue.join()
+
+    def _ensure_started(self):
+        with self.lock:
+            for _ in range(len(self.threads), self.workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"screenshot-writer-{id(self):x}-{next(self.thread_numbers)}",
+                    daemon=True,
+                )
+                thread.start()
+                self.threads.append(thread)
+
+    def _run(self):
+        while True:
+            try:
+                img, path, fmt, quality = self.queue.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self.lock:
+                    if self.queue.empty():
+                        self.threads.remove(threading.current_thread())
+                        return
+                continue
+            error = None
+            try:
+                write_image(img, path, fmt, quality)
+            except Exception as e:
+                logging.error(f"Failed to write screenshot {path}: {e}")
+                error = e
+            finally:
+                self.queue.task_done()
+            self._notify(path, error)
+
+    def _notify(self, path: str, error: Optional[Exception]):
+        # Run listeners on talon's thread rather than the writer thread
+        for listener in list(self.listeners):
+            cron.after("0ms", lambda listener=listener: listener(path, error))
+
+
+def write_image(img, path: str, fmt: str, quality: int):
+    if fmt == "png":
+        img.write_file(path)
+        return
+
+    # Lossy formats need encoding explicitly to apply the quality setting
+    data = img.encode(fmt, quality)
+    with open(path, "wb") as f:
+        f.write(data)
@@ -3,6 +3,7 @@ from typing import Optional
 from talon import Context, Module, actions, settings, ui
 
 from .draft_ui import DraftManager
+from .draft_undo import UndoLog
 
 mod = Module()
 
@@ -45,6 +46,15 @@ setting_text_size = mod.setting(
     default=20,
     desc="Sets the size of the text used in the draft window",
 )
+setting_undo_max_bytes = mod.setting(
+    "draft_window_undo_max_bytes",
+    type=int,
+    default=1_000_000,
+    desc=(
+        "Maximum size of the changes kept in the draft window's undo history. "
+        "The oldest changes are forgotten first"
+    ),
+)
 
 
 draft_manager = DraftManager()
@@ -115,108 +125,91 @@ class UndoWorkaround:
     # to this class
     enable_workaround = True
 
-    # Stack of (text_value, selection) tuples representing the undo stack
-    undo_stack = []
-    # Stack of (text_value, selection) tuples representing the redo stack
-    redo_stack = []
-    # Used by the timer to check when the text has stopped changing
-    pending_undo = None
+    # Stores the differences between each debounced version of the text
+    undo_log = UndoLog()
 
-    # timer handle
+    # Whether changes are currently being logged
+    is_logging = False
+
+    # Handle for the debounce timer, which records the text once it has stopped
+    # changing
     timer_handle = None
 
     @classmethod
     def start_logger(cls, reset_undo_stack: bool):
         if reset_undo_stack:
-            cls.undo_stack = []
-            cls.redo_stack = []
+            cls.undo_log.reset()
 
         cls.stop_logger()
-        cls.timer_handle = cron.interval("500ms", cls._log_changes)
+        cls.undo_log.max_bytes = setting_undo_max_bytes.get()
+        cls.is_logging = True
+        cls._log_changes()
 
     @classmethod
     def stop_logger(cls):
-        if cls.timer_handle is not None:
-            cron.cancel(cls.timer_handle)
-        cls.timer_handle = None
-        cls.pending_undo = None
+        cls._cancel_timer()
+        cls.is_logging = False
 
     @classmethod
-    def perform_undo(cls):
-        if len(cls.undo_stack) == 0:
+    def on_change(cls):
+        """
+        Called by the draft manager whenever the text or selection changes. Restarts
+        the debounce timer so we only record once things have settled for 1s.
+        """
+
+        if not cls.is_logging:
             return
 
-        curr_text = draft_manager.area.value
-        curr_sel = (draft_manager.area.sel.left, draft_manager.area.sel.right)
-        text, sel = cls.undo_stack[-1]
-        if text == curr_text:
-            cls.undo_stack.pop()
-            if len(cls.undo_stack) == 0:
-                return
-
-            # Most of the time (unless user has only just finished updating) the
-            # top of the stack will have the same contents as the text area. In
-            # this case pop again to get a bit lower. We should never have the
-            # same text twice, hence we don't need a loop.
-            text, sel = cls.undo_stack[-1]
-
-        # Remember the current state in the redo stack
-        cls.redo_stack.append((curr_text, curr_sel))
-        draft_manager.area.value = text
-        draft_manager.area.sel = sel
+        cls._cancel_timer()
+        cls.timer_handle = cron.after("1s", cls._log_changes)
 
-        cls.pending_undo = (text, sel)
+    @classmethod
+    def perform_undo(cls):
+        cls._cancel_timer()
+        cls._apply(cls.undo_log.undo(*cls._current_state()))
 
     @classmethod
     def perform_redo(cls):
-        if len(cls.redo_stack) == 0:
-            return
+        cls._cancel_timer()
+        cls._apply(cls.undo_log.redo())
 
-        text, sel = cls.redo_stack.pop()
+    @classmethod
+    def _apply(cls, state):
+        if state is None:
+            return
 
+        text, sel = state
         draft_manager.area.value = text
         draft_manager.area.sel = sel
 
-        cls.pending_undo = (text, sel)
-        cls.undo_stack.append((text, sel))
+    @classmethod
+    def _cancel_timer(cls):
+        if cls.timer_handle is not None:
+            cron.cancel(cls.timer_handle)
+        cls.timer_handle = None
+
+    @staticmethod
+    def _current_state():
+        # Turn the Span into a tuple, because we can't == Spans
+        sel = draft_manager.area.sel
+        return draft_manager.area.value, (sel.left, sel.right)
 
     @classmethod
     def _log_changes(cls):
         """
-        If the text and cursor position hasn't changed for two interval iterations
-        (1s) and the undo stack doesn't match the current state, then add to the stack.
+        Records the current text and selection in the undo log. If only the
+        selection changed this just remembers the cursor position for the current
+        text.
         """
 
-        curr_val = draft_manager.area.value
-        # Turn the Span into a tuple, because we can't == Spans
-        curr_sel = (draft_manager.area.sel.left, draft_manager.area.sel.right)
-        curr_state = (curr_val, curr_sel)
-
-        state_stack_mismatch = (
-            len(cls.undo_stack) == 0
-            or
-            # Only want to update the undo stack if the value has changed, not just
-            # the selection
-            curr_state[0] != cls.undo_stack[-1][0]
-        )
-
-        if cls.pending_undo == curr_state and state_stack_mismatch:
-            cls.undo_stack.append(curr_state)
-            # Clear out the redo stack because we've changed the text
-            cls.redo_stack = []
-        elif cls.pending_undo != curr_state:
-            cls.pending_undo = curr_state
-        elif not state_stack_mismatch and len(cls.undo_stack) > 0:
-            # Remember the cursor position in the undo stack for the current text value
-            cls.undo_stack[-1] = (cls.undo_stack[-1][0], curr_sel)
-        else:
-            # The text area text is not changing, do nothing
-            pass
+        cls.timer_handle = None
+        cls.undo_log.record(*cls._current_state())
 
 
 if UndoWorkaround.enable_workaround:
     ctx_focused.action("edit.undo")(UndoWorkaround.perform_undo)
     ctx_focused.action("edit.redo")(UndoWorkaround.perform_redo)
+    draft_manager.register_change_listener(UndoWorkaround.on_change)
 
 
 @mod.action_class
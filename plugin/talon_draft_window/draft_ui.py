@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_left, bisect_right
 from typing import Optional
 
 from talon.experimental.textarea import (
@@ -11,7 +12,111 @@ from talon.experimental.textarea import (
 word_matcher = re.compile(r"([^\s]+)(\s*)")
 
 
-def calculate_text_anchors(text, cursor_position, anchor_labels=None):
+class WordSpanIndex:
+    """
+    Maintains the (start_word_index, end_word_index, last_space_index) span of every
+    word in a text. When the text changes only the words around the edited range are
+    rescanned, and the word at a position is found with a binary search.
+    """
+
+    def __init__(self, text=""):
+        self.text = ""
+        self.spans = []
+        self.update(text)
+
+    def update(self, text):
+        old = self.text
+        if text == old:
+            return
+
+        # Find the edited range, as the lengths of the unchanged prefix and suffix
+        prefix = _common_prefix_length(old, text)
+        suffix = _common_suffix_length(old, text, min(len(old), len(text)) - prefix)
+        old_edit_end = len(old) - suffix
+        delta = len(text) - len(old)
+
+        # Rescan from the word before the one touching the edit, since the edit may
+        # have joined it to the next word or changed its trailing whitespace
+        first = max(0, bisect_left(self.spans, prefix, key=lambda span: span[2]) - 1)
+        scan_start = self.spans[first][0] if first > 0 else 0
+
+        # Words starting after the edit are preceded by unchanged whitespace, so they
+        # are unaffected apart from being shifted
+        after = bisect_right(self.spans, old_edit_end, key=lambda span: span[0])
+        scan_end = (
+            self.spans[after][0] + delta if after < len(self.spans) else len(text)
+        )
+
+        rescanned = [
+            (match.start(), match.end() - len(match.group(2)), match.end())
+            for match in word_matcher.finditer(text, scan_start, scan_end)
+        ]
+        shifted = self.spans[after:]
+        if delta != 0:
+            shifted = [
+                (start + delta, word_end + delta, whitespace_end + delta)
+                for start, word_end, whitespace_end in shifted
+            ]
+
+        self.spans[first:] = rescanned + shifted
+        self.text = text
+
+    def word_index_at(self, position):
+        """
+        Index of the last word whose span (including trailing whitespace) contains
+        position, or None if there isn't one.
+        """
+
+        idx = bisect_right(self.spans, position, key=lambda span: span[0]) - 1
+        if idx < 0 or self.spans[idx][2] < position:
+            return None
+        return idx
+
+    def anchors(self, cursor_position, anchor_labels):
+        if len(self.spans) == 0:
+            return
+
+        cursor_idx = self.word_index_at(cursor_position) or 0
+
+        # Now work out what range of those matches are getting an anchor. The aim is
+        # to centre the anchors around the cursor position, but also to use all the
+        # anchors.
+        anchors_before_cursor = len(anchor_labels) // 2
+        anchor_start_idx = max(0, cursor_idx - anchors_before_cursor)
+        anchor_end_idx = min(len(self.spans), anchor_start_idx + len(anchor_labels))
+        anchor_start_idx = max(0, anchor_end_idx - len(anchor_labels))
+
+        # Now add anchors to the selected matches
+        for i, anchor in zip(range(anchor_start_idx, anchor_end_idx), anchor_labels):
+            word_start, word_end, whitespace_end = self.spans[i]
+            yield (anchor, word_start, word_end, whitespace_end)
+
+
+# These binary search using slice comparisons, which is much faster than comparing
+# character by character in python
+def _common_prefix_length(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(a, b, limit):
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def calculate_text_anchors(text, cursor_position, anchor_labels=None, word_index=None):
     """
     Produces an iterator of (anchor, start_word_index, end_word_index, last_space_index)
     tuples from the given text. Each tuple indicates a particular point you may want to
@@ -21,6 +126,8 @@ def calculate_text_anchors(text, cursor_position, anchor_labels=None):
     - cursor_position is the current position of the cursor, anchors will be placed around
       this.
     - anchor_labels is a list of characters you want to use for your labels.
+    - word_index is an optional WordSpanIndex, which will be updated to the given text
+      and reused rather than finding all the words again.
     - *index is just a character offset from the start of the string (e.g. the first character is at index 0)
     - end_word_index is the index of the character after the last one included in the
       anchor. That is, you can use it with a slice directly like [start:end]
@@ -28,29 +135,12 @@ def calculate_text_anchors(text, cursor_position, anchor_labels=None):
     """
     anchor_labels = anchor_labels or "abcdefghijklmnopqrstuvwxyz"
 
-    if len(text) == 0:
-        return []
-
-    # Find all the word spans
-    matches = []
-    cursor_idx = None
-    for match in word_matcher.finditer(text):
-        matches.append((match.start(), match.end() - len(match.group(2)), match.end()))
-        if matches[-1][0] <= cursor_position and matches[-1][2] >= cursor_position:
-            cursor_idx = len(matches) - 1
+    if word_index is None:
+        word_index = WordSpanIndex(text)
+    else:
+        word_index.update(text)
 
-    # Now work out what range of those matches are getting an anchor. The aim is
-    # to centre the anchors around the cursor position, but also to use all the
-    # anchors.
-    anchors_before_cursor = len(anchor_labels) // 2
-    anchor_start_idx = max(0, cursor_idx - anchors_before_cursor)
-    anchor_end_idx = min(len(matches), anchor_start_idx + len(anchor_labels))
-    anchor_start_idx = max(0, anchor_end_idx - len(anchor_labels))
-
-    # Now add anchors to the selected matches
-    for i, anchor in zip(range(anchor_start_idx, anchor_end_idx), anchor_labels):
-        word_start, word_end, whitespace_end = matches[i]
-        yield (anchor, word_start, word_end, whitespace_end)
+    return word_index.anchors(cursor_position, anchor_labels)
 
 
 class DraftManager:
@@ -62,6 +152,8 @@ class DraftManager:
         self.area = TextArea()
         self.area.title = "Talon Draft"
         self.area.value = ""
+        self.word_index = WordSpanIndex()
+        self.change_listeners = []
         self.area.register("label", self._update_labels)
         self.set_styling()
 
@@ -80,6 +172,14 @@ class DraftManager:
             theme_changes["label"] = label_color
         self.area.theme = area_theme(**theme_changes)
 
+    def register_change_listener(self, listener):
+        """
+        Registers a function to be called without arguments whenever the text or
+        selection changes
+        """
+
+        self.change_listeners.append(listener)
+
     def show(self, text: Optional[str] = None):
         """
         Show the window. If text is None then keep the old contents,
@@ -167,7 +267,7 @@ class DraftManager:
 
     def anchor_to_range(self, anchor):
         anchors_data = calculate_text_anchors(
-            self._get_visible_text(), self.area.sel.left
+            self._get_visible_text(), self.area.sel.left, word_index=self.word_index
         )
         for loop_anchor, start_index, end_index, last_space_index in anchors_data:
             if anchor == loop_anchor:
@@ -180,8 +280,12 @@ class DraftManager:
         Updates the position of the labels displayed on top of each word
         """
 
+        # The labels are updated whenever the text or selection changes
+        for listener in self.change_listeners:
+            listener()
+
         anchors_data = calculate_text_anchors(
-            self._get_visible_text(), self.area.sel.left
+            self._get_visible_text(), self.area.sel.left, word_index=self.word_index
         )
         return [
             (Span(start_index, end_index), anchor)
@@ -0,0 +1,124 @@
+from collections import deque
+from typing import NamedTuple, Optional
+
+from .draft_ui import _common_prefix_length, _common_suffix_length
+
+
+class TextDiff(NamedTuple):
+    """
+    A reversible change to the text: at start, old_text was replaced by new_text.
+    The selections are (left, right) tuples from before and after the change.
+    """
+
+    start: int
+    old_text: str
+    new_text: str
+    old_sel: tuple[int, int]
+    new_sel: tuple[int, int]
+
+    def size(self) -> int:
+        return len(self.old_text.encode("utf-8")) + len(self.new_text.encode("utf-8"))
+
+
+def diff_text(old: str, new: str) -> tuple[int, str, str]:
+    """
+    Trims the common prefix and suffix of old and new, returning the start of the
+    changed range and the changed parts of each.
+    """
+
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_suffix_length(old, new, min(len(old), len(new)) - prefix)
+    return prefix, old[prefix : len(old) - suffix], new[prefix : len(new) - suffix]
+
+
+class UndoLog:
+    """
+    Undo history which stores the differences between successive versions of the
+    text rather than full copies of it. Only the most recent version is kept in
+    full. The oldest changes are forgotten once the stored differences exceed
+    max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = 1_000_000):
+        self.max_bytes = max_bytes
+        self.undo_stack: deque[TextDiff] = deque()
+        self.redo_stack: list[TextDiff] = []
+        self.size = 0
+        self.text: Optional[str] = None
+        self.sel: Optional[tuple[int, int]] = None
+
+    def reset(self):
+        self.undo_stack.clear()
+        self.redo_stack = []
+        self.size = 0
+        self.text = None
+        self.sel = None
+
+    def record(self, text: str, sel: tuple[int, int]):
+        """
+        Records text as the latest version. If only the selection changed then
+        the selection for the latest version is updated instead.
+        """
+
+        if self.text is None:
+            self.text, self.sel = text, sel
+            return
+
+        if text == self.text:
+            # The latest change always leads to the current text, so remember the
+            # cursor position there too for redo
+            self.sel = sel
+            if len(self.undo_stack) > 0:
+                self.undo_stack[-1] = self.undo_stack[-1]._replace(new_sel=sel)
+            return
+
+        start, old_text, new_text = diff_text(self.text, text)
+        diff = TextDiff(start, old_text, new_text, self.sel, sel)
+        self.undo_stack.append(diff)
+        self.size += diff.size()
+        # We've changed the text, so we can't redo anymore
+        for redo_diff in self.redo_stack:
+            self.size -= redo_diff.size()
+        self.redo_stack = []
+        self.text, self.sel = text, sel
+        self._evict()
+
+    def undo(
+        self, curr_text: str, curr_sel: tuple[int, int]
+    ) -> Optional[tuple[str, tuple[int, int]]]:
+        """
+        Returns the previous version of the text and its selection, or None if
+        there isn't one. Changes since the last recorded version are recorded first
+        so that they can be redone.
+        """
+
+        self.record(curr_text, curr_sel)
+        if len(self.undo_stack) == 0:
+            return None
+
+        diff = self.undo_stack.pop()
+        self.redo_stack.append(diff)
+        end = diff.start + len(diff.new_text)
+        self.text = self.text[: diff.start] + diff.old_text + self.text[end:]
+        self.sel = diff.old_sel
+        return self.text, self.sel
+
+    def redo(self) -> Optional[tuple[str, tuple[int, int]]]:
+        """
+        Returns the version of the text before the last undo and its selection,
+        or None if there isn't one.
+        """
+
+        if len(self.redo_stack) == 0:
+            return None
+
+        diff = self.redo_stack.pop()
+        self.undo_stack.append(diff)
+        end = diff.start + len(diff.old_text)
+        self.text = self.text[: diff.start] + diff.new_text + self.text[end:]
+        self.sel = diff.new_sel
+        return self.text, self.sel
+
+    def _evict(self):
+        while self.size > self.max_bytes and len(self.undo_stack) > 0:
+            self.size -= self.undo_stack.popleft().size()
@@ -5,7 +5,9 @@ if hasattr(talon, "test_mode"):
 
     pass
 
-    from .draft_ui import calculate_text_anchors
+    import random
+
+    from .draft_ui import WordSpanIndex, calculate_text_anchors, word_matcher
 
     def test_finds_anchors():
         examples = [
@@ -54,3 +56,33 @@ if hasattr(talon, "test_mode"):
 
             # Then it matches what we expect
             assert result == expected, text
+
+    def test_word_index_matches_full_scan_after_edits():
+        rng = random.Random(1)
+        pieces = ["word", "a", " ", "  ", "\n", "x-y", "longer", "\t "]
+        text = "the quick brown fox"
+        index = WordSpanIndex(text)
+        for _ in range(500):
+            # Given a random edit
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + 6))
+            insertion = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 3)))
+            text = text[:start] + insertion + text[end:]
+
+            # When we update the index incrementally
+            index.update(text)
+
+            # Then it matches scanning the whole text
+            expected = [
+                (m.start(), m.end() - len(m.group(2)), m.end())
+                for m in word_matcher.finditer(text)
+            ]
+            assert index.spans == expected, text
+
+    def test_word_index_finds_cursor_word():
+        index = WordSpanIndex("  two words")
+
+        assert index.word_index_at(0) is None
+        assert index.word_index_at(2) == 0
+        assert index.word_index_at(6) == 1
+        assert index.word_index_at(11) == 1
@@ -0,0 +1,75 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from .draft_undo import UndoLog, diff_text
+
+    def test_diff_text():
+        examples = [
+            ("hello world", "hello there world", (6, "", "there ")),
+            ("hello world", "hello", (5, " world", "")),
+            ("aaa", "aaaa", (3, "", "a")),
+            ("", "new", (0, "", "new")),
+            ("same", "same", (4, "", "")),
+        ]
+        for old, new, expected in examples:
+            assert diff_text(old, new) == expected, (old, new)
+
+    def test_undo_and_redo():
+        log = UndoLog()
+        log.record("one", (3, 3))
+        log.record("one two", (7, 7))
+        log.record("one two three", (13, 13))
+
+        assert log.undo("one two three", (13, 13)) == ("one two", (7, 7))
+        assert log.undo("one two", (7, 7)) == ("one", (3, 3))
+        assert log.undo("one", (3, 3)) is None
+        assert log.redo() == ("one two", (7, 7))
+        assert log.redo() == ("one two three", (13, 13))
+        assert log.redo() is None
+
+    def test_undo_includes_unrecorded_changes():
+        log = UndoLog()
+        log.record("one", (3, 3))
+
+        # Text changed since the last record, undo goes back to the recorded text
+        assert log.undo("one two", (7, 7)) == ("one", (3, 3))
+        assert log.redo() == ("one two", (7, 7))
+
+    def test_recording_clears_redo():
+        log = UndoLog()
+        log.record("one", (3, 3))
+        log.record("one two", (7, 7))
+        log.undo("one two", (7, 7))
+
+        log.record("one three", (9, 9))
+
+        assert log.redo() is None
+        assert log.undo("one three", (9, 9)) == ("one", (3, 3))
+
+    def test_selection_only_changes_update_the_cursor():
+        log = UndoLog()
+        log.record("one", (3, 3))
+        log.record("one two", (7, 7))
+        log.record("one two", (0, 3))
+
+        log.undo("one two", (0, 3))
+
+        assert log.redo() == ("one two", (0, 3))
+
+    def test_oldest_changes_are_evicted():
+        log = UndoLog(max_bytes=100)
+        text = "x" * 50_000
+        log.record(text, (0, 0))
+        for i in range(1000):
+            text = text[:i] + "y" + text[i + 1 :]
+            log.record(text, (i, i))
+
+        # Each change only stores the two changed characters
+        assert log.size <= 100
+        assert len(log.undo_stack) == 50
+        for _ in range(50):
+            text, _ = log.undo(text, (0, 0))
+        assert text == "y" * 950 + "x" * 49_050
+        assert log.undo(text, (0, 0)) is None
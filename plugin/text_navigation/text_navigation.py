@@ -1,8 +1,12 @@
 import itertools
 import re
+from collections import deque
+from functools import lru_cache
 
 from talon import Context, Module, actions
 
+from .text_window import TextWindow
+
 ctx = Context()
 mod = Module()
 
@@ -57,16 +61,22 @@ navigation_target_names = {
 ctx.lists["self.navigation_target_name"] = navigation_target_names
 
 
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compiles pattern, shared by all the navigation entry points so repeated targets aren't recompiled"""
+    return re.compile(pattern, flags)
+
+
 @mod.capture(
     rule="<user.any_alphanumeric_key> | {user.navigation_target_name} | phrase <user.text>"
 )
 def navigation_target(m) -> re.Pattern:
     """A target to navigate to. Returns a regular expression."""
     if hasattr(m, "any_alphanumeric_key"):
-        return re.compile(re.escape(m.any_alphanumeric_key), re.IGNORECASE)
+        return compile_pattern(re.escape(m.any_alphanumeric_key), re.IGNORECASE)
     if hasattr(m, "navigation_target_name"):
-        return re.compile(m.navigation_target_name)
-    return re.compile(re.escape(m.text), re.IGNORECASE)
+        return compile_pattern(m.navigation_target_name)
+    return compile_pattern(re.escape(m.text), re.IGNORECASE)
 
 
 @mod.action_class
@@ -81,7 +91,7 @@ class Actions:
     ):
         """Navigate in `direction` to the occurrence_number-th time that `regex` occurs, then execute `navigation_action` at the given `before_or_after` position."""
         direction = direction.upper()
-        navigation_target_name = re.compile(
+        navigation_target_name = compile_pattern(
             navigation_target_names["word"]
             if (navigation_target_name == "DEFAULT")
             else navigation_target_name
@@ -104,7 +114,7 @@ class Actions:
         occurrence_number: int,
     ):
         """Like user.navigation, but to a named target."""
-        r = re.compile(navigation_target_names[navigation_target_name])
+        r = compile_pattern(navigation_target_names[navigation_target_name])
         actions.user.navigation(
             navigation_action,
             direction,
@@ -129,50 +139,62 @@ def get_text_right():
     return text
 
 
-def get_text_up():
-    actions.edit.up()
-    actions.edit.line_end()
-    for j in range(0, text_navigation_max_line_search.get()):
-        actions.edit.extend_up()
+def fetch_text_above(lines: int) -> str:
+    # The anchor is the end of the line above the cursor
+    actions.user.move_cursor("up", lines, True)
     actions.edit.extend_line_start()
     text = actions.edit.selected_text()
     actions.edit.right()
     return text
 
 
-def get_text_down():
-    actions.edit.down()
-    actions.edit.line_start()
-    for j in range(0, text_navigation_max_line_search.get()):
-        actions.edit.extend_down()
+def fetch_text_below(lines: int) -> str:
+    # The anchor is the start of the line below the cursor
+    actions.user.move_cursor("down", lines, True)
     actions.edit.extend_line_end()
     text = actions.edit.selected_text()
     actions.edit.left()
     return text
 
 
+def text_window_left() -> TextWindow:
+    return TextWindow(lambda lines: get_text_left(), 0)
+
+
+def text_window_right() -> TextWindow:
+    return TextWindow(lambda lines: get_text_right(), 0)
+
+
+def text_window_up() -> TextWindow:
+    actions.edit.up()
+    actions.edit.line_end()
+    return TextWindow(fetch_text_above, text_navigation_max_line_search.get())
+
+
+def text_window_down() -> TextWindow:
+    actions.edit.down()
+    actions.edit.line_start()
+    return TextWindow(fetch_text_below, text_navigation_max_line_search.get())
+
+
 def get_current_selection_size():
     return len(actions.edit.selected_text())
 
 
 def go_right(i):
-    for j in range(0, i):
-        actions.edit.right()
+    actions.user.move_cursor("right", i)
 
 
 def go_left(i):
-    for j in range(0, i):
-        actions.edit.left()
+    actions.user.move_cursor("left", i)
 
 
 def extend_left(i):
-    for j in range(0, i):
-        actions.edit.extend_left()
+    actions.user.move_cursor("left", i, True)
 
 
 def extend_right(i):
-    for j in range(0, i):
-        actions.edit.extend_right()
+    actions.user.move_cursor("right", i, True)
 
 
 def select(direction, start, end, length):
@@ -195,12 +217,20 @@ def navigate_left(
     current_selection_length = get_current_selection_size()
     if current_selection_length > 0:
         actions.edit.right()
-    text = get_text_left() if direction == "LEFT" else get_text_up()
+    window = text_window_left() if direction == "LEFT" else text_window_up()
     # only search in the text that was not selected
-    subtext = (
-        text if current_selection_length <= 0 else text[:-current_selection_length]
+    match = window.search(
+        lambda text: match_backwards(
+            regex,
+            occurrence_number,
+            (
+                text
+                if current_selection_length <= 0
+                else text[:-current_selection_length]
+            ),
+        )
     )
-    match = match_backwards(regex, occurrence_number, subtext)
+    text = window.text
     if match is None:
         # put back the old selection, if the search failed
         extend_left(current_selection_length)
@@ -229,11 +259,15 @@ def navigate_right(
     current_selection_length = get_current_selection_size()
     if current_selection_length > 0:
         actions.edit.left()
-    text = get_text_right() if direction == "RIGHT" else get_text_down()
+    window = text_window_right() if direction == "RIGHT" else text_window_down()
     # only search in the text that was not selected
-    sub_text = text[current_selection_length:]
     # pick the next interrater, Skip n number of occurrences, get an iterator given the Regex
-    match = match_forward(regex, occurrence_number, sub_text)
+    match = window.search(
+        lambda text: match_forward(
+            regex, occurrence_number, text[current_selection_length:]
+        )
+    )
+    text = window.text
     if match is None:
         # put back the old selection, if the search failed
         extend_right(current_selection_length)
@@ -338,11 +372,14 @@ def handle_extend(before_or_after, direction, start, end, length):
 
 
 def match_backwards(regex, occurrence_number, subtext):
-    try:
-        match = list(regex.finditer(subtext))[-occurrence_number]
-        return match
-    except IndexError:
-        return
+    # Matches have to be found left to right, since that decides where
+    # overlapping candidates start, but only the last occurrence_number are kept
+    if occurrence_number < 1:
+        return None
+    last_matches = deque(regex.finditer(subtext), maxlen=occurrence_number)
+    if len(last_matches) < occurrence_number:
+        return None
+    return last_matches[0]
 
 
 def match_forward(regex, occurrence_number, sub_text):
@@ -0,0 +1,53 @@
+import re
+from typing import Callable, Iterator, Optional
+
+# Fetches the text between a fixed anchor and the given number of lines away
+# from it. 0 lines means just the rest of the anchor's line.
+TextFetcher = Callable[[int], str]
+
+# Every fetch is a select and copy round-trip, which costs more than copying a
+# few extra lines, so windows up to this size are fetched all at once. Larger
+# ones start with a chunk this size and grow by GROWTH_FACTOR.
+FIRST_CHUNK_LINES = 20
+GROWTH_FACTOR = 4
+
+
+class TextWindow:
+    """
+    Text on one side of the cursor, fetched in chunks that grow only while a
+    search hasn't found what it is looking for yet. Reading text means
+    selecting and copying it, which gets slower the more there is, so a search
+    in a large window that finds its match nearby never reads all max_lines.
+
+    Each chunk is fetched from the same anchor and contains the previous one. A
+    search runs on the whole chunk, so results are the same as searching all
+    max_lines at once, as long as the pattern doesn't match across line breaks.
+    """
+
+    def __init__(self, fetch: TextFetcher, max_lines: int):
+        self.fetch = fetch
+        self.max_lines = max_lines
+        self.text = ""
+        self.fetches = 0
+
+    def chunks(self) -> Iterator[str]:
+        lines = min(FIRST_CHUNK_LINES, self.max_lines)
+        while True:
+            text = self.fetch(lines)
+            self.fetches += 1
+            grew = len(text) > len(self.text) or self.fetches == 1
+            self.text = text
+            yield text
+            # Stop at the maximum or once a fetch didn't get any further, which
+            # means it reached the start or end of the document
+            if lines >= self.max_lines or not grew:
+                return
+            lines = min(GROWTH_FACTOR * lines, self.max_lines)
+
+    def search(self, find: Callable[[str], Optional[re.Match]]) -> Optional[re.Match]:
+        """Fetches more text until find returns a match for it. self.text is the text it matched in."""
+        for text in self.chunks():
+            match = find(text)
+            if match is not None:
+                return match
+        return None
@@ -2,6 +2,14 @@ from urllib.parse import urlparse
 
 from talon import Context, Module, actions, app
 
+from ...core.settle import focused_element, settle_after
+
+# The fixed delay these waits replaced. It's the longest we wait for the
+# browser to react to a key press, and how long we sleep where the focused
+# element can't be read. Browsers usually react much sooner, and we continue as
+# soon as they do.
+SETTLE_TIMEOUT = 0.18
+
 mod = Module()
 ctx = Context()
 ctx.matches = r"""
@@ -25,6 +33,21 @@ class Actions:
         """Open the url in the address bar in a new tab"""
         actions.key("alt-enter")
 
+    def browser_focus_address_settled(delay: float = SETTLE_TIMEOUT):
+        """Focus the address bar and wait until the browser has moved focus there. Waits at most delay seconds, the fixed delay this replaces, and exactly that where focus can't be read."""
+        settle_after(
+            actions.browser.focus_address, focused_element, delay, fallback=delay
+        )
+
+    def browser_escape_address_settled():
+        """Leave the address bar and wait until the browser has moved focus away"""
+        settle_after(
+            lambda: actions.key("esc:2"),
+            focused_element,
+            SETTLE_TIMEOUT,
+            fallback=SETTLE_TIMEOUT,
+        )
+
 
 @ctx.action_class("user")
 class UserActions:
@@ -42,12 +65,10 @@ class UserActions:
             actions.key("alt-9")
 
     def tab_duplicate():
-        actions.browser.focus_address()
-        actions.sleep("180ms")
+        actions.user.browser_focus_address_settled()
         possibly_edited_url = actions.edit.selected_text()
         actions.key("esc:2")
-        actions.browser.focus_address()
-        actions.sleep("180ms")
+        actions.user.browser_focus_address_settled()
         url_address = actions.edit.selected_text()
         if possibly_edited_url == url_address:
             actions.user.browser_open_address_in_new_tab()
@@ -98,10 +119,8 @@ class BrowserActions:
         actions.key("alt-d")
 
     def focus_page():
-        actions.browser.focus_address()
-        actions.sleep("180ms")
-        actions.key("esc:2")
-        actions.sleep("180ms")
+        actions.user.browser_focus_address_settled()
+        actions.user.browser_escape_address_settled()
         actions.key("esc:2")
 
     def focus_search():
@@ -111,8 +130,7 @@ class BrowserActions:
         actions.key("ctrl-n")
 
     def go(url: str):
-        actions.browser.focus_address()
-        actions.sleep("50ms")
+        actions.user.browser_focus_address_settled(0.05)
         actions.insert(url)
         actions.key("enter")
 
@@ -34,6 +34,13 @@ class EditActions:
 
 @ctx.action_class("user")
 class Actions:
+    def movement_key(direction: str, extend: bool) -> str:
+        if not extend and direction == "word_left":
+            return "alt-b"
+        if not extend and direction == "word_right":
+            return "alt-f"
+        return actions.next(direction, extend)
+
     def cut_line():
         actions.edit.line_start()
         actions.key("ctrl-k")
@@ -0,0 +1,414 @@
+"""
+Micro-benchmarks for the text processing that runs on every phrase or list
+update, run against the talon stubs in test/stubs.
+
+    python test/benchmarks.py --output results.json
+    python test/benchmarks.py --baseline results.json --threshold 0.25
+
+With --baseline, any benchmark that got slower by more than its threshold is
+reported and the exit status is 1. Thresholds are ratios: 0.25 allows 25%.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+ROOT = Path(__file__).parents[1]
+for path in (ROOT, ROOT / "test" / "stubs"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from talon import actions  # noqa: E402
+
+# Spend at least this long on each repetition, calling the benchmark as many
+# times as that takes
+MIN_REPEAT_SECONDS = 0.05
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+
+# A setup function prepares its data and returns the function to time
+Setup = Callable[[], Callable[[], object]]
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str):
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+APP_NAMES = [
+    "1Password",
+    "Activity Monitor",
+    "Adobe Acrobat Reader DC",
+    "Adobe Photoshop 2024",
+    "Alacritty",
+    "Android Studio",
+    "App Store",
+    "Blender",
+    "Calculator",
+    "Calendar",
+    "CLion",
+    "Discord",
+    "Docker Desktop",
+    "Emacs",
+    "Excel",
+    "Figma",
+    "Finder",
+    "Firefox Developer Edition",
+    "Firefox",
+    "GIMP-2.10",
+    "GitHub Desktop",
+    "Google Chrome Canary",
+    "Google Chrome",
+    "IntelliJ IDEA Ultimate",
+    "iTerm2",
+    "Keynote",
+    "KeePassXC",
+    "Mail",
+    "Microsoft Edge",
+    "Microsoft Outlook",
+    "Microsoft PowerPoint",
+    "Microsoft Teams (work or school)",
+    "Microsoft Word",
+    "Notes",
+    "Notepad++",
+    "Obsidian",
+    "OBS Studio",
+    "Postman",
+    "Preview",
+    "PyCharm Community Edition",
+    "Rider",
+    "Safari Technology Preview",
+    "Safari",
+    "Signal",
+    "Slack",
+    "Spotify",
+    "Sublime Text",
+    "System Preferences",
+    "Talon",
+    "Terminal",
+    "Thunderbird",
+    "TextEdit",
+    "Visual Studio Code - Insiders",
+    "Visual Studio Code",
+    "VLC media player",
+    "Warp",
+    "WebStorm",
+    "Windows PowerShell",
+    "WhatsApp",
+    "Xcode",
+    "Zoom.us",
+]
+
+
+# Words for file names, so the files benchmark has the same input on every
+# checkout rather than depending on what is in the working tree
+FILE_NAME_WORDS = [
+    "app",
+    "cache",
+    "config",
+    "draft",
+    "editor",
+    "formatter",
+    "help",
+    "index",
+    "keys",
+    "mouse",
+    "notes",
+    "parser",
+    "report",
+    "screen",
+    "settings",
+    "test",
+    "utils",
+    "window",
+]
+FILE_EXTENSIONS = [".py", ".talon", ".csv", ".md", ".json", ".txt"]
+
+
+def file_names(count: int) -> list[str]:
+    """count file names like report-mouse-1.csv, the same on every run"""
+    rng = random.Random(0)
+    names = []
+    for i in range(count):
+        words = rng.sample(FILE_NAME_WORDS, rng.randrange(1, 4))
+        separator = rng.choice(["_", "-", ""])
+        extension = rng.choice(FILE_EXTENSIONS)
+        names.append(f"{separator.join(words)}{separator}{i}{extension}")
+    return names
+
+
+def readme_words() -> list[str]:
+    return (ROOT / "README.md").read_text(encoding="utf-8").split()
+
+
+def talon_command_map() -> dict[str, dict[str, str]]:
+    """Rules and their bodies from every .talon file, keyed by file like help's context command map"""
+    context_command_map = {}
+    for path in sorted(ROOT.rglob("*.talon")):
+        text = path.read_text(encoding="utf-8")
+        # The optional header ends at a line with a single dash
+        parts = re.split(r"^-$", text, maxsplit=1, flags=re.MULTILINE)
+        commands = {}
+        rule = None
+        for line in parts[-1].splitlines():
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            if line[0].isspace() and rule is not None:
+                commands[rule] += "\n" + line.strip()
+                continue
+            match = re.match(r"^([^:]+):\s*(.*)$", line)
+            if match and not line.startswith(("tag(", "settings(")):
+                rule = match.group(1).strip()
+                commands[rule] = match.group(2)
+        name = ".".join(path.relative_to(ROOT).with_suffix(".talon").parts)
+        context_command_map[name] = commands
+    return context_command_map
+
+
+@benchmark("create_spoken_forms_from_map[apps]")
+def bench_spoken_forms_apps():
+    import core.create_spoken_forms  # noqa: F401
+
+    sources = {name: name for name in APP_NAMES}
+    return lambda: actions.user.create_spoken_forms_from_map(sources)
+
+
+@benchmark("create_spoken_forms_from_map[files]")
+def bench_spoken_forms_files():
+    import core.create_spoken_forms  # noqa: F401
+
+    # Like the file manager, which lists one directory at a time
+    sources = {name: f"/home/user/project/{name}" for name in file_names(200)}
+    return lambda: actions.user.create_spoken_forms_from_map(sources)
+
+
+@benchmark("create_spoken_forms_from_map[emacs]")
+def bench_spoken_forms_emacs():
+    import core.create_spoken_forms  # noqa: F401
+
+    path = ROOT / "apps" / "emacs" / "emacs_commands.csv"
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.reader(f))[1:]
+    sources = {row[0]: row[0] for row in rows if row}
+    # Like apps/emacs, which doesn't generate subsequences
+    return lambda: actions.user.create_spoken_forms_from_map(
+        sources, generate_subsequences=False
+    )
+
+
+@benchmark("PhraseReplacer.replace")
+def bench_phrase_replacer():
+    from core.abbreviate.abbreviate import abbreviations_list
+    from core.vocabulary.phrase_replacer import PhraseReplacer
+
+    replacer = PhraseReplacer(abbreviations_list)
+    words = [word.lower() for word in readme_words()][:2000]
+    return lambda: replacer.replace(words)
+
+
+@benchmark("format_phrase_without_adding_to_history")
+def bench_format_phrase():
+    from core.text.formatters import format_phrase_without_adding_to_history
+
+    words = readme_words()[:2000]
+    phrases = [words[i : i + 6] for i in range(0, len(words), 6)]
+    formatters = ["SNAKE_CASE", "PUBLIC_CAMEL_CASE", "ALL_CAPS,DOUBLE_QUOTED_STRING"]
+
+    def run():
+        for phrase in phrases:
+            for formatter in formatters:
+                format_phrase_without_adding_to_history(phrase, formatter)
+
+    return run
+
+
+@benchmark("auto_capitalize")
+def bench_auto_capitalize():
+    from core.text.text_and_dictation import auto_capitalize
+
+    text = (ROOT / "README.md").read_text(encoding="utf-8")[:20_000].lower()
+    return lambda: auto_capitalize(text, "sentence start")
+
+
+@benchmark("parse_number")
+def bench_parse_number():
+    from core.create_spoken_forms import create_spoken_form_for_number
+    from core.numbers.numbers import parse_number
+
+    rng = random.Random(0)
+    numbers = [
+        create_spoken_form_for_number(rng.randrange(10 ** rng.randrange(1, 10))).split()
+        for _ in range(500)
+    ]
+
+    def run():
+        for words in numbers:
+            parse_number(words)
+
+    return run
+
+
+@benchmark("create_snippets_from_file")
+def bench_snippets():
+    from core.snippets.snippets_parser import create_snippets_from_file
+
+    files = sorted(
+        str(path) for path in (ROOT / "core" / "snippets").rglob("*.snippet")
+    )
+
+    def run():
+        for file in files:
+            create_snippets_from_file(file)
+
+    return run
+
+
+@benchmark("help refresh_rule_word_map")
+def bench_help_index():
+    from core.help.help_index import refresh_rule_word_map
+
+    context_command_map = talon_command_map()
+    return lambda: refresh_rule_word_map(context_command_map)
+
+
+def measure(function: Callable[[], object], repeat: int) -> dict:
+    """The best time per call over repeat repetitions"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_REPEAT_SECONDS or number >= 1 << 20:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return {"seconds": best, "number": number, "repeat": repeat}
+
+
+def run(names: Optional[list[str]] = None, repeat: int = DEFAULT_REPEAT) -> dict:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names and not any(pattern in name for pattern in names):
+            continue
+        results[name] = measure(setup(), repeat)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    thresholds: Optional[dict[str, float]] = None,
+) -> list[dict]:
+    """Every benchmark that is slower than in baseline by more than its threshold"""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        change = result["seconds"] / previous["seconds"] - 1
+        allowed = (thresholds or {}).get(name, threshold)
+        if change > allowed:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline": previous["seconds"],
+                    "seconds": result["seconds"],
+                    "change": change,
+                    "threshold": allowed,
+                }
+            )
+    return regressions
+
+
+def format_results(results: dict, baseline: Optional[dict] = None) -> str:
+    lines = []
+    for name, result in results["benchmarks"].items():
+        line = f"{result['seconds'] * 1000:10.3f}ms  {name}"
+        previous = baseline and baseline["benchmarks"].get(name)
+        if previous:
+            change = result["seconds"] / previous["seconds"] - 1
+            line += f"  ({change:+.0%} vs baseline)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_threshold(value: str) -> tuple[str, float]:
+    name, _, ratio = value.rpartition("=")
+    if not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=RATIO, got {value!r}")
+    return name, float(ratio)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "names", nargs="*", help="only run benchmarks whose name contains one of these"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results in this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a ratio, default %(default)s",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        type=parse_threshold,
+        action="append",
+        default=[],
+        metavar="NAME=RATIO",
+        help="allowed slowdown for one benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args(argv)
+
+    results = run(args.names, args.repeat)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(format_results(results, baseline))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.threshold, dict(args.threshold_for))
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['name']}: {regression['change']:+.0%}"
+            f" (allowed {regression['threshold']:+.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -90,11 +90,21 @@ class Actions:
             return RegisteredActionsAccessor(self.registered_actions, name)
 
 
+class Apps:
+    """
+    Stub out Module.apps so app definitions don't crash
+    """
+
+
 class Module:
     """
     Implements something like the Module class built in to Talon
     """
 
+    def __init__(self):
+        # Accepts app definitions like mod.apps.foo = "app.name: Foo"
+        self.apps = Apps()
+
     def list(self, *args, **kwargs):
         pass
 
@@ -170,6 +180,15 @@ class UI:
         pass
 
 
+class SpeechSystem:
+    """
+    Stub out the speech system so registering phrase hooks doesn't crash
+    """
+
+    def register(self, *args, **kwargs):
+        pass
+
+
 class Settings:
     """
     Implements something like talon.settings
@@ -185,6 +204,34 @@ class Resource:
         return open(path, mode, encoding="utf-8")
 
 
+class FS:
+    """
+    Implements something like talon.fs
+    """
+
+    def watch(self, path, callback):
+        pass
+
+    def unwatch(self, path, callback):
+        pass
+
+
+class Cron:
+    """
+    Implements something like talon.cron, without ever calling the callbacks.
+    Tests call them directly.
+    """
+
+    def after(self, spec: str, callback):
+        return object()
+
+    def interval(self, spec: str, callback):
+        return object()
+
+    def cancel(self, job):
+        pass
+
+
 class App:
     """
     Implements something like the talon app variable
@@ -192,14 +239,21 @@ class App:
 
     platform = "mac"
 
+    @staticmethod
+    def register(*args, **kwargs):
+        pass
+
 
 actions = Actions()
 app = App
 clip = None
+cron = Cron()
 imgui = ImgUI()
 ui = UI()
 settings = Settings()
+speech_system = SpeechSystem()
 resource = Resource()
+fs = FS()
 
 # Indicate to test files that they should load since we're running in test mode
 test_mode = True
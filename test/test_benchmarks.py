@@ -0,0 +1,60 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import benchmarks
+    import pytest
+
+    def results(**seconds):
+        return {
+            "benchmarks": {
+                name: {"seconds": value, "number": 1, "repeat": 1}
+                for name, value in seconds.items()
+            }
+        }
+
+    @pytest.mark.parametrize("name", list(benchmarks.BENCHMARKS))
+    def test_benchmark_runs(name):
+        benchmarks.BENCHMARKS[name]()()
+
+    def test_compare_reports_slowdowns_over_threshold():
+        baseline = results(fast=1.0, slow=1.0, new=1.0)
+        current = results(fast=1.2, slow=1.5, added=9.0)
+
+        regressions = benchmarks.compare(current, baseline, threshold=0.25)
+
+        assert [regression["name"] for regression in regressions] == ["slow"]
+        assert regressions[0]["change"] == pytest.approx(0.5)
+
+    def test_compare_per_benchmark_threshold():
+        baseline = results(fast=1.0, slow=1.0)
+        current = results(fast=1.2, slow=1.5)
+
+        regressions = benchmarks.compare(
+            current, baseline, threshold=0.25, thresholds={"slow": 1.0, "fast": 0.1}
+        )
+
+        assert [regression["name"] for regression in regressions] == ["fast"]
+
+    def test_main_writes_results_and_fails_on_regression(tmp_path, monkeypatch):
+        monkeypatch.setattr(benchmarks, "MIN_REPEAT_SECONDS", 0)
+        output = tmp_path / "results.json"
+        assert (
+            benchmarks.main(
+                ["auto_capitalize", "--repeat", "1", "--output", str(output)]
+            )
+            == 0
+        )
+
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(
+            '{"benchmarks": {"auto_capitalize": {"seconds": 1e-12}}}', encoding="utf-8"
+        )
+        assert (
+            benchmarks.main(
+                ["auto_capitalize", "--repeat", "1", "--baseline", str(baseline)]
+            )
+            == 1
+        )
+        assert output.exists()
@@ -113,3 +113,65 @@ if hasattr(talon, "test_mode"):
             # Generated forms at least as numerous as input if subseq is True
             if subseq:
                 assert len(result) >= len(tokens), statement
+
+    def test_incremental_matches_create_spoken_forms_from_list():
+        sources = ["find-file", "find file other window", "save-buffer", "README.md"]
+        spoken_forms = core.create_spoken_forms.IncrementalSpokenForms(
+            generate_subsequences=False
+        )
+
+        result, changed = spoken_forms.update(sources)
+
+        assert changed
+        assert result == actions.user.create_spoken_forms_from_list(
+            sources, generate_subsequences=False
+        )
+
+    def count_generated(generated):
+        create_spoken_forms = actions.user.create_spoken_forms
+
+        def counting_create_spoken_forms(source, *args, **kwargs):
+            generated.append(source)
+            return create_spoken_forms(source, *args, **kwargs)
+
+        actions.register_test_action(
+            "user", "create_spoken_forms", counting_create_spoken_forms
+        )
+
+    def test_incremental_only_generates_new_sources():
+        generated = []
+        count_generated(generated)
+        try:
+            spoken_forms = core.create_spoken_forms.IncrementalSpokenForms()
+            spoken_forms.update(["find file", "save buffer"])
+            _, unchanged = spoken_forms.update(["find file", "save buffer"])
+            result, changed = spoken_forms.update(["find file", "kill buffer"])
+        finally:
+            actions.reset_test_actions()
+
+        assert not unchanged
+        assert changed
+        assert generated == ["find file", "save buffer", "kill buffer"]
+        assert "save buffer" not in result
+        assert result["kill buffer"] == "kill buffer"
+
+    def test_incremental_with_thousands_of_sources():
+        # Like the talon_actions list when a single .py file adds an action
+        names = [f"user.module_{i // 20}_action_{i % 20}" for i in range(4000)]
+        generated = []
+        count_generated(generated)
+        try:
+            spoken_forms = core.create_spoken_forms.IncrementalSpokenForms(
+                generate_subsequences=False
+            )
+            spoken_forms.update(names)
+            assert len(generated) == len(names)
+
+            generated.clear()
+            result, changed = spoken_forms.update(names + ["user.new_action"])
+        finally:
+            actions.reset_test_actions()
+
+        assert changed
+        assert generated == ["user.new_action"]
+        assert result["user new action"] == "user.new_action"
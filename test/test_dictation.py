@@ -56,3 +56,97 @@ if hasattr(talon, "test_mode"):
         assert result == " third("
         result = format.format("fourth")
         assert result == "fourth"
+
+    def test_shadow_buffer_tracks_dictation():
+        buffer = text_and_dictation.ShadowBuffer()
+        assert buffer.lookup(True, True) == (None, None)
+
+        # The first utterance has to peek, later ones are answered locally
+        buffer.update("Hello", "world", " there", " ")
+        assert buffer.lookup(True, True) == ("Hello there", " world")
+        before, after = buffer.lookup(True, False)
+        buffer.update(before, after, " again")
+        assert buffer.lookup(True, True) == ("Hello there again", " world")
+        assert buffer.stats() == {"hits": 3, "misses": 1}
+
+    def test_shadow_buffer_invalidated_by_other_input():
+        buffer = text_and_dictation.ShadowBuffer()
+        buffer.update("Hello", "", " there")
+
+        with buffer.own_input():
+            buffer.on_input("insert", " there")
+        assert buffer.lookup(True, True) == ("Hello there", "")
+
+        buffer.on_input("key", "left")
+        assert buffer.lookup(True, True) == (None, None)
+
+    class Setting:
+        def __init__(self, value):
+            self.value = value
+
+        def get(self):
+            return self.value
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    def test_dictation_insert_invalidates_shadow_buffer(monkeypatch):
+        from talon import actions
+
+        from core.edit import input_events
+
+        peeks = []
+        inserted = []
+        focus = [1]
+        clock = Clock()
+        buffer = text_and_dictation.ShadowBuffer(ttl=5, clock=clock)
+        monkeypatch.setattr(text_and_dictation, "shadow_buffer", buffer)
+        monkeypatch.setattr(
+            text_and_dictation, "setting_context_sensitive_dictation", Setting(True)
+        )
+        monkeypatch.setattr(text_and_dictation, "focused_window_id", lambda: focus[0])
+        monkeypatch.setattr(input_events, "listeners", [buffer.on_input])
+        actions.register_test_action(
+            "user",
+            "dictation_peek",
+            lambda left, right: peeks.append((left, right)) or ("Hello.", ""),
+        )
+        actions.register_test_action("user", "add_phrase_to_history", lambda text: None)
+        actions.register_test_action(
+            "user",
+            "insert_between",
+            lambda before, after: inserted.append(before + after),
+        )
+
+        def utterance(text):
+            text_and_dictation.on_pre_phrase(None)
+            actions.user.dictation_insert(text)
+
+        try:
+            utterance("first")
+            utterance("second")
+            assert len(peeks) == 1
+            assert inserted == [" First", " second"]
+
+            # Talon typing something else
+            input_events.notify("key", "left")
+            utterance("third")
+            assert len(peeks) == 2
+
+            # The focus moved without a focus event
+            focus[0] = 2
+            utterance("fourth")
+            assert len(peeks) == 3
+
+            # Too long since the last utterance
+            utterance("fifth")
+            clock.now = 6
+            utterance("sixth")
+            assert len(peeks) == 4
+            assert buffer.stats() == {"hits": 2, "misses": 4}
+        finally:
+            actions.reset_test_actions()
@@ -0,0 +1,61 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import importlib
+    import sys
+    import types
+    from pathlib import Path
+
+    from talon import actions
+
+    ROOT = Path(__file__).parent.parent
+
+    # apps/emacs imports from core relative to the user directory, which talon
+    # loads as a package, so mount this repository the same way
+    if "user" not in sys.modules:
+        user_package = types.ModuleType("user")
+        user_package.__path__ = [str(ROOT)]
+        sys.modules["user"] = user_package
+
+    emacs_commands = importlib.import_module("user.apps.emacs.emacs_commands")
+
+    def setup_function():
+        emacs_commands.spoken_forms.update([])
+
+    def test_matches_create_spoken_forms_from_list():
+        names = ["find-file", "find-file-other-window", "save-buffer", "kill-buffer"]
+
+        result = emacs_commands.generate_command_list(names)
+
+        assert result == actions.user.create_spoken_forms_from_list(
+            names, generate_subsequences=False
+        )
+
+    def test_only_generates_new_names():
+        generated = []
+        create_spoken_forms = actions.user.create_spoken_forms
+
+        def counting_create_spoken_forms(name, *args, **kwargs):
+            generated.append(name)
+            return create_spoken_forms(name, *args, **kwargs)
+
+        actions.register_test_action(
+            "user", "create_spoken_forms", counting_create_spoken_forms
+        )
+        try:
+            emacs_commands.generate_command_list(["find-file", "save-buffer"])
+            result = emacs_commands.generate_command_list(["find-file", "kill-buffer"])
+        finally:
+            actions.reset_test_actions()
+
+        assert generated == ["find-file", "save-buffer", "kill-buffer"]
+        assert "save buffer" not in result
+        assert result["kill buffer"] == "kill-buffer"
+
+    def test_overrides_leave_the_generated_list_alone():
+        result = emacs_commands.generate_command_list(["save-buffer"])
+        result["write it"] = "save-buffer"
+
+        assert "write it" not in emacs_commands.generate_command_list(["save-buffer"])
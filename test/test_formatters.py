@@ -3,6 +3,8 @@ import talon
 if hasattr(talon, "test_mode"):
     # Only include this when we're running tests
 
+    import time
+
     from talon import actions
 
     from core.text import formatters
@@ -82,3 +84,41 @@ if hasattr(talon, "test_mode"):
         )
 
         assert result == '"How\'s It Going?"'
+
+    def test_unformat_text():
+        assert formatters.unformat_text("fooBarBaz") == "foo bar baz"
+        assert formatters.unformat_text("HTTPServer_v2") == "http server v 2"
+        assert formatters.unformat_text("__init__.py") == "init py"
+        assert formatters.unformat_text("ÉcoleNormale") == "école normale"
+
+    def test_reformat_single_line_joins_words():
+        actions.register_test_action(
+            "user", "formatted_text", formatters.Actions.formatted_text
+        )
+        try:
+            result = formatters.reformat("fooBar bazQux", "SNAKE_CASE")
+        finally:
+            # Don't leave the formatted_text override for other test modules
+            actions.reset_test_actions()
+
+        assert result == "foo_bar_baz_qux"
+
+    def test_reformat_multiple_lines_keeps_other_text():
+        text = "fooBar = bazQux(1)\nreturn someValue\n"
+
+        result = formatters.reformat(text, "SNAKE_CASE")
+
+        assert result == "foo_bar = baz_qux(1)\nreturn some_value\n"
+
+    def test_reformat_benchmark():
+        # 10k identifiers should take one linear pass, not one pass per identifier
+        text = "\n".join(f"someIdentifier{i} = otherValue{i}" for i in range(5000))
+
+        start = time.perf_counter()
+        result = formatters.reformat(text, "SNAKE_CASE")
+        elapsed = time.perf_counter() - start
+
+        lines = result.split("\n")
+        assert len(lines) == 5000
+        assert lines[1234] == "some_identifier_1234 = other_value_1234"
+        assert elapsed < 2
@@ -0,0 +1,183 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import json
+    import os
+    import socket
+    import socketserver
+    import tempfile
+    import threading
+
+    import pytest
+
+    from apps.i3wm import i3_ipc
+    from core.settle import wait_until
+
+    class FakeI3Handler(socketserver.BaseRequestHandler):
+        """Speaks enough of the i3/sway IPC protocol to stand in for the window manager"""
+
+        def handle(self):
+            server = self.server
+            server.connections.append(self.request)
+            while True:
+                try:
+                    msg_type, payload = i3_ipc.read_raw_message(self.request)
+                except (ConnectionError, OSError):
+                    return
+                payload = payload.decode()
+                server.messages += 1
+                if msg_type == i3_ipc.RUN_COMMAND:
+                    results = []
+                    for command in payload.split(";"):
+                        command = command.strip()
+                        server.commands.append(command)
+                        if command == "drop":
+                            # Runs the command but dies before replying
+                            self.request.shutdown(socket.SHUT_RDWR)
+                            return
+                        results.append({"success": command != "fail"})
+                    self.send(i3_ipc.RUN_COMMAND, results)
+                elif msg_type == i3_ipc.SUBSCRIBE:
+                    server.subscribers.append(self)
+                    self.send(i3_ipc.SUBSCRIBE, {"success": True})
+                else:
+                    self.send(msg_type, {"human_readable": "fake i3"})
+
+        def send(self, msg_type, payload):
+            with self.server.send_lock:
+                self.request.sendall(i3_ipc.pack(msg_type, json.dumps(payload)))
+
+    class FakeI3Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+        def __init__(self, path):
+            super().__init__(path, FakeI3Handler)
+            self.commands = []
+            self.messages = 0
+            self.connections = []
+            self.subscribers = []
+            self.send_lock = threading.Lock()
+
+        def emit(self, event_type, payload):
+            for subscriber in self.subscribers:
+                subscriber.send(i3_ipc.EVENT_FLAG | event_type, payload)
+
+        def restart(self):
+            """Drops every client connection, like i3 does when it restarts"""
+            for connection in self.connections:
+                connection.shutdown(socket.SHUT_RDWR)
+            self.connections = []
+            self.subscribers = []
+
+    @pytest.fixture
+    def fake_i3():
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "ipc.sock")
+        server = FakeI3Server(path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server, lambda: path
+        server.shutdown()
+        server.server_close()
+        os.unlink(path)
+        os.rmdir(directory)
+
+    def test_commands_share_one_connection(fake_i3):
+        server, path = fake_i3
+        i3 = i3_ipc.I3Connection(path)
+
+        i3.command("mode default")
+        i3.command("focus left", "split h")
+
+        assert server.commands == ["mode default", "focus left", "split h"]
+        assert server.messages == 2
+        assert len(server.connections) == 1
+        i3.close()
+
+    def test_pipelined_requests_reply_in_order(fake_i3):
+        server, path = fake_i3
+        i3 = i3_ipc.I3Connection(path)
+
+        replies = i3.request_many(
+            [(i3_ipc.RUN_COMMAND, "kill"), (i3_ipc.GET_VERSION, "")]
+        )
+
+        assert replies == [[{"success": True}], {"human_readable": "fake i3"}]
+        i3.close()
+
+    def test_failed_command_raises(fake_i3):
+        _, path = fake_i3
+        i3 = i3_ipc.I3Connection(path)
+
+        with pytest.raises(i3_ipc.I3Error):
+            i3.command("fail")
+        i3.close()
+
+    def test_reconnects_after_restart(fake_i3):
+        server, path = fake_i3
+        i3 = i3_ipc.I3Connection(path)
+        i3.command("reload")
+
+        server.restart()
+        i3.command("fullscreen")
+
+        assert server.commands == ["reload", "fullscreen"]
+        i3.close()
+
+    def test_no_retry_once_sent(fake_i3):
+        server, path = fake_i3
+        i3 = i3_ipc.I3Connection(path)
+
+        with pytest.raises(i3_ipc.I3ConnectionLost):
+            i3.command("drop")
+        assert server.commands == ["drop"]
+
+        # The next request reconnects
+        i3.command("reload")
+        assert server.commands == ["drop", "reload"]
+        i3.close()
+
+    def test_event_subscription(fake_i3):
+        server, path = fake_i3
+        subscription = i3_ipc.I3EventSubscription(
+            ["workspace", "window"], path, retry_interval=0.01
+        )
+        received = []
+        got_event = threading.Event()
+
+        def on_event(name, payload):
+            received.append((name, payload))
+            got_event.set()
+
+        subscription.register("window", on_event)
+        subscription.start()
+        try:
+            assert subscription.subscribed.wait(5)
+            server.emit(3, {"change": "focus"})
+            assert got_event.wait(5)
+            assert received == [("window", {"change": "focus"})]
+
+            # Subscribes again after the window manager restarts
+            got_event.clear()
+            server.restart()
+            assert wait_until(lambda: server.subscribers, 5)
+            server.emit(3, {"change": "new"})
+            assert got_event.wait(5)
+            assert received[-1] == ("window", {"change": "new"})
+        finally:
+            subscription.stop()
+
+    def test_stop_running_subscriptions(fake_i3):
+        _, path = fake_i3
+        # Like the subscription of a copy of the module talon has reloaded
+        subscription = i3_ipc.I3EventSubscription(["window"], path)
+        subscription.start()
+        thread = subscription.thread
+        assert subscription.subscribed.wait(5)
+
+        i3_ipc.stop_running_subscriptions()
+
+        assert not thread.is_alive()
+        assert subscription.sock is None
@@ -0,0 +1,109 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import os
+    import tempfile
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import unquote
+
+    import pytest
+
+    pytest.importorskip("requests")
+
+    from apps.jetbrains import jetbrains
+
+    class FakeIdeaHandler(BaseHTTPRequestHandler):
+        """Stands in for the voicecode-idea plugin's HTTP endpoint"""
+
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            server = self.server
+            server.connections.add(self.client_address)
+            nonce, _, cmd = unquote(self.path).lstrip("/").partition("/")
+            if nonce != server.nonce:
+                status, body = 401, b""
+            else:
+                server.commands.append(cmd)
+                status, body = 200, f"ok {cmd}".encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    @pytest.fixture
+    def fake_idea():
+        server = ThreadingHTTPServer(("localhost", 0), FakeIdeaHandler)
+        server.nonce = "first"
+        server.commands = []
+        server.connections = set()
+        port = server.server_address[1]
+        nonce_path = os.path.join(tempfile.gettempdir(), f".vcidea_{port}")
+
+        def write_nonce(nonce):
+            server.nonce = nonce
+            with open(nonce_path, "w") as fh:
+                fh.write(nonce)
+            # make sure the modification time changes even on coarse filesystems
+            stat = os.stat(nonce_path)
+            os.utime(nonce_path, (stat.st_atime, stat.st_mtime + 1))
+
+        server.write_nonce = write_nonce
+        write_nonce("first")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield server, port
+        finally:
+            server.shutdown()
+            server.server_close()
+            jetbrains._sessions.pop(port, None)
+            jetbrains._invalidate_nonce(port)
+            os.remove(nonce_path)
+
+    def test_commands_share_one_connection(fake_idea):
+        server, port = fake_idea
+
+        result = jetbrains.send_idea_commands_to_port(
+            port, ["action EditorCopy", "action EditorPaste", "location"]
+        )
+
+        assert result == [
+            "ok action EditorCopy",
+            "ok action EditorPaste",
+            "ok location",
+        ]
+        assert server.commands == [
+            "action EditorCopy",
+            "action EditorPaste",
+            "location",
+        ]
+        assert len(server.connections) == 1
+
+    def test_nonce_is_reloaded_when_file_changes(fake_idea):
+        server, port = fake_idea
+
+        jetbrains.send_idea_command_to_port(port, "location")
+        server.write_nonce("second")
+
+        assert jetbrains.send_idea_command_to_port(port, "location") == "ok location"
+
+    def test_nonce_is_reloaded_when_rejected(fake_idea):
+        server, port = fake_idea
+
+        jetbrains.send_idea_command_to_port(port, "location")
+        # simulate the IDE restarting without us noticing the modification time
+        path, mtime, _ = jetbrains._nonce_cache[port]
+        jetbrains._nonce_cache[port] = (path, mtime, "stale")
+
+        assert jetbrains.send_idea_command_to_port(port, "location") == "ok location"
+        assert jetbrains._nonce_cache[port][2] == "first"
+
+    def test_no_port_sends_nothing():
+        assert jetbrains.send_idea_command_to_port(None, "location") is None
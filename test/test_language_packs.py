@@ -0,0 +1,92 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import importlib
+    import sys
+    import time
+    import types
+    from pathlib import Path
+
+    from core.modes.language_packs import LanguagePacks
+
+    ROOT = Path(__file__).parent.parent
+
+    # Language modules import from core relative to the user directory, which
+    # talon loads as a package, so mount this repository the same way
+    if "user" not in sys.modules:
+        user_package = types.ModuleType("user")
+        user_package.__path__ = [str(ROOT)]
+        sys.modules["user"] = user_package
+
+    language_packs = importlib.import_module(
+        "user.core.modes.language_packs"
+    ).language_packs
+
+    # lang/talon needs talon.registry, which the stubs don't provide
+    LANGUAGE_MODULES = sorted(
+        f"user.lang.{path.parent.name}.{path.stem}"
+        for path in (ROOT / "lang").glob("*/*.py")
+        if path.parent.name not in ("tags", "talon")
+    )
+
+    def import_languages() -> float:
+        """Imports every language module from scratch, like talon does at startup"""
+        language_packs.current_language = None
+        start = time.perf_counter()
+        for name in LANGUAGE_MODULES:
+            sys.modules.pop(name, None)
+            importlib.import_module(name)
+        return time.perf_counter() - start
+
+    def loaded_packs() -> set[str]:
+        return {
+            name.split(".")[2]
+            for name, loaded in language_packs.stats().items()
+            if loaded
+        }
+
+    def test_lists_load_on_first_activation():
+        import_languages()
+        assert loaded_packs() == set()
+
+        language_packs.activate("python")
+        assert loaded_packs() == {"python"}
+        assert talon.Context.lists["user.python_exception"]["key error"] == "KeyError"
+
+        # typescript also gets the javascript lists
+        language_packs.activate("typescript")
+        assert loaded_packs() == {"python", "javascript", "typescript"}
+        assert language_packs.activate("typescript") == []
+
+    def test_reload_while_active_loads_immediately():
+        packs = LanguagePacks()
+        ctx = talon.Context()
+        packs.activate("python")
+
+        @packs.lists(ctx, "python")
+        def python_lists():
+            return {"user.test_reload": {"a": "b"}}
+
+        assert list(packs.stats().values()) == [True]
+
+    def test_startup_benchmark():
+        # Talon also compiles every assigned list into the grammar, which the
+        # stubs don't, so this only shows the part spent in Python
+        lazy = min(import_languages() for _ in range(5))
+        eager = min(
+            import_languages() + timed(language_packs.load_all) for _ in range(5)
+        )
+
+        print(
+            f"{len(LANGUAGE_MODULES)} language modules: "
+            f"lazy {lazy * 1000:.2f}ms, eager {eager * 1000:.2f}ms"
+        )
+        assert len(LANGUAGE_MODULES) >= 17
+        assert len(loaded_packs()) >= 17
+
+    def timed(function) -> float:
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
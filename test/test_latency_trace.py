@@ -0,0 +1,121 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import threading
+
+    from core.latency_trace import PHRASE, LatencyTracer, percentile
+
+    def test_disabled_tracer_records_nothing():
+        tracer = LatencyTracer()
+
+        tracer.begin_phrase("hello")
+        with tracer.span("clipboard copy"):
+            pass
+        tracer.end_phrase()
+
+        assert list(tracer.spans) == []
+        assert list(tracer.phrases) == []
+
+    def test_phrase_keeps_its_spans():
+        tracer = LatencyTracer()
+        tracer.enabled = True
+
+        @tracer.traced("command server rpc")
+        def rpc():
+            with tracer.span("clipboard copy"):
+                pass
+
+        tracer.begin_phrase("copy that")
+        rpc()
+        tracer.end_phrase()
+        # Outside of a phrase, spans still count towards the percentiles
+        rpc()
+
+        (phrase,) = tracer.phrases
+        assert phrase.text == "copy that"
+        assert [(span.name, span.depth) for span in phrase.spans] == [
+            ("clipboard copy", 1),
+            ("command server rpc", 0),
+        ]
+        assert phrase.spans[1].start <= phrase.spans[0].start
+        assert phrase.spans[0].end <= phrase.spans[1].end <= phrase.end
+        stats = tracer.percentiles()
+        assert stats["command server rpc"]["count"] == 2
+        assert stats[PHRASE]["count"] == 1
+
+    def test_spans_from_other_threads_stay_out_of_the_phrase():
+        tracer = LatencyTracer()
+        tracer.enabled = True
+        started, finish = threading.Event(), threading.Event()
+
+        def watcher():
+            with tracer.span("spoken forms"):
+                started.set()
+                finish.wait(5)
+
+        thread = threading.Thread(target=watcher)
+        tracer.begin_phrase("hello")
+        thread.start()
+        assert started.wait(5)
+        # The other thread's open span doesn't nest this one
+        with tracer.span("clipboard copy"):
+            pass
+        finish.set()
+        thread.join()
+        tracer.end_phrase()
+
+        (phrase,) = tracer.phrases
+        assert [(span.name, span.depth) for span in phrase.spans] == [
+            ("clipboard copy", 0)
+        ]
+        assert tracer.percentiles()["spoken forms"]["count"] == 1
+
+    def test_ring_buffers_are_bounded():
+        tracer = LatencyTracer(max_spans=10, max_phrases=3)
+        tracer.enabled = True
+
+        for i in range(20):
+            tracer.begin_phrase(str(i))
+            with tracer.span("step"):
+                pass
+            tracer.end_phrase()
+
+        assert len(tracer.spans) == 10
+        assert [phrase.text for phrase in tracer.phrases] == ["17", "18", "19"]
+
+        tracer.resize(max_spans=4, max_phrases=1)
+        assert len(tracer.spans) == 4
+        assert [phrase.text for phrase in tracer.phrases] == ["19"]
+
+    def test_percentile_nearest_rank():
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([1.0, 2.0], 50) == 1.0
+
+    def test_instrumentation_span_feeds_both_recorders(monkeypatch):
+        from core import instrumentation
+        from core.load_profiler import LoadProfiler
+
+        profiler, tracer = LoadProfiler(), LatencyTracer()
+        monkeypatch.setattr(instrumentation, "profiler", profiler)
+        monkeypatch.setattr(instrumentation, "tracer", tracer)
+
+        # Both off, so the shared no-op context
+        assert instrumentation.span("parse") is instrumentation.span("other")
+
+        profiler.enabled = tracer.enabled = True
+        tracer.begin_phrase("hello")
+        with instrumentation.span("parse", "words.csv"):
+            pass
+        tracer.end_phrase()
+
+        assert [(span.kind, span.label) for span in profiler.spans] == [
+            ("parse", "words.csv")
+        ]
+        assert [span.name for span in tracer.phrases[0].spans] == ["parse"]
@@ -0,0 +1,106 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import importlib
+    import json
+    import subprocess
+    import sys
+    import types
+    from pathlib import Path
+
+    from core.load_profiler import LoadProfiler, format_report
+
+    def write_modules(directory: Path):
+        (directory / "profiled_outer.py").write_text(
+            "import time\n"
+            "from profiled_hook import profiler\n"
+            "import profiled_inner\n"
+            "time.sleep(0.02)\n"
+            "with profiler.span('parse', 'words.csv'):\n"
+            "    time.sleep(0.01)\n"
+        )
+        (directory / "profiled_inner.py").write_text("import time\ntime.sleep(0.03)\n")
+
+    def test_times_nested_imports(tmp_path, monkeypatch):
+        write_modules(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        profiler = LoadProfiler(tmp_path)
+        monkeypatch.setitem(
+            sys.modules, "profiled_hook", types.SimpleNamespace(profiler=profiler)
+        )
+
+        profiler.enable()
+        try:
+            importlib.import_module("profiled_outer")
+        finally:
+            profiler.disable()
+            sys.modules.pop("profiled_outer", None)
+            sys.modules.pop("profiled_inner", None)
+
+        report = profiler.report()
+        modules = {module["module"]: module for module in report["modules"]}
+        outer, inner = modules["profiled_outer"], modules["profiled_inner"]
+        assert inner["seconds"] >= 0.03
+        assert outer["seconds"] >= inner["seconds"] + 0.03
+        # Time spent importing profiled_inner isn't counted against profiled_outer
+        assert 0.03 <= outer["self_seconds"] < outer["seconds"] - 0.025
+        assert report["spans"][0]["module"] == "profiled_outer"
+        assert report["kinds"]["parse"]["calls"] == 1
+        assert "parse(words.csv) in profiled_outer" in format_report(report)
+
+    def test_disabled_profiler_records_nothing():
+        profiler = LoadProfiler()
+
+        @profiler.timed("parse")
+        def parse(filename: str) -> str:
+            return filename
+
+        assert parse("words.csv") == "words.csv"
+        with profiler.span("parse", "words.csv") as span:
+            # The shared no-op context, rather than a new generator per call
+            assert span is None
+        assert profiler.span("parse") is profiler.span("other")
+        assert profiler.spans == []
+
+        # Turned on later, the same instrumentation records
+        profiler.enabled = True
+        parse("words.csv")
+        assert [span.label for span in profiler.spans] == ["words.csv"]
+
+    def test_enable_replaces_a_previous_finder():
+        # Like the profiler of this module before talon reloaded it
+        previous, profiler = LoadProfiler(), LoadProfiler()
+
+        previous.enable()
+        profiler.enable()
+        try:
+            finders = [
+                finder
+                for finder in sys.meta_path
+                if type(finder).__name__ == "TimingFinder"
+            ]
+            assert finders == [profiler.finder]
+        finally:
+            profiler.disable()
+            previous.disable()
+
+    def test_offline_report(tmp_path):
+        # Run in a fresh interpreter, since modules already imported by other
+        # tests would not be imported again
+        path = tmp_path / "load_profile.json"
+        root = Path(__file__).parent.parent
+        subprocess.run(
+            [sys.executable, "-m", "core.load_profiler", "--json", str(path)],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            timeout=120,
+        )
+
+        report = json.loads(path.read_text())
+        modules = {module["module"] for module in report["modules"]}
+        assert {"core.user_settings", "lang.python.python"} <= modules
+        assert report["kinds"]["get_list_from_csv"]["calls"] > 0
+        assert report["lists"]["user.abbreviation"] > 0
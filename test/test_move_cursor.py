@@ -0,0 +1,116 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import pytest
+    from talon import actions
+
+    import apps.gnome_terminal.gnome_terminal as gnome_terminal
+    import core.edit.move_cursor  # noqa: F401
+    import tags.line_commands.line_commands  # noqa: F401
+    from core.edit import edit_linux
+
+    def count_events(movement_key: str) -> list[str]:
+        """Registers fake key and edit actions, returning the list they record into"""
+        events = []
+        actions.register_test_action("", "key", lambda key: events.append(key))
+        for name in ("left", "extend_left", "down", "extend_down", "word_right"):
+            actions.register_test_action(
+                "edit", name, lambda name=name: events.append(name)
+            )
+        actions.register_test_action(
+            "user", "movement_key", lambda direction, extend: movement_key
+        )
+        return events
+
+    def override_movement_key(user_actions) -> list[str]:
+        """Uses the movement_key of an app context's user actions, which falls back to the linux keys like actions.next, returning the list events are recorded into"""
+        events = count_events("")
+        for name in ("extend_right", "extend_word_left", "extend_word_right"):
+            actions.register_test_action(
+                "edit", name, lambda name=name: events.append(name)
+            )
+        actions.register_test_action("", "next", edit_linux.UserActions.movement_key)
+        actions.register_test_action("user", "movement_key", user_actions.movement_key)
+        return events
+
+    def teardown_function():
+        actions.reset_test_actions()
+
+    def test_repeated_key_is_one_event():
+        events = count_events("shift-left")
+
+        actions.user.move_cursor("left", 37, True)
+
+        assert events == ["shift-left:37"]
+
+    def test_falls_back_to_edit_actions():
+        events = count_events("")
+
+        actions.user.move_cursor("down", 12, True)
+
+        assert events == ["extend_down"] * 12
+
+    def test_nothing_to_do():
+        events = count_events("left")
+
+        actions.user.move_cursor("left", 0)
+
+        assert events == []
+
+    def test_unknown_direction():
+        count_events("left")
+
+        with pytest.raises(ValueError):
+            actions.user.move_cursor("sideways", 1)
+
+    def test_benchmark_events_per_operation():
+        # Events dispatched to move 500 words, one edit action per word versus
+        # one repeated key
+        steps = 500
+        per_step = count_events("")
+        actions.user.move_cursor("word_right", steps)
+        coalesced = count_events("ctrl-right")
+        actions.user.move_cursor("word_right", steps)
+
+        assert len(per_step) == steps
+        assert len(coalesced) == 1
+
+    def test_override_without_extending_keeps_edit_actions():
+        # gnome terminal makes the extend actions no-ops rather than send shift keys
+        events = override_movement_key(gnome_terminal.user_actions)
+
+        actions.user.move_cursor("left", 3, True)
+        actions.user.move_cursor("word_right", 2, True)
+        actions.user.move_cursor("left", 4)
+
+        assert events == ["extend_left"] * 3 + ["extend_word_right"] * 2 + ["left:4"]
+
+    def test_override_of_word_extension_keeps_edit_actions():
+        pytest.importorskip("requests")
+        from apps.jetbrains import jetbrains
+
+        events = override_movement_key(jetbrains.UserActions)
+
+        actions.user.move_cursor("word_left", 2, True)
+        actions.user.move_cursor("right", 5, True)
+
+        assert events == ["extend_word_left"] * 2 + ["shift-right:5"]
+
+    def test_select_range_extends_with_edit_actions():
+        events = count_events("shift-down")
+        for name in ("jump_line", "extend_line_end", "extend_line_down"):
+            actions.register_test_action(
+                "edit", name, lambda *args, name=name: events.append(name)
+            )
+
+        actions.user.select_range(3, 5)
+
+        assert events == [
+            "jump_line",
+            "extend_line_end",
+            "extend_line_down",
+            "extend_line_down",
+            "extend_line_end",
+        ]
@@ -0,0 +1,157 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import os
+    import subprocess
+    import sys
+    import threading
+    import time
+
+    import pytest
+
+    from core import process_manager
+    from core.process_manager import ProcessManager
+    from core.settle import wait_until
+
+    def python(code: str) -> list[str]:
+        return [sys.executable, "-c", code]
+
+    def test_captures_output_and_calls_back():
+        manager = ProcessManager(output_lines=2)
+        completed = threading.Event()
+
+        handle = manager.run(
+            python("import sys\nfor i in range(5): print(i)\nsys.stderr.write('oops')"),
+            on_complete=lambda handle: completed.set(),
+        )
+
+        assert completed.wait(10)
+        assert handle.state == process_manager.FINISHED
+        assert handle.returncode == 0
+        # Only the last lines are kept
+        assert list(handle.stdout) == ["3\n", "4\n"]
+        assert handle.stderr[-1] == "oops"
+
+    def test_timeout_kills_command():
+        manager = ProcessManager()
+
+        handle = manager.run(python("import time; time.sleep(30)"), timeout=0.2)
+
+        assert handle.wait(10)
+        assert handle.state == process_manager.TIMED_OUT
+        with pytest.raises(subprocess.TimeoutExpired):
+            handle.check()
+
+    def test_failure_raises_like_subprocess_run():
+        manager = ProcessManager()
+
+        handle = manager.run(python("import sys; sys.exit(3)"))
+        handle.wait(10)
+
+        with pytest.raises(subprocess.CalledProcessError):
+            handle.check()
+
+    def test_cancel_running_and_queued():
+        manager = ProcessManager(max_workers=1)
+
+        running = manager.run(python("import time; time.sleep(30)"))
+        queued = manager.run(python("print('never')"))
+        queued.cancel()
+        time.sleep(0.1)
+        running.cancel()
+
+        assert running.wait(10) and queued.wait(10)
+        assert running.state == process_manager.CANCELLED
+        assert queued.state == process_manager.CANCELLED
+        assert queued.process is None
+
+    def test_pool_is_bounded():
+        manager = ProcessManager(max_workers=2)
+
+        handles = [
+            manager.run(python("import time; time.sleep(0.1)")) for _ in range(5)
+        ]
+
+        assert all(handle.wait(10) for handle in handles)
+        assert len(manager.threads) == 2
+        assert wait_until(lambda: manager.running() == [], 5)
+
+    def test_missing_program():
+        manager = ProcessManager()
+
+        handle = manager.run(["this-program-does-not-exist"])
+        handle.wait(10)
+
+        assert handle.state == process_manager.FAILED
+        with pytest.raises(OSError):
+            handle.check()
+
+    def test_launch_leaves_the_pool_free():
+        manager = ProcessManager(max_workers=1)
+
+        launched = [
+            manager.launch(python("import time; time.sleep(30)")) for _ in range(3)
+        ]
+        handle = manager.run(python("print('done')"))
+
+        assert handle.wait(10)
+        assert handle.output() == "done\n"
+        manager.cancel_all()
+        assert all(handle.wait(10) for handle in launched)
+        assert all(handle.state == process_manager.CANCELLED for handle in launched)
+
+    def test_cancel_all_leaves_blocking_commands():
+        manager = ProcessManager()
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(
+                manager.run_blocking(python("import time; time.sleep(0.5)"))
+            )
+        )
+        thread.start()
+        time.sleep(0.1)
+
+        manager.cancel_all()
+        thread.join(10)
+
+        assert results[0].state == process_manager.FINISHED
+        assert results[0].returncode == 0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX shell")
+    def test_background_children_share_one_output_deadline():
+        manager = ProcessManager()
+
+        start = time.perf_counter()
+        handle = manager.run_blocking("sleep 3 & echo hi", shell=True)
+        elapsed = time.perf_counter() - start
+
+        assert handle.state == process_manager.FINISHED
+        assert handle.output() == "hi\n"
+        # Both pipes stay open as long as sleep runs, but are given one grace
+        # period between them
+        assert elapsed < process_manager.OUTPUT_GRACE_SECONDS + 0.5
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="checks /proc for the child")
+    def test_shell_timeout_kills_children():
+        manager = ProcessManager()
+        child = f"{sys.executable} -c 'import time; time.sleep(30)'"
+
+        handle = manager.run_blocking(
+            f"{child} & echo $!; wait", shell=True, timeout=0.5
+        )
+
+        assert handle.state == process_manager.TIMED_OUT
+        pid = int(handle.stdout[0])
+
+        def child_gone():
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            # A killed child that hasn't been reaped yet is a zombie
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().split(") ")[1].startswith("Z")
+
+        assert wait_until(child_gone, 5)
@@ -0,0 +1,61 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from types import SimpleNamespace
+
+    from core.screens.screen_topology import ScreenTopology, find_neighbor
+
+    class Rect:
+        def __init__(self, x, y, width, height):
+            self.left, self.top, self.width, self.height = x, y, width, height
+            self.right, self.bot = x + width, y + height
+            self.center = SimpleNamespace(x=x + width / 2, y=y + height / 2)
+
+    def screen(x, y, width, height):
+        return SimpleNamespace(visible_rect=Rect(x, y, width, height), scale=1)
+
+    # Two 1920x1080 screens side by side, a laptop screen centered below the
+    # left one and a portrait screen to the right, taller than the others
+    LAYOUT = [
+        Rect(0, 0, 1920, 1080),
+        Rect(1920, 0, 1920, 1080),
+        Rect(320, 1080, 1280, 800),
+        Rect(3840, -400, 1080, 1920),
+    ]
+
+    def test_find_neighbor_in_each_direction():
+        def neighbors(index):
+            return {
+                direction: find_neighbor(LAYOUT, index, direction)
+                for direction in ("left", "right", "up", "down")
+            }
+
+        assert neighbors(0) == {"left": None, "right": 1, "up": None, "down": 2}
+        assert neighbors(1) == {"left": 0, "right": 3, "up": None, "down": 2}
+        # The portrait screen overlaps the laptop's rows, the right screen doesn't
+        assert neighbors(2) == {"left": None, "right": 3, "up": 0, "down": None}
+        # Without an overlapping screen below, the closest one
+        assert neighbors(3) == {"left": 1, "right": None, "up": None, "down": 2}
+
+    def test_find_neighbor_prefers_overlapping_screens():
+        # The screen up and to the right is closer than the one straight up
+        # with a gap between, but doesn't overlap horizontally
+        rects = [
+            Rect(0, 1000, 1000, 1000),
+            Rect(0, -2000, 1000, 1000),
+            Rect(1000, 500, 1000, 400),
+        ]
+
+        assert find_neighbor(rects, 0, "up") == 1
+
+    def test_topology_numbers_screens_left_to_right():
+        screens = [screen(1920, 0, 1920, 1080), screen(0, 0, 1920, 1080)]
+
+        topology = ScreenTopology(screens)
+
+        assert topology.screens == [screens[1], screens[0]]
+        assert topology.index_of(screens[0]) == 1
+        assert topology.neighbor(screens[1], "right") is screens[0]
+        assert topology.neighbor(screens[1], "left") is None
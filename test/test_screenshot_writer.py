@@ -0,0 +1,49 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from core.settle import wait_until
+    from plugin.screenshot.screenshot_writer import ScreenshotWriter
+
+    class FakeImage:
+        def __init__(self):
+            self.encoded = []
+
+        def write_file(self, path):
+            with open(path, "wb") as f:
+                f.write(b"png")
+
+        def encode(self, fmt, quality):
+            self.encoded.append((fmt, quality))
+            return f"{fmt} {quality}".encode()
+
+    def test_writes_png_and_encodes_lossy_formats(tmp_path):
+        writer = ScreenshotWriter()
+        png, jpeg = FakeImage(), FakeImage()
+
+        writer.submit(png, str(tmp_path / "a.png"))
+        writer.submit(jpeg, str(tmp_path / "b.jpeg"), "jpeg", 80)
+        writer.wait()
+
+        assert (tmp_path / "a.png").read_bytes() == b"png"
+        assert png.encoded == []
+        assert (tmp_path / "b.jpeg").read_bytes() == b"jpeg 80"
+        assert jpeg.encoded == [("jpeg", 80)]
+
+    def test_idle_threads_exit_and_restart(tmp_path):
+        writer = ScreenshotWriter(workers=2, idle_seconds=0.01)
+
+        writer.submit(FakeImage(), str(tmp_path / "a.png"))
+        threads = list(writer.threads)
+        for thread in threads:
+            thread.join(5)
+            assert not thread.is_alive()
+        assert writer.threads == []
+
+        writer.submit(FakeImage(), str(tmp_path / "b.png"))
+        names = {thread.name for thread in threads + writer.threads}
+        assert len(names) == len(threads) + len(writer.threads)
+        writer.wait()
+        assert (tmp_path / "b.png").exists()
+        assert wait_until(lambda: not writer.threads, 5)
@@ -0,0 +1,98 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from talon import actions
+
+    from plugin.mouse.scroll_engine import ScrollEngine, ScrollStats, WindowUnderPointer
+
+    class Rect:
+        def __init__(self, x, y, width, height):
+            self.x, self.y, self.width, self.height = x, y, width, height
+
+        def contains(self, x, y):
+            return (
+                self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+            )
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    def scrolled() -> list[int]:
+        deltas = []
+        actions.register_test_action(
+            "", "mouse_scroll", lambda by_lines=False, y=0: deltas.append(y)
+        )
+        return deltas
+
+    def teardown_function():
+        actions.reset_test_actions()
+
+    def test_scroll_speed_does_not_depend_on_tick_rate():
+        totals = []
+        for interval_ms in (15, 60):
+            deltas = scrolled()
+            clock = Clock()
+            engine = ScrollEngine(ScrollStats(), clock)
+            # 10 pixels per 60ms
+            engine.start(lambda intervals: 10 * intervals, interval_ms)
+            for _ in range(600 // interval_ms):
+                clock.now += interval_ms / 1000
+                engine._tick()
+            totals.append(sum(deltas))
+
+        assert totals == [100, 100]
+
+    def test_fractions_carry_over_and_stalls_are_capped():
+        deltas = scrolled()
+        clock = Clock()
+        stats = ScrollStats()
+        engine = ScrollEngine(stats, clock)
+        engine.start(lambda intervals: 0.5 * intervals, 60)
+
+        clock.now += 0.06
+        engine._tick()
+        assert deltas == []
+        clock.now += 0.06
+        engine._tick()
+        assert deltas == [1]
+
+        # A one second stall only counts as four ticks
+        clock.now += 1.0
+        engine._tick()
+        assert deltas == [1, 2]
+        assert stats.dropped_ticks == 16
+
+    def test_stop():
+        engine = ScrollEngine(ScrollStats())
+
+        def step(intervals):
+            return 1
+
+        engine.start(step, 60)
+        assert engine.running and engine.step is step
+        engine.stop()
+        assert not engine.running and engine.step is None
+
+    def test_window_under_pointer_respects_stacking():
+        stats = ScrollStats()
+        big = Rect(0, 0, 1000, 1000)
+        small = Rect(100, 100, 200, 200)
+        windows = [big]
+        finder = WindowUnderPointer(stats, lambda: list(windows))
+
+        assert finder.find(500, 500) is big
+
+        # A smaller window on top, inside the big one, that was opened since
+        windows.insert(0, small)
+        finder.invalidate()
+        assert finder.find(500, 500) is big
+        assert finder.find(150, 150) is small
+        assert finder.find(5000, 5000) is None
+        assert stats.window_lookups == 2
+        assert stats.window_cache_hits == 2
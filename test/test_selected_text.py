@@ -0,0 +1,90 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from core.edit.selection_cache import SelectionCache
+
+    class Clock:
+        def __init__(self):
+            self.now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    def make_cache(*strategies):
+        copies = []
+
+        def copy():
+            copies.append(1)
+            return "copied"
+
+        clock = Clock()
+        cache = SelectionCache(list(strategies), copy, ttl=0.5, clock=clock)
+        return cache, copies, clock
+
+    def test_reuses_selection_within_a_generation():
+        cache, copies, _ = make_cache()
+
+        assert cache.get() == "copied"
+        assert cache.get() == "copied"
+
+        assert len(copies) == 1
+
+    def test_invalidate_reads_again():
+        cache, copies, _ = make_cache()
+
+        cache.get()
+        cache.invalidate()
+        cache.get()
+
+        assert len(copies) == 2
+
+    def test_expires_after_ttl():
+        cache, copies, clock = make_cache()
+
+        cache.get()
+        clock.now = 0.4
+        cache.get()
+        clock.now = 0.6
+        cache.get()
+
+        assert len(copies) == 2
+
+    def test_first_strategy_that_can_tell_wins():
+        calls = []
+
+        def cannot_tell():
+            calls.append("editor")
+            return None
+
+        def accessibility():
+            calls.append("accessibility")
+            return "selected"
+
+        cache, copies, _ = make_cache(cannot_tell, accessibility)
+
+        assert cache.get() == "selected"
+        assert calls == ["editor", "accessibility"]
+        assert copies == []
+
+    def test_empty_selection_from_strategy_is_trusted():
+        cache, copies, _ = make_cache(lambda: "")
+
+        assert cache.get() == ""
+        assert copies == []
+
+    def test_copy_invalidating_the_cache_is_still_reused():
+        cache, copies, _ = make_cache()
+
+        def copy_with_key_press():
+            copies.append(1)
+            # Like edit.copy() sending its key press through main.key
+            cache.invalidate()
+            return "copied"
+
+        cache.fallback = copy_with_key_press
+        assert cache.get() == "copied"
+        assert cache.get() == "copied"
+
+        assert len(copies) == 1
@@ -0,0 +1,63 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import time
+
+    from core import settle
+
+    def test_wait_until_returns_as_soon_as_condition_holds():
+        deadline = time.perf_counter() + 0.03
+        start = time.perf_counter()
+
+        assert settle.wait_until(lambda: time.perf_counter() >= deadline, 1.0, 0.005)
+        assert time.perf_counter() - start < 0.5
+
+    def test_wait_until_times_out():
+        start = time.perf_counter()
+
+        assert not settle.wait_until(lambda: False, 0.05, 0.01)
+        assert time.perf_counter() - start >= 0.05
+
+    def test_settle_after_detects_change():
+        state = {"focus": "page"}
+
+        def focus_address():
+            state["focus"] = "address"
+
+        assert settle.settle_after(focus_address, lambda: state["focus"], 1.0)
+
+    def test_settle_after_unknown_probe_waits_full_timeout():
+        start = time.perf_counter()
+
+        assert not settle.settle_after(lambda: None, lambda: settle.UNKNOWN, 0.05)
+        assert time.perf_counter() - start >= 0.05
+
+    def test_settle_after_unknown_probe_sleeps_fallback():
+        start = time.perf_counter()
+
+        assert not settle.settle_after(
+            lambda: None, lambda: settle.UNKNOWN, 5.0, fallback=0.02
+        )
+        assert 0.02 <= time.perf_counter() - start < 1.0
+
+    class Element:
+        """Stands in for talon's element wrappers, which are new objects on every call"""
+
+        def __init__(self, **attributes):
+            self.__dict__.update(attributes)
+
+        def __getattr__(self, name):
+            raise AttributeError(name)
+
+    def test_element_key_compares_properties_not_wrappers():
+        address = settle.element_key(Element(AXRole="AXTextField", AXTitle="Address"))
+        again = settle.element_key(Element(AXRole="AXTextField", AXTitle="Address"))
+        page = settle.element_key(Element(AXRole="AXWebArea", AXTitle="Address"))
+
+        assert address == again
+        assert address != page
+
+    def test_element_key_unknown_without_properties():
+        assert settle.element_key(Element()) is settle.UNKNOWN
@@ -0,0 +1,73 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    from core.snippets.snippet_index import SnippetIndex
+    from core.snippets.snippet_types import Snippet, SnippetVariable
+    from core.snippets.snippets import (
+        SNIPPETS_DIR,
+        context_map,
+        get_super_languages,
+        group_by_language,
+    )
+    from core.snippets.snippets_parser import create_snippets_from_file
+
+    def make_index(snippets: list[Snippet], languages: list[str]) -> SnippetIndex:
+        return SnippetIndex(
+            group_by_language(snippets),
+            {lang: get_super_languages(lang) for lang in ["_", *languages]},
+        )
+
+    def test_resolves_through_parent_layers():
+        base = Snippet("ifStatement", "if", ["if state"], languages=["javascript"])
+        specific = Snippet("ifStatement", "if!", ["if state"], languages=["typescript"])
+        global_snippet = Snippet("todo", "TODO", ["to do"])
+        index = make_index(
+            [base, specific, global_snippet], ["javascript", "typescript", "python"]
+        )
+
+        assert index.get("typescript", "ifStatement") is specific
+        assert index.get("javascript", "ifStatement") is base
+        assert index.get("typescript", "todo") is global_snippet
+        assert index.get("python", "ifStatement") is None
+        assert index.get("unknown", "todo") is None
+
+    def test_layers_are_shared():
+        wrapper = SnippetVariable("0", wrapper_phrases=["try"])
+        snippets = [
+            Snippet("todo", "TODO", ["to do"]),
+            Snippet(
+                "tryCatch",
+                "try",
+                ["try"],
+                languages=["javascript"],
+                variables=[wrapper],
+            ),
+        ]
+        index = make_index(snippets, ["javascript", "typescript", "python", "go"])
+
+        assert index.layers["typescript"].parents[0] is index.layers["_"]
+        assert index.layers["typescript"].parents[1] is index.layers["javascript"]
+        # Languages without snippets of their own share the global lists
+        assert index.lists("python") is index.lists("go") is index.lists("_")
+        assert index.lists("typescript").insertions == {
+            "to do": "_.todo",
+            "try": "javascript.tryCatch",
+        }
+        assert index.lists("typescript").wrappers == {"try": "javascript.tryCatch.0"}
+
+    def test_every_snippet_resolves():
+        snippets = [
+            snippet
+            for file in SNIPPETS_DIR.glob("**/*.snippet")
+            for snippet in create_snippets_from_file(str(file))
+        ]
+        index = make_index(snippets, list(context_map))
+
+        for lang in context_map:
+            lists = index.lists(lang)
+            for snippet_id in [*lists.insertions.values(), *lists.wrappers.values()]:
+                snippet_lang, snippet_name = snippet_id.split(".")[:2]
+                assert index.get(lang, snippet_name) is not None
+                assert index.get(snippet_lang, snippet_name) is not None
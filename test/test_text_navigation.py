@@ -0,0 +1,89 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import re
+
+    from plugin.text_navigation import text_navigation
+    from plugin.text_navigation.text_window import TextWindow
+
+    def test_match_backwards():
+        regex = text_navigation.compile_pattern(r"foo")
+        text = "foo bar foo baz foo"
+
+        assert text_navigation.match_backwards(regex, 1, text).start() == 16
+        assert text_navigation.match_backwards(regex, 3, text).start() == 0
+        assert text_navigation.match_backwards(regex, 4, text) is None
+
+    def test_match_backwards_keeps_left_to_right_matches():
+        # Scanning from the end would find "aa" at 3, but finditer finds 0 and 2
+        regex = text_navigation.compile_pattern(r"aa")
+
+        assert text_navigation.match_backwards(regex, 1, "aaaaa").span() == (2, 4)
+
+    def test_compile_pattern_is_shared():
+        first = text_navigation.compile_pattern(re.escape("a.b"), re.IGNORECASE)
+        second = text_navigation.compile_pattern(re.escape("a.b"), re.IGNORECASE)
+
+        assert first is second
+        assert first.flags & re.IGNORECASE
+
+    def test_text_window_fetches_only_as_far_as_needed():
+        lines_above = ["foo"] + [f"line {i}" for i in range(100)] + ["foo x", "foo y"]
+        fetched = []
+
+        def fetch(lines):
+            fetched.append(lines)
+            return "\n".join(lines_above[-(lines + 1) :])
+
+        regex = text_navigation.compile_pattern(r"foo")
+        window = TextWindow(fetch, 200)
+        match = window.search(
+            lambda text: text_navigation.match_backwards(regex, 2, text)
+        )
+
+        assert window.text[match.start() :].startswith("foo x")
+        assert fetched == [20]
+
+        # The third "foo" is far away, so the window keeps growing until it
+        # reaches the start of the document
+        fetched.clear()
+        window = TextWindow(fetch, 200)
+        match = window.search(
+            lambda text: text_navigation.match_backwards(regex, 3, text)
+        )
+
+        assert match.start() == 0
+        assert fetched == [20, 80, 200]
+
+    def test_text_window_stops_at_max_lines():
+        fetched = []
+
+        def fetch(lines):
+            fetched.append(lines)
+            return "x\n" * (lines + 1)
+
+        window = TextWindow(fetch, 100)
+
+        assert window.search(lambda text: None) is None
+        assert fetched == [20, 80, 100]
+
+    def test_text_window_fetches_small_windows_at_once():
+        fetched = []
+
+        def fetch(lines):
+            fetched.append(lines)
+            return "x\n" * (lines + 1)
+
+        # The default text_navigation_max_line_search, searching for something
+        # that isn't there
+        window = TextWindow(fetch, 10)
+        assert window.search(lambda text: None) is None
+        assert window.fetches == 1
+        assert fetched == [10]
+
+        # Text to the left or right of the cursor on its line
+        window = TextWindow(fetch, 0)
+        assert window.search(lambda text: None) is None
+        assert fetched == [10, 0]
@@ -0,0 +1,54 @@
+import talon
+
+if hasattr(talon, "test_mode"):
+    # Only include this when we're running tests
+
+    import pytest
+
+    from core.windows_and_tabs.window_positions import (
+        RelativeScreenPos,
+        format_position,
+        parse_layouts,
+        parse_position,
+    )
+
+    NAMED = {"left": RelativeScreenPos(0, 0, 0.5, 1)}
+
+    def bounds(position):
+        return (position.left, position.top, position.right, position.bottom)
+
+    def test_parse_position():
+        assert parse_position("left", NAMED) is NAMED["left"]
+        assert bounds(parse_position("0.25 0 1 0.5", NAMED)) == (0.25, 0, 1, 0.5)
+        for invalid in ("middle", "0 0 1", "a b c d"):
+            with pytest.raises(ValueError):
+                parse_position(invalid, NAMED)
+
+    def test_format_position_round_trips():
+        position = RelativeScreenPos(1 / 3, 0, 2 / 3, 1)
+
+        parsed = parse_position(format_position(position), NAMED)
+
+        assert bounds(parsed) == pytest.approx(bounds(position), abs=1e-4)
+
+    def test_parse_layouts_skips_invalid_rows():
+        rows = [
+            ["coding", "Code", "left", "1"],
+            ["coding", "Terminal", "0.5 0 1 1", ""],
+            ["coding", "Firefox"],
+            ["reading", "Preview", "left", "second"],
+            ["reading", "Notes", "middle"],
+        ]
+
+        layouts, errors = parse_layouts(rows, NAMED)
+
+        assert list(layouts) == ["coding"]
+        code, terminal = layouts["coding"]
+        assert (code.app_name, code.position, code.screen_number) == (
+            "Code",
+            NAMED["left"],
+            1,
+        )
+        assert terminal.screen_number is None
+        assert bounds(terminal.position) == (0.5, 0, 1, 1)
+        assert len(errors) == 3